@@ -0,0 +1,57 @@
+# https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/Expressions.UpdateExpressions.html
+import enum
+
+
+__all__ = ["Action", "ActionType", "add", "append", "delete"]
+
+
+class ActionType(enum.Enum):
+    """How an :class:`~bloop.actions.Action` is rendered, and the backing types it supports."""
+    #: ``ADD`` a number to a number, or elements to a set
+    Add = ("add", {"N", "NS", "SS", "BS"})
+    #: ``DELETE`` elements from a set
+    Delete = ("delete", {"NS", "SS", "BS"})
+    #: ``SET`` a list to ``list_append`` of its current value and more elements
+    Append = ("append", {"L"})
+
+    def __init__(self, wire_key, backing_types):
+        self.wire_key = wire_key
+        self.backing_types = backing_types
+
+    def supports(self, typedef):
+        """True if this action can be applied to a column with the given type."""
+        return typedef.backing_type in self.backing_types
+
+
+class Action:
+    """An update to apply to a column's stored value the next time the object is saved.
+
+    Reading the column returns the action until the object is saved.  After a successful save, the column's value
+    isn't known locally and the column is cleared, until the object is loaded again.
+
+    :param type: The :class:`~bloop.actions.ActionType` to render.
+    :param value: Dumped through the column's type: a number, or the set or list of elements.
+    """
+    __slots__ = ("type", "value")
+
+    def __init__(self, type, value):
+        self.type = type
+        self.value = value
+
+    def __repr__(self):
+        return "<Action[{}={!r}]>".format(self.type.wire_key, self.value)
+
+
+def add(value):
+    """Add a number to a Number column, or elements to a Set column."""
+    return Action(ActionType.Add, value)
+
+
+def delete(value):
+    """Remove elements from a Set column."""
+    return Action(ActionType.Delete, value)
+
+
+def append(value):
+    """Append elements to a List column.  A missing list is treated as empty."""
+    return Action(ActionType.Append, value)
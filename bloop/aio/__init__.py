@@ -0,0 +1,7 @@
+from .engine import AsyncEngine
+from .search import AsyncQueryIterator, AsyncScanIterator
+from .session import AsyncSessionWrapper
+from .stream import AsyncStream
+
+
+__all__ = ["AsyncEngine", "AsyncQueryIterator", "AsyncScanIterator", "AsyncSessionWrapper", "AsyncStream"]
@@ -0,0 +1,240 @@
+import logging
+from typing import Union
+
+from ..engine import (
+    Engine,
+    TableNameFormatter,
+    load_request,
+    unpack_load_response,
+    validate_not_abstract,
+)
+from ..exceptions import InvalidSearch, InvalidStream
+from ..models import Index
+from ..search import plan_search
+from ..signals import object_deleted
+from .search import AsyncPreparedSearch
+from .session import AsyncSessionWrapper
+from .stream import AsyncStream
+
+
+__all__ = ["AsyncEngine"]
+logger = logging.getLogger("bloop.engine")
+
+
+class AsyncEngine(Engine):
+    """Primary means of interacting with DynamoDB from asyncio.
+
+    Provides the same methods as :class:`~bloop.engine.Engine`, except :func:`bind`, :func:`delete`, :func:`load`,
+    :func:`save`, and :func:`stream` are coroutines and :func:`query` and :func:`scan` return iterators for
+    ``async for``.
+
+    .. code-block:: python
+
+        engine = AsyncEngine(dynamodb=aws.create_client("dynamodb"))
+        await engine.bind(User)
+        async for user in engine.query(User.by_email, key=User.email == "user@domain.com"):
+            ...
+
+    :param dynamodb: Async DynamoDB client, such as an `aiobotocore`__ client.
+    :param dynamodbstreams: *(Optional)* Async DynamoDBStreams client.  Required to use streams.
+    :param table_name_template: Customize the table name of each model bound to the engine.  Same as
+        :class:`~bloop.engine.Engine`.  Defaults to "{table_name}".
+    :param session: *(Optional)* A :class:`~bloop.aio.session.AsyncSessionWrapper` to use instead of building one
+        from ``dynamodb`` and ``dynamodbstreams``.  Can't be used with ``dynamodb`` or ``dynamodbstreams``.
+
+    __ https://github.com/aio-libs/aiobotocore
+    """
+    def __init__(
+            self, *,
+            dynamodb=None, dynamodbstreams=None,
+            table_name_template: Union[str, TableNameFormatter] = "{table_name}",
+            session: AsyncSessionWrapper = None):
+        if session is None:
+            if dynamodb is None:
+                raise ValueError("AsyncEngine needs a dynamodb client or a session")
+            session = AsyncSessionWrapper(dynamodb, dynamodbstreams)
+        elif dynamodb is not None or dynamodbstreams is not None:
+            raise ValueError("session can't be used with dynamodb or dynamodbstreams")
+        super().__init__(table_name_template=table_name_template, session=session)
+
+    async def bind(self, model, *, skip_table_setup=False):
+        """Create backing tables for a model and its non-abstract subclasses.
+
+        :param model: Base model to bind.  Can be abstract.
+        :param skip_table_setup: Don't create or verify the table in DynamoDB.  Default is False.
+        :raises bloop.exceptions.InvalidModel: if ``model`` is not a subclass of :class:`~bloop.models.BaseModel`.
+        """
+        concrete = self._models_to_bind(model, skip_table_setup)
+        is_creating = {}
+
+        for model in concrete:
+            table_name = self._before_create_table(model)
+            if not skip_table_setup:
+                is_creating[model] = await self.session.create_table(table_name, model)
+
+        for model in concrete:
+            if not skip_table_setup:
+                await self._setup_table(model, is_creating[model])
+            self._bound(model)
+
+        logger.info("successfully bound {} models to the engine".format(len(concrete)))
+
+    async def delete(self, *objs, condition=None, atomic=False, batch=False):
+        """Delete one or more objects.
+
+        :param objs: objects to delete.
+        :param condition: only perform each delete if this condition holds.
+        :param bool atomic: only perform each delete if the local and DynamoDB versions of the object match.
+        :param bool batch: send the deletes in chunks of 25 with BatchWriteItem.  Default is False.
+        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic, or the version) is not met.
+        :raises bloop.exceptions.InvalidCondition: if batch is True and a condition or atomic is provided,
+            or an object's model has a version column.
+        """
+        objs = set(objs)
+        validate_not_abstract(*objs)
+        if batch:
+            await self.session.write_items(self._batch_delete_request(objs, condition, atomic))
+            for obj in objs:
+                object_deleted.send(self, engine=self, obj=obj)
+        else:
+            for obj in objs:
+                await self.session.delete_item(self._delete_request(obj, condition, atomic))
+                object_deleted.send(self, engine=self, obj=obj)
+        logger.info("successfully deleted {} objects".format(len(objs)))
+
+    async def load(self, *objs, consistent=False, as_dict=False, lazy=False):
+        """Populate objects from DynamoDB.
+
+        :param objs: objects to load.
+        :param bool consistent: Use strongly consistent reads if True.  Default is False.
+        :param bool as_dict: Return a dict of loaded values for each object instead of modifying the objects.
+            Default is False.
+        :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+            Default is False.
+        :return: None, or a dict of loaded values for each object when ``as_dict`` is True.
+        :raises bloop.exceptions.MissingKey: if any object doesn't provide a value for a key column.
+        :raises bloop.exceptions.MissingObjects: if one or more objects aren't loaded.
+        """
+        objs = set(objs)
+        validate_not_abstract(*objs)
+        request, table_index, object_index = load_request(self, objs, consistent)
+        response = await self.session.load_items(request)
+        return unpack_load_response(self, objs, response, table_index, object_index, as_dict=as_dict, lazy=lazy)
+
+    async def _setup_table(self, model, is_creating):
+        table_name = self._compute_table_name(model)
+        if is_creating:
+            await self.session.describe_table(table_name)
+            if model.Meta.ttl:
+                await self.session.enable_ttl(table_name, model)
+            if model.Meta.backups and model.Meta.backups["enabled"]:
+                await self.session.enable_backups(table_name, model)
+        await self.session.validate_table(table_name, model)
+
+    def find(self, model, condition=None, projection="all", consistent=False, as_dict=False, lazy=False):
+        """Create a reusable query or scan iterator for the best search for a condition.
+
+        Takes the same arguments as :func:`Engine.find <bloop.engine.Engine.find>`, except ``prefetch``.  Plans that
+        load full items from the table aren't supported.
+
+        :return: A reusable search iterator for ``async for``, whose ``plan`` is the chosen
+            :class:`~bloop.search.Plan`.
+        :raises bloop.exceptions.InvalidSearch: if the chosen index doesn't include every column that's needed.
+        """
+        validate_not_abstract(model)
+        plan = plan_search(self, model, condition, projection=projection, consistent=consistent)
+        if plan.fetch:
+            raise InvalidSearch("AsyncEngine can't load full items for a search on {!r}.".format(plan.index))
+        kwargs = {"key": plan.key} if plan.mode == "query" else {}
+        iterator = self._search(
+            plan.mode, plan.index or model, filter=plan.filter, projection=list(plan.projected),
+            consistent=consistent, as_dict=as_dict, lazy=lazy, **kwargs)
+        iterator.plan = plan
+        return iterator
+
+    def query(
+            self, model_or_index, key, filter=None, projection="all", consistent=False, forward=True,
+            as_dict=False, lazy=False):
+        """Create a reusable :class:`~bloop.aio.search.AsyncQueryIterator`.
+
+        Takes the same arguments as :func:`Engine.query <bloop.engine.Engine.query>`, except ``prefetch`` and
+        ``fetch``.  A filter that's too long for one request can't be split.
+
+        :return: A reusable query iterator for ``async for``.
+        :rtype: :class:`~bloop.aio.search.AsyncQueryIterator`
+        :raises bloop.exceptions.InvalidSearch: if the filter is too long for one request.
+        """
+        return self._search(
+            "query", model_or_index, key=key, filter=filter,
+            projection=projection, consistent=consistent, forward=forward, as_dict=as_dict, lazy=lazy)
+
+    async def save(self, *objs, condition=None, atomic=False, batch=False):
+        """Save one or more objects.
+
+        :param objs: objects to save.
+        :param condition: only perform each save if this condition holds.
+        :param bool atomic: only perform each save if the local and DynamoDB versions of the object match.
+        :param bool batch: send the saves in chunks of 25 with BatchWriteItem.  Each object **replaces** the
+            existing item.  Default is False.
+        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic, or the version) is not met.
+        :raises bloop.exceptions.InvalidCondition: if batch is True and a condition or atomic is provided,
+            an object's model has a version column, or an object has a column set to an update action.
+        """
+        objs = set(objs)
+        validate_not_abstract(*objs)
+        if batch:
+            await self.session.write_items(self._batch_save_request(objs, condition, atomic))
+            for obj in objs:
+                self._saved(obj)
+        else:
+            for obj in objs:
+                request = self._save_request(obj, condition, atomic)
+                if request is None:
+                    continue
+                await self.session.save_item(request)
+                self._saved(obj)
+        logger.info("successfully saved {} objects".format(len(objs)))
+
+    def scan(
+            self, model_or_index, filter=None, projection="all", consistent=False, parallel=None,
+            as_dict=False, lazy=False):
+        """Create a reusable :class:`~bloop.aio.search.AsyncScanIterator`.
+
+        Takes the same arguments as :func:`Engine.scan <bloop.engine.Engine.scan>`, except ``prefetch``.
+        ``parallel`` can only be a ``(Segment, TotalSegments)`` tuple, and a filter that's too long for one request
+        can't be split.
+
+        :return: A reusable scan iterator for ``async for``.
+        :rtype: :class:`~bloop.aio.search.AsyncScanIterator`
+        :raises bloop.exceptions.InvalidSearch: if ``parallel`` is a number of segments or "auto", or the filter is
+            too long for one request.
+        """
+        return self._search(
+            "scan", model_or_index, filter=filter,
+            projection=projection, consistent=consistent, parallel=parallel, as_dict=as_dict, lazy=lazy)
+
+    def _search(self, mode, model_or_index, **kwargs):
+        if isinstance(model_or_index, Index):
+            model, index = model_or_index.model, model_or_index
+        else:
+            model, index = model_or_index, None
+        validate_not_abstract(model)
+        prepared = AsyncPreparedSearch()
+        prepared.prepare(engine=self, mode=mode, model=model, index=index, **kwargs)
+        return prepared.__aiter__()
+
+    async def stream(self, model, position):
+        """Create an :class:`~bloop.aio.stream.AsyncStream` that provides approximate chronological ordering.
+
+        :param model: The model to stream records from.
+        :param position: "trim_horizon", "latest", a stream token, or a :class:`datetime.datetime`.
+        :return: An iterator for records in all shards.
+        :rtype: :class:`~bloop.aio.stream.AsyncStream`
+        :raises bloop.exceptions.InvalidStream: if the model does not have a stream.
+        """
+        validate_not_abstract(model)
+        if not model.Meta.stream or not model.Meta.stream.get("arn"):
+            raise InvalidStream("{!r} does not have a stream arn".format(model))
+        stream = AsyncStream(model=model, engine=self)
+        await stream.move_to(position=position)
+        return stream
@@ -0,0 +1,191 @@
+from ..exceptions import ConstraintViolation, InvalidSearch
+from ..models import unpack_dict_from_dynamodb, unpack_from_dynamodb
+from ..search import PreparedSearch, SearchIterator
+from ..signals import object_loaded
+
+
+__all__ = ["AsyncQueryIterator", "AsyncScanIterator"]
+
+
+class AsyncPreparedSearch(PreparedSearch):
+    """Mutable search object that creates async search iterators."""
+    __iter__ = None
+
+    def prepare_iterator_cls(self, engine, mode):
+        super().prepare_iterator_cls(engine, mode)
+        self._iterator_cls = AsyncScanIterator if mode == "scan" else AsyncQueryIterator
+
+    def prepare_constraints(self, forward, parallel, prefetch=0):
+        super().prepare_constraints(forward, parallel, prefetch)
+        if self.segments is not None:
+            raise InvalidSearch("AsyncEngine.scan needs a (Segment, TotalSegments) tuple for parallel scans.")
+
+    def prepare_request(self):
+        super().prepare_request()
+        if self._requests is not None:
+            raise InvalidSearch("AsyncEngine can't split a filter that's too long for one request.")
+
+    def __aiter__(self):
+        return self._iterator_cls(
+            engine=self.engine,
+            model=self.model,
+            index=self.index,
+            request=self._request,
+            projected=self._projected_columns,
+            as_dict=self.as_dict,
+            lazy=self.lazy
+        )
+
+
+class AsyncSearchIterator(SearchIterator):
+    """Reusable search iterator for ``async for``.
+
+    Unlike :class:`~bloop.search.SearchIterator`, :attr:`count` and :attr:`scanned` don't load more results.
+    When projection is "count", call :func:`all` first.
+
+    :param session: :class:`~bloop.aio.session.AsyncSessionWrapper` to make Query, Scan calls.
+    :param model: :class:`~bloop.models.BaseModel` for repr only.
+    :param index: :class:`~bloop.models.Index` to search, or None.
+    :param dict request: The base request dict for each search.
+    :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    """
+    __iter__ = None
+    __next__ = None
+
+    @property
+    def count(self):
+        """Number of items that have been loaded from DynamoDB so far, including buffered items."""
+        return self._count
+
+    @property
+    def scanned(self):
+        """Number of items that DynamoDB evaluated so far, before any filter was applied."""
+        return self._scanned
+
+    async def all(self):
+        """Eagerly load all results and return a single list.  If there are no results, the list is empty.
+
+        :return: A list of results.
+        """
+        self.reset()
+        return [result async for result in self]
+
+    async def first(self):
+        """Return the first result.  If there are no results, raises :exc:`~bloop.exceptions.ConstraintViolation`.
+
+        :return: The first result.
+        :raises bloop.exceptions.ConstraintViolation: No results.
+        """
+        self.reset()
+        value = await self._next_or_none()
+        if value is None:
+            raise ConstraintViolation("{} did not find any results.".format(self.mode.capitalize()))
+        return value
+
+    async def one(self):
+        """Return the unique result.  If there is not exactly one result,
+        raises :exc:`~bloop.exceptions.ConstraintViolation`.
+
+        :return: The unique result.
+        :raises bloop.exceptions.ConstraintViolation: Not exactly one result.
+        """
+        first = await self.first()
+        second = await self._next_or_none()
+        if second is not None:
+            raise ConstraintViolation("{} found more than one result.".format(self.mode.capitalize()))
+        return first
+
+    async def iter_pages(self):
+        """Iterate the remaining results one DynamoDB page at a time with ``async for``.
+
+        Same as :func:`SearchIterator.iter_pages <bloop.search.SearchIterator.iter_pages>`.
+
+        :return: An async generator of :class:`~bloop.search.Page`.
+        """
+        if self.buffer:
+            yield self._pop_page(self.request.get("ExclusiveStartKey"), None)
+        while not self._exhausted:
+            response = await self.session.search_items(self.mode, self.request)
+            self._apply_response(response)
+            yield self._pop_page(response.get("LastEvaluatedKey"), response.get("ConsumedCapacity"))
+
+    async def _next_or_none(self):
+        try:
+            return await self.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while (not self._exhausted) and len(self.buffer) == 0:
+            self._apply_response(await self.session.search_items(self.mode, self.request))
+
+        if self.buffer:
+            return self.buffer.popleft()
+        raise StopAsyncIteration
+
+
+class AsyncSearchModelIterator(AsyncSearchIterator):
+    """Reusable search iterator for ``async for`` that unpacks result dicts into model instances.
+
+    :param engine: :class:`~bloop.aio.engine.AsyncEngine` to unpack models with.
+    :param model: :class:`~bloop.models.BaseModel` being searched.
+    :param index: :class:`~bloop.models.Index` to search, or None.
+    :param dict request: The base request dict for each search call.
+    :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+    """
+    def __init__(self, *, engine, model, index, request, projected, as_dict=False, lazy=False):
+        self.engine = engine
+        self.as_dict = as_dict
+        self.lazy = lazy
+        super().__init__(
+            session=engine.session, model=model, index=index,
+            request=request, projected=projected)
+
+    async def iter_pages(self, raw=False):
+        """Iterate the remaining results one DynamoDB page at a time with ``async for``.
+
+        Same as :func:`SearchModelIterator.iter_pages <bloop.search.SearchModelIterator.iter_pages>`.
+
+        :param bool raw: Return the attribute dicts of each page instead of model instances.  Default is False.
+        :return: An async generator of :class:`~bloop.search.Page`.
+        """
+        async for page in super().iter_pages():
+            if not raw:
+                page = page._replace(items=[self._unpack(attrs) for attrs in page.items])
+            yield page
+
+    def _unpack(self, attrs):
+        if self.as_dict:
+            return unpack_dict_from_dynamodb(attrs=attrs, expected=self.projected, engine=self.engine)
+        obj = unpack_from_dynamodb(
+            attrs=attrs,
+            expected=self.projected,
+            model=self.model,
+            engine=self.engine,
+            lazy=self.lazy)
+        object_loaded.send(self.engine, engine=self.engine, obj=obj)
+        return obj
+
+    async def __anext__(self):
+        return self._unpack(await super().__anext__())
+
+
+class AsyncScanIterator(AsyncSearchModelIterator):
+    """Reusable scan iterator for ``async for`` that unpacks result dicts into model instances.
+
+    Returned from :func:`AsyncEngine.scan <bloop.aio.engine.AsyncEngine.scan>`.
+    """
+    mode = "scan"
+
+
+class AsyncQueryIterator(AsyncSearchModelIterator):
+    """Reusable query iterator for ``async for`` that unpacks result dicts into model instances.
+
+    Returned from :func:`AsyncEngine.query <bloop.aio.engine.AsyncEngine.query>`.
+    """
+    mode = "query"
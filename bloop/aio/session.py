@@ -0,0 +1,343 @@
+import asyncio
+import logging
+import time
+
+import botocore.exceptions
+
+from ..exceptions import BloopException
+from ..session import (
+    RetryPolicy,
+    create_batch_get_chunks,
+    create_batch_write_chunks,
+    create_table_request,
+    describe_stream_request,
+    enable_backups_request,
+    enable_ttl_request,
+    handle_constraint_violation,
+    handle_describe_stream_error,
+    handle_get_records_error,
+    handle_shard_iterator_error,
+    handle_table_exists,
+    limit_request,
+    merge_loaded_items,
+    merge_stream_description,
+    merge_table_description,
+    missing,
+    ready,
+    shard_iterator_request,
+    simple_table_status,
+    standardize_query_response,
+    validate_search_mode,
+    validate_table_description,
+)
+
+
+logger = logging.getLogger("bloop.session")
+
+__all__ = ["AsyncSessionWrapper"]
+
+
+class AsyncSessionWrapper:
+    """Provides the same interface as :class:`~bloop.session.SessionWrapper` with coroutines.
+
+    The clients can be any objects whose methods match the boto3 clients' names and arguments, return awaitables,
+    and raise :exc:`botocore.exceptions.ClientError`, such as the clients from `aiobotocore`__.
+
+    .. code-block:: python
+
+        aws = aiobotocore.get_session()
+        session = AsyncSessionWrapper(
+            aws.create_client("dynamodb"),
+            aws.create_client("dynamodbstreams"))
+
+    :param dynamodb: Async DynamoDB client.
+    :param dynamodbstreams: *(Optional)* Async DynamoDBStreams client.  Required to use streams.
+    :param int max_concurrency: Most ``BatchGetItem`` chunks that :func:`load_items` sends at the same time.
+        Default is 1, which sends each chunk one after another.
+    :param retry_policy: *(Optional)* Applied to every DynamoDB and DynamoDBStreams call.
+        Default is a new :class:`~bloop.session.RetryPolicy` with its default arguments.
+    :param rate_limiter: *(Optional)* A :class:`~bloop.session.RateLimiter` that keeps reads and writes under a share
+        of each table's provisioned units.  Default is None (no limit).
+
+    __ https://github.com/aio-libs/aiobotocore
+    """
+    def __init__(self, dynamodb, dynamodbstreams=None, *, max_concurrency=1, retry_policy=None, rate_limiter=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.dynamodb_client = dynamodb
+        self.stream_client = dynamodbstreams
+        self.max_concurrency = max_concurrency
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+
+    async def _call(self, client, operation, **request):
+        buckets = limit_request(self.rate_limiter, operation, request)
+        for bucket in buckets or ():
+            delay = bucket.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        method = getattr(client, operation)
+        started, attempt = time.monotonic(), 0
+        while True:
+            try:
+                response = await method(**request)
+                break
+            except botocore.exceptions.ClientError as error:
+                if not self.retry_policy.can_retry(operation, error):
+                    raise
+                if not await self._wait(operation, attempt, started):
+                    raise
+            attempt += 1
+
+        if buckets is not None:
+            self.rate_limiter.consume(operation, response)
+        return response
+
+    async def _wait(self, operation, attempt, started):
+        delay = self.retry_policy.next_delay(operation, attempt, started)
+        if delay is None:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    async def save_item(self, item):
+        """Save an object to DynamoDB.
+
+        :param item: Unpacked into kwargs for :func:`boto3.DynamoDB.Client.update_item`.
+        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic) is not met.
+        """
+        try:
+            await self._call(self.dynamodb_client, "update_item", **item)
+        except botocore.exceptions.ClientError as error:
+            handle_constraint_violation(error)
+
+    async def delete_item(self, item):
+        """Delete an object in DynamoDB.
+
+        :param item: Unpacked into kwargs for :func:`boto3.DynamoDB.Client.delete_item`.
+        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic) is not met.
+        """
+        try:
+            await self._call(self.dynamodb_client, "delete_item", **item)
+        except botocore.exceptions.ClientError as error:
+            handle_constraint_violation(error)
+
+    async def write_items(self, items):
+        """Puts and deletes any number of items in chunks, re-sending unprocessed items with backoff.
+
+        :param items: Unpacked in chunks into "RequestItems" for :func:`boto3.DynamoDB.Client.batch_write_item`.
+        :raises bloop.exceptions.BloopException: if items are still unprocessed when the retry policy runs out.
+        """
+        for request in create_batch_write_chunks(items):
+            await self._write_chunk(request)
+
+    async def _write_chunk(self, request):
+        started, attempt = time.monotonic(), 0
+        while request:
+            try:
+                response = await self._call(self.dynamodb_client, "batch_write_item", RequestItems=request)
+            except botocore.exceptions.ClientError as error:
+                raise BloopException("Unexpected error while writing items.") from error
+
+            request = response.get("UnprocessedItems")
+            if request:
+                if not await self._wait("batch_write_item", attempt, started):
+                    raise BloopException("Ran out of retries while writing unprocessed items.")
+                attempt += 1
+
+    async def load_items(self, items):
+        """Loads any number of items in chunks, handling continuation tokens.
+
+        Up to ``max_concurrency`` chunks are sent at the same time.
+
+        :param items: Unpacked in chunks into "RequestItems" for :func:`boto3.DynamoDB.Client.batch_get_item`.
+        :raises bloop.exceptions.BloopException: if keys are still unprocessed when the retry policy runs out.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def load_chunk(chunk):
+            async with semaphore:
+                return await self._load_chunk(chunk)
+
+        responses = await asyncio.gather(*(load_chunk(chunk) for chunk in create_batch_get_chunks(items)))
+        return merge_loaded_items({}, responses)
+
+    async def _load_chunk(self, request):
+        loaded_items = {}
+        started, attempt = time.monotonic(), 0
+        while request:
+            try:
+                response = await self._call(self.dynamodb_client, "batch_get_item", RequestItems=request)
+            except botocore.exceptions.ClientError as error:
+                raise BloopException("Unexpected error while loading items.") from error
+
+            merge_loaded_items(loaded_items, [response.get("Responses", {})])
+            request = response["UnprocessedKeys"]
+            if request:
+                if not await self._wait("batch_get_item", attempt, started):
+                    raise BloopException("Ran out of retries while loading unprocessed keys.")
+                attempt += 1
+        return loaded_items
+
+    async def query_items(self, request):
+        """Wraps :func:`boto3.DynamoDB.Client.query`.
+
+        Response always includes "Count" and "ScannedCount"
+
+        :param request: Unpacked into :func:`boto3.DynamoDB.Client.query`
+        """
+        return await self.search_items("query", request)
+
+    async def scan_items(self, request):
+        """Wraps :func:`boto3.DynamoDB.Client.scan`.
+
+        Response always includes "Count" and "ScannedCount"
+
+        :param request: Unpacked into :func:`boto3.DynamoDB.Client.scan`
+        """
+        return await self.search_items("scan", request)
+
+    async def search_items(self, mode, request):
+        """Invoke query/scan by name.
+
+        Response always includes "Count" and "ScannedCount"
+
+        :param str mode: "query" or "scan"
+        :param request: Unpacked into :func:`boto3.DynamoDB.Client.query` or :func:`boto3.DynamoDB.Client.scan`
+        """
+        validate_search_mode(mode)
+        try:
+            response = await self._call(self.dynamodb_client, mode, **request)
+        except botocore.exceptions.ClientError as error:
+            raise BloopException("Unexpected error during {}.".format(mode)) from error
+        standardize_query_response(response)
+        return response
+
+    async def create_table(self, table_name, model):
+        """Create the model's table.  Returns True if the table is being created, False otherwise.
+
+        :param str table_name: The name of the table to create for the model.
+        :param model: The :class:`~bloop.models.BaseModel` to create the table for.
+        :return: True if the table is being created, False if the table exists
+        :rtype: bool
+        """
+        table = create_table_request(table_name, model)
+        try:
+            await self._call(self.dynamodb_client, "create_table", **table)
+            is_creating = True
+        except botocore.exceptions.ClientError as error:
+            handle_table_exists(error, model)
+            is_creating = False
+        return is_creating
+
+    async def describe_table(self, table_name):
+        """Polls until the table is ready, then returns the first result when the table was ready.
+
+        :param table_name: The name of the table to describe
+        :return: The (sanitized) result of DescribeTable["Table"]
+        :rtype: dict
+        """
+        status, description = None, {}
+        calls = 0
+        while status is not ready:
+            calls += 1
+            try:
+                description = (await self._call(
+                    self.dynamodb_client, "describe_table", TableName=table_name))["Table"]
+            except botocore.exceptions.ClientError as error:
+                raise BloopException("Unexpected error while describing table.") from error
+            status = simple_table_status(description)
+        logger.debug("describe_table: table \"{}\" was in ACTIVE state after {} calls".format(table_name, calls))
+        try:
+            ttl = await self._call(self.dynamodb_client, "describe_time_to_live", TableName=table_name)
+        except botocore.exceptions.ClientError as error:
+            raise BloopException("Unexpected error while describing ttl.") from error
+        try:
+            backups = await self._call(self.dynamodb_client, "describe_continuous_backups", TableName=table_name)
+        except botocore.exceptions.ClientError as error:
+            raise BloopException("Unexpected error while describing continuous backups.") from error
+        return merge_table_description(description, ttl, backups)
+
+    async def validate_table(self, table_name, model):
+        """Polls until a creating table is ready, then verifies the description against the model's requirements.
+
+        :param str table_name: The name of the table to validate the model against.
+        :param model: The :class:`~bloop.models.BaseModel` to validate the table of.
+        :raises bloop.exceptions.TableMismatch: When the table does not meet the constraints of the model.
+        """
+        actual = await self.describe_table(table_name)
+        validate_table_description(table_name, model, actual, self.rate_limiter)
+
+    async def enable_ttl(self, table_name, model):
+        """Calls UpdateTimeToLive on the table according to model.Meta["ttl"]
+
+        :param table_name: The name of the table to enable the TTL setting on
+        :param model: The model to get TTL settings from
+        """
+        request = enable_ttl_request(table_name, model)
+        try:
+            await self._call(self.dynamodb_client, "update_time_to_live", **request)
+        except botocore.exceptions.ClientError as error:
+            raise BloopException("Unexpected error while setting TTL.") from error
+
+    async def enable_backups(self, table_name, model):
+        """Calls UpdateContinuousBackups on the table according to model.Meta["continuous_backups"]
+
+        :param table_name: The name of the table to enable Continuous Backups on
+        :param model: The model to get Continuous Backups settings from
+        """
+        request = enable_backups_request(table_name)
+        try:
+            await self._call(self.dynamodb_client, "update_continuous_backups", **request)
+        except botocore.exceptions.ClientError as error:
+            raise BloopException("Unexpected error while setting Continuous Backups.") from error
+
+    async def describe_stream(self, stream_arn, first_shard=None):
+        """Wraps :func:`boto3.DynamoDBStreams.Client.describe_stream`, handling continuation tokens.
+
+        :param str stream_arn: Stream arn, usually from the model's ``Meta.stream["arn"]``.
+        :param str first_shard: *(Optional)* If provided, only shards after this shard id will be returned.
+        :return: All shards in the stream, or a subset if ``first_shard`` is provided.
+        :rtype: dict
+        """
+        description = {"Shards": []}
+        request = describe_stream_request(stream_arn, first_shard)
+        while request.get("ExclusiveStartShardId") is not missing:
+            try:
+                response = (await self._call(self.stream_client, "describe_stream", **request))["StreamDescription"]
+            except botocore.exceptions.ClientError as error:
+                handle_describe_stream_error(error, stream_arn)
+            merge_stream_description(description, request, response)
+        return description
+
+    async def get_shard_iterator(self, *, stream_arn, shard_id, iterator_type, sequence_number=None):
+        """Wraps :func:`boto3.DynamoDBStreams.Client.get_shard_iterator`.
+
+        :param str stream_arn: Stream arn.  Usually :data:`Shard.stream_arn <bloop.stream.shard.Shard.stream_arn>`.
+        :param str shard_id: Shard identifier.  Usually :data:`Shard.shard_id <bloop.stream.shard.Shard.shard_id>`.
+        :param str iterator_type: "sequence_at", "sequence_after", "trim_horizon", or "latest"
+        :param sequence_number:
+        :return: Iterator id, valid for 15 minutes.
+        :rtype: str
+        :raises bloop.exceptions.RecordsExpired: Tried to get an iterator beyond the Trim Horizon.
+        """
+        request = shard_iterator_request(stream_arn, shard_id, iterator_type, sequence_number)
+        try:
+            return (await self._call(self.stream_client, "get_shard_iterator", **request))["ShardIterator"]
+        except botocore.exceptions.ClientError as error:
+            handle_shard_iterator_error(error)
+
+    async def get_stream_records(self, iterator_id):
+        """Wraps :func:`boto3.DynamoDBStreams.Client.get_records`.
+
+        :param iterator_id: Iterator id.  Usually :data:`Shard.iterator_id <bloop.stream.shard.Shard.iterator_id>`.
+        :return: Dict with "Records" list (may be empty) and "NextShardIterator" str (may not exist).
+        :rtype: dict
+        :raises bloop.exceptions.RecordsExpired: The iterator moved beyond the Trim Horizon since it was created.
+        :raises bloop.exceptions.ShardIteratorExpired: The iterator was created more than 15 minutes ago.
+        """
+        try:
+            return await self._call(self.stream_client, "get_records", ShardIterator=iterator_id)
+        except botocore.exceptions.ClientError as error:
+            handle_get_records_error(error)
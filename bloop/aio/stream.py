@@ -0,0 +1,297 @@
+import collections
+import collections.abc
+import datetime
+import logging
+
+from ..exceptions import InvalidPosition, InvalidStream, RecordsExpired, ShardIteratorExpired
+from ..stream.coordinator import Coordinator
+from ..stream.shard import CALLS_TO_REACH_HEAD, Shard, unpack_shards
+from ..stream.stream import Stream
+
+
+logger = logging.getLogger("bloop.stream")
+
+__all__ = ["AsyncStream"]
+
+
+class AsyncShard(Shard):
+    """A :class:`~bloop.stream.shard.Shard` whose DynamoDBStreams calls are coroutines.
+
+    :param session: Used to make DynamoDBStreams calls.
+    :type session: :class:`~bloop.aio.session.AsyncSessionWrapper`
+    """
+    __iter__ = None
+    __next__ = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get_records()
+        except ShardIteratorExpired:
+            # Refreshing a latest or trim_horizon iterator could lose data.
+            if self.iterator_type in ["trim_horizon", "latest"]:
+                raise
+        await self.jump_to(iterator_type=self.iterator_type, sequence_number=self.sequence_number)
+        return await self.get_records()
+
+    async def jump_to(self, *, iterator_type, sequence_number=None):
+        """Move to a new position in the shard using the standard parameters to GetShardIterator.
+
+        :param str iterator_type: "trim_horizon", "at_sequence", "after_sequence", "latest"
+        :param str sequence_number: *(Optional)* Sequence number to use with at/after sequence.  Default is None.
+        """
+        self.iterator_id = await self.session.get_shard_iterator(
+            stream_arn=self.stream_arn,
+            shard_id=self.shard_id,
+            iterator_type=iterator_type,
+            sequence_number=sequence_number)
+        self.iterator_type = iterator_type
+        self.sequence_number = sequence_number
+        self.empty_responses = 0
+
+    async def seek_to(self, position):
+        """Move the Shard's iterator to the earliest record after the :class:`~datetime.datetime` time.
+
+        :param position: The position in time to move to.
+        :type position: :class:`~datetime.datetime`
+        :returns: A list of the first records found after ``position``.  May be empty.
+        """
+        await self.jump_to(iterator_type="trim_horizon")
+        position = int(position.timestamp())
+
+        while (not self.exhausted) and (self.empty_responses < CALLS_TO_REACH_HEAD):
+            records = await self.get_records()
+            if records and records[-1]["meta"]["created_at"].timestamp() >= position:
+                for offset, record in enumerate(reversed(records)):
+                    if record["meta"]["created_at"].timestamp() < position:
+                        index = len(records) - offset
+                        return records[index:]
+                return records
+        return []
+
+    async def load_children(self):
+        """If the Shard doesn't have any children, tries to find some from DescribeStream."""
+        if self.children:
+            return self.children
+        shards = (await self.session.describe_stream(
+            stream_arn=self.stream_arn, first_shard=self.shard_id))["Shards"]
+        return self._insert_children(shards)
+
+    async def get_records(self):
+        """Get the next set of records in this shard.  An empty list doesn't guarantee the shard is exhausted.
+
+        :returns: A list of reformatted records.  May be empty.
+        """
+        if self.exhausted:
+            return []
+
+        if self.empty_responses >= CALLS_TO_REACH_HEAD:
+            return self._apply_get_records_response(await self.session.get_stream_records(self.iterator_id))
+
+        while self.empty_responses < CALLS_TO_REACH_HEAD and not self.exhausted:
+            records = self._apply_get_records_response(await self.session.get_stream_records(self.iterator_id))
+            if records:
+                return records
+        return []
+
+
+class AsyncCoordinator(Coordinator):
+    """A :class:`~bloop.stream.coordinator.Coordinator` whose shard management calls are coroutines.
+
+    :param session: Used to make DynamoDBStreams calls.
+    :type session: :class:`~bloop.aio.session.AsyncSessionWrapper`
+    :param str stream_arn: Stream arn, usually from the model's ``Meta.stream["arn"]``.
+    """
+    __iter__ = None
+    __next__ = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.buffer:
+            await self.advance_shards()
+        return self._pop_record()
+
+    async def advance_shards(self):
+        """Poll active shards for records and insert them into the buffer.  Rotate exhausted shards.
+
+        Returns immediately if the buffer isn't empty.
+        """
+        if self.buffer:
+            return
+        record_shard_pairs = []
+        for shard in self.active:
+            records = await shard.__anext__()
+            if records:
+                record_shard_pairs.extend((record, shard) for record in records)
+        self.buffer.push_all(record_shard_pairs)
+        await self.migrate_closed_shards()
+
+    async def heartbeat(self):
+        """Keep active shards with "trim_horizon", "latest" iterators alive by advancing their iterators."""
+        for shard in self.active:
+            if shard.sequence_number is None:
+                records = await shard.__anext__()
+                if records:
+                    self.buffer.push_all((record, shard) for record in records)
+        await self.migrate_closed_shards()
+
+    async def migrate_closed_shards(self):
+        to_migrate = {shard for shard in self.active if shard.exhausted}
+        if not to_migrate:
+            return
+
+        buffered_count = self._buffered_count()
+        for shard in to_migrate:
+            await shard.load_children()
+            self.remove_shard(shard)
+            for child in shard.children:
+                await child.jump_to(iterator_type="trim_horizon")
+            if shard in buffered_count:
+                self.closed[shard] = buffered_count[shard]
+
+    async def move_to(self, position):
+        """Set the Coordinator to a specific endpoint or time, or load state from a token.
+
+        :param position: "trim_horizon", "latest", :class:`~datetime.datetime`, or a
+            :attr:`Coordinator.token <bloop.stream.coordinator.Coordinator.token>`
+        """
+        if isinstance(position, collections.abc.Mapping):
+            move = _move_stream_token
+        elif hasattr(position, "timestamp") and callable(position.timestamp):
+            move = _move_stream_time
+        elif isinstance(position, str) and position.lower() in ["latest", "trim_horizon"]:
+            move = _move_stream_endpoint
+        else:
+            raise InvalidPosition("Don't know how to move to position {!r}".format(position))
+        await move(self, position)
+
+
+class AsyncStream(Stream):
+    """Iterator for ``async for`` over all records in a stream.
+
+    Like :class:`~bloop.stream.Stream`, each step returns the next record or None when there are no new records.
+
+    .. code-block:: python
+
+        stream = await engine.stream(User, "trim_horizon")
+        async for record in stream:
+            if record is None:
+                await asyncio.sleep(1)
+            ...
+
+    :param model: The model to stream records from.
+    :param engine: The engine to load model objects through.
+    :type engine: :class:`~bloop.aio.engine.AsyncEngine`
+    """
+    __iter__ = None
+    __next__ = None
+
+    def __init__(self, *, model, engine):
+        self.model = model
+        self.engine = engine
+        self.coordinator = AsyncCoordinator(
+            session=engine.session,
+            stream_arn=model.Meta.stream["arn"])
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return self._unpack_record(await self.coordinator.__anext__())
+
+    async def heartbeat(self):
+        """Refresh iterators without sequence numbers so they don't expire.
+
+        Call this at least every 14 minutes.
+        """
+        await self.coordinator.heartbeat()
+
+    async def move_to(self, position):
+        """Move the Stream to a specific endpoint or time, or load state from a token.
+
+        :param position: "trim_horizon", "latest", :class:`~datetime.datetime`, or a
+            :attr:`Stream.token <bloop.stream.stream.Stream.token>`
+        """
+        await self.coordinator.move_to(position)
+
+
+async def _move_stream_endpoint(coordinator, position):
+    """Move to the "trim_horizon" or "latest" of the entire stream."""
+    stream_arn = coordinator.stream_arn
+    coordinator.roots.clear()
+    coordinator.active.clear()
+    coordinator.buffer.clear()
+
+    current_shards = (await coordinator.session.describe_stream(stream_arn=stream_arn))["Shards"]
+    current_shards = unpack_shards(current_shards, stream_arn, coordinator.session, shard_cls=AsyncShard)
+    coordinator.roots.extend(shard for shard in current_shards.values() if not shard.parent)
+
+    if position == "trim_horizon":
+        for shard in coordinator.roots:
+            await shard.jump_to(iterator_type="trim_horizon")
+        coordinator.active.extend(coordinator.roots)
+    else:
+        for root in coordinator.roots:
+            for shard in root.walk_tree():
+                if not shard.children:
+                    await shard.jump_to(iterator_type="latest")
+                    coordinator.active.append(shard)
+
+
+async def _move_stream_time(coordinator, time):
+    """Scan through the *entire* Stream for the first record after ``time``."""
+    if time > datetime.datetime.now(datetime.timezone.utc):
+        await _move_stream_endpoint(coordinator, "latest")
+        return
+
+    await _move_stream_endpoint(coordinator, "trim_horizon")
+    shard_trees = collections.deque(coordinator.roots)
+    while shard_trees:
+        shard = shard_trees.popleft()
+        records = await shard.seek_to(time)
+        if records:
+            coordinator.buffer.push_all((record, shard) for record in records)
+        elif shard.exhausted:
+            coordinator.remove_shard(shard, drop_buffered_records=True)
+            shard_trees.extend(shard.children)
+
+
+async def _move_stream_token(coordinator, token):
+    """Move to the Stream position described by the token."""
+    stream_arn = coordinator.stream_arn = token["stream_arn"]
+    coordinator.roots.clear()
+    coordinator.active.clear()
+    coordinator.closed.clear()
+    coordinator.buffer.clear()
+
+    token_shards = unpack_shards(token["shards"], stream_arn, coordinator.session, shard_cls=AsyncShard)
+    coordinator.roots = [shard for shard in token_shards.values() if not shard.parent]
+    coordinator.active.extend(token_shards[shard_id] for shard_id in token["active"])
+
+    current_shards = (await coordinator.session.describe_stream(stream_arn=stream_arn))["Shards"]
+    current_shards = unpack_shards(current_shards, stream_arn, coordinator.session, shard_cls=AsyncShard)
+
+    unverified = collections.deque(coordinator.roots)
+    while unverified:
+        shard = unverified.popleft()
+        if shard.shard_id not in current_shards:
+            logger.info("Unknown or expired shard \"{}\" - pruning from stream token".format(shard.shard_id))
+            coordinator.remove_shard(shard, drop_buffered_records=True)
+            unverified.extend(shard.children)
+
+    if not coordinator.roots:
+        raise InvalidStream("This token has no relation to the actual Stream.")
+
+    for shard in coordinator.active:
+        try:
+            if shard.iterator_type is None:
+                shard.iterator_type = "trim_horizon"
+            await shard.jump_to(iterator_type=shard.iterator_type, sequence_number=shard.sequence_number)
+        except RecordsExpired:
+            msg = "SequenceNumber \"{}\" in shard \"{}\" beyond trim horizon: jumping to trim_horizon"
+            logger.info(msg.format(shard.sequence_number, shard.shard_id))
+            await shard.jump_to(iterator_type="trim_horizon")
@@ -1,8 +1,14 @@
 # http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/ \
 #   Expressions.SpecifyingConditions.html#ConditionExpressionReference.Syntax
+import base64
 import collections
+import decimal
 import logging
+import operator
+import threading
+import weakref
 
+from .actions import Action, ActionType
 from .exceptions import InvalidCondition
 from .signals import (
     object_deleted,
@@ -10,10 +16,10 @@ from .signals import (
     object_modified,
     object_saved,
 )
-from .util import WeakDefaultDictionary, missing
+from .util import LazyValue, WeakDefaultDictionary, missing
 
 
-__all__ = ["Condition", "render"]
+__all__ = ["Condition", "compile_condition", "render"]
 
 
 comparison_aliases = {
@@ -25,6 +31,17 @@ comparison_aliases = {
     ">=": ">=",
 }
 comparisons = list(comparison_aliases.keys())
+orderings = {"<": operator.lt, ">": operator.gt, "<=": operator.le, ">=": operator.ge}
+# Backing types that DynamoDB can order
+ordered_types = {"S", "N", "B"}
+#: Most values DynamoDB allows in one IN condition
+MAX_IN_VALUES = 100
+#: Longest expression DynamoDB allows, in bytes
+MAX_EXPRESSION_LENGTH = 4096
+#: Most paths within one Map or List column that a save updates before it replaces the whole column instead
+MAX_DOCUMENT_CHANGES = 16
+#: Approximate length of the refs and separators in each ``path=:v`` clause of an UpdateExpression
+CLAUSE_OVERHEAD = 8
 logger = logging.getLogger("bloop.conditions")
 
 
@@ -33,18 +50,36 @@ logger = logging.getLogger("bloop.conditions")
 
 # Tracks the state of instances of models:
 # 1) Are any columns marked for including in an update?
-# 2) Latest snapshot for atomic operations
-_obj_tracking = WeakDefaultDictionary(lambda: {"marked": set(), "snapshot": None})
+# 2) DynamoDB's value for each marked column as of the last sync, for atomic operations
+# 3) The snapshot condition built from (2), once something needs it
+# 4) DynamoDB's values for columns that were bulk loaded, until the next sync
+def new_tracking():
+    return {"marked": set(), "synced": None, "snapshot": None}
+
+
+# Only for objects that aren't instances of BaseModel, which keep their state in a slot on the instance
+_obj_tracking = WeakDefaultDictionary(new_tracking)
+
+
+def get_tracking(obj):
+    """Returns the tracking state for an object, creating it the first time."""
+    if not hasattr(type(obj), "_bloop_tracking"):
+        return _obj_tracking[obj]
+    tracking = getattr(obj, "_bloop_tracking", None)
+    if tracking is None:
+        tracking = obj._bloop_tracking = new_tracking()
+    return tracking
 
 
 @object_deleted.connect
 def on_object_deleted(_, *, obj, **__):
-    _obj_tracking[obj].pop("snapshot", None)
+    tracking = get_tracking(obj)
+    tracking["synced"] = tracking["snapshot"] = None
 
 
 @object_loaded.connect
 def on_object_loaded(_, *, engine, obj, **__):
-    sync(obj, engine)
+    sync(obj, engine, loaded=get_tracking(obj).pop("loaded", None))
 
 
 @object_modified.connect
@@ -52,50 +87,185 @@ def on_object_modified(_, *, obj, column, **__):
     # Mark a column for a given object as being modified in any way.
     # Any marked columns will be pushed (possibly as DELETES) in
     # future UpdateItem calls that include the object.
-    _obj_tracking[obj]["marked"].add(column)
+    tracking = get_tracking(obj)
+    tracking["marked"].add(column)
+    tracking.get("loaded", {}).pop(column, None)
 
 
 @object_saved.connect
 def on_object_saved(_, *, engine, obj, **__):
+    get_tracking(obj).pop("loaded", None)
+    clear_actions(obj)
     sync(obj, engine)
 
 
-def sync(obj, engine):
+def clear_actions(obj):
+    """Forget columns that were saved with an :class:`~bloop.actions.Action`.
+
+    DynamoDB applied the action to a value that was never loaded, so the new value isn't known.  The columns are
+    unmarked, so the next save doesn't remove them and the next atomic condition doesn't expect anything."""
+    marked = get_tracking(obj)["marked"]
+    values = obj.__dict__
+    for column in [column for column in marked if isinstance(values.get(column.name), Action)]:
+        del values[column.name]
+        marked.discard(column)
+
+
+def only_tracking_modified():
+    """True if the only receiver of object_modified is the tracking above.
+
+    When nothing else is listening, loading an object can mark its columns with :func:`mark_loaded` instead of
+    sending object_modified for each column.
+    """
+    receivers = list(object_modified.receivers.values())
+    if len(receivers) != 1:
+        return False
+    receiver = receivers[0]
+    if isinstance(receiver, weakref.ref):
+        receiver = receiver()
+    return receiver is on_object_modified
+
+
+def mark_loaded(obj, loaded):
+    """Mark each column as modified in one step, and remember the value DynamoDB returned for each column.
+
+    Same as sending object_modified for each column.  The next object_loaded snapshots these values directly
+    instead of dumping each column again.
+
+    :param obj: The object that was just loaded.
+    :param dict loaded: The value DynamoDB returned for each :class:`~bloop.models.Column` (None if missing).
+    """
+    tracking = get_tracking(obj)
+    tracking["marked"].update(loaded)
+    tracking["loaded"] = loaded
+
+
+def sync(obj, engine, loaded=None):
     """Mark the object as having been persisted at least once.
 
-    Store the latest snapshot of all marked values."""
-    snapshot = Condition()
-    # Only expect values (or lack of a value) for columns that have been explicitly set
-    for column in sorted(_obj_tracking[obj]["marked"], key=lambda col: col.dynamo_name):
-        value = getattr(obj, column.name, None)
-        value = engine._dump(column.typedef, value)
-        condition = column == value
-        # The renderer shouldn't try to dump the value again.
-        # We're dumping immediately in case the value is mutable,
-        # such as a set or (many) custom data types.
-        condition.dumped = True
-        snapshot &= condition
-    _obj_tracking[obj]["snapshot"] = snapshot
+    Keep DynamoDB's value of each marked column for the next atomic operation.  Columns in ``loaded`` use the value
+    DynamoDB returned.  The snapshot condition isn't built until :func:`get_snapshot` is called."""
+    tracking = get_tracking(obj)
+    marked = tracking["marked"]
+    if loaded is not None and len(loaded) == len(marked) and all(column in loaded for column in marked):
+        # Every marked column was just bulk loaded, so there's nothing to dump
+        values = loaded
+    else:
+        loaded = loaded or {}
+        values = {}
+        # Only expect values (or lack of a value) for columns that have been explicitly set
+        for column in marked:
+            value = obj.__dict__.get(column.name, None)
+            if column in loaded:
+                value = loaded[column]
+            elif isinstance(value, LazyValue):
+                # Not read since it was loaded, so DynamoDB's value is still the dumped value
+                value = value.value
+            else:
+                # Dump now in case the value is mutable, such as a set or (many) custom data types
+                value = engine._dump(column.typedef, getattr(obj, column.name, None))
+            values[column] = value
+    tracking["synced"] = values
+    tracking["snapshot"] = None
 
 
 def get_snapshot(obj):
+    tracking = get_tracking(obj)
     # Cached value
-    snapshot = _obj_tracking[obj].get("snapshot", None)
+    snapshot = tracking["snapshot"]
     if snapshot is not None:
         return snapshot
 
-    # If the object has never been synced, create and cache
-    # a condition that expects every column to be empty
     snapshot = Condition()
-    for column in sorted(obj.Meta.columns, key=lambda col: col.dynamo_name):
-        snapshot &= column.is_(None)
-    _obj_tracking[obj]["snapshot"] = snapshot
+    values = tracking["synced"]
+    if values is None:
+        # The object has never been synced, so expect every column to be empty
+        for column in sorted(obj.Meta.columns, key=lambda col: col.dynamo_name):
+            snapshot &= column.is_(None)
+    else:
+        for column in sorted(values, key=lambda col: col.dynamo_name):
+            condition = column == values[column]
+            # The renderer shouldn't try to dump the value again
+            condition.dumped = True
+            snapshot &= condition
+    tracking["snapshot"] = snapshot
     return snapshot
 
 
 def get_marked(obj):
     """Returns the set of marked columns for an object"""
-    return set(_obj_tracking[obj]["marked"])
+    return set(get_tracking(obj)["marked"])
+
+
+def get_synced_document(obj, column):
+    """Returns DynamoDB's value of a Map or List column as of the last sync, or None if it wasn't synced with one."""
+    if column.typedef.backing_type not in ("M", "L"):
+        return None
+    synced = get_tracking(obj)["synced"]
+    if not synced:
+        return None
+    value = synced.get(column)
+    if value is None or column.typedef.backing_type not in value:
+        return None
+    return value
+
+
+def diff_document(old, new, path=()):
+    """Yields ``(path, operation, value)`` for each part of a dumped document that changed.
+
+    The operation is "set", "remove", or "append" (to extend a list).  Maps are compared key by key.  Lists are
+    compared by index when they're the same length, or when one only extends the other.  Anything else is replaced,
+    so when the whole document has to be replaced the only change has an empty path.
+    """
+    if old == new:
+        return
+    path = list(path)
+    if new is None:
+        yield path, "remove", None
+    elif "M" in old and "M" in new:
+        old, new = old["M"], new["M"]
+        for key, value in new.items():
+            if key not in old:
+                yield path + [key], "set", value
+            else:
+                yield from diff_document(old[key], value, path + [key])
+        for key in old:
+            if key not in new:
+                yield path + [key], "remove", None
+    elif "L" in old and "L" in new:
+        old, new = old["L"], new["L"]
+        shared = min(len(old), len(new))
+        if len(old) == len(new):
+            for index, (before, after) in enumerate(zip(old, new)):
+                yield from diff_document(before, after, path + [index])
+        elif old[:shared] != new[:shared]:
+            yield path, "set", {"L": new}
+        elif len(new) > len(old):
+            yield path, "append", {"L": new[shared:]}
+        else:
+            for index in range(shared, len(old)):
+                yield path + [index], "remove", None
+    else:
+        yield path, "set", new
+
+
+def is_small_diff(changes, document):
+    """True if there are at most :data:`MAX_DOCUMENT_CHANGES` changes, and they're smaller than the whole document.
+
+    Otherwise replacing the whole column is cheaper, and keeps the UpdateExpression short.  Each change also
+    costs a clause with its own refs, which is counted as :data:`CLAUSE_OVERHEAD` characters."""
+    if len(changes) > MAX_DOCUMENT_CHANGES:
+        return False
+    size = sum(len(repr(path)) + len(repr(value)) + CLAUSE_OVERHEAD for (path, _, value) in changes)
+    return size < len(repr(document))
+
+
+def next_version(obj):
+    """Returns the value of the object's version column after its next save.
+
+    The first save of an object without a version sets it to 1."""
+    current = getattr(obj, obj.Meta.version.name, None)
+    return 1 if current is None else current + 1
 
 
 # END CONDITION TRACKING ====================================================================== END CONDITION TRACKING
@@ -128,6 +298,8 @@ class ReferenceTracker:
         self.attr_names = {}
         # Index ref -> attr name for de-duplication
         self.name_attr_index = {}
+        # (ref, dumped value) for every value ref in the order they were made, including popped refs
+        self.value_refs = []
         self.engine = engine
 
     @property
@@ -169,15 +341,11 @@ class ReferenceTracker:
 
         # Need to dump this value
         if not dumped:
-            typedef = column.typedef
-            for segment in path_of(column):
-                typedef = typedef[segment]
-            if inner:
-                typedef = typedef.inner_typedef
-            value = self.engine._dump(typedef, value)
+            value = dump_value(self.engine, column, value, inner=inner)
 
         self.attr_values[ref] = value
         self.counts[ref] += 1
+        self.value_refs.append((ref, value))
         return ref, value
 
     def any_ref(self, *, column, value=missing, dumped=False, inner=False):
@@ -253,7 +421,316 @@ class ReferenceTracker:
                     del self.name_attr_index[path_segment]
 
 
-def render(engine, obj=None, filter=None, projection=None, key=None, atomic=None, condition=None, update=None):
+def typedef_of(column):
+    """The typedef at the column's path."""
+    typedef = column.typedef
+    for segment in path_of(column):
+        typedef = typedef[segment]
+    return typedef
+
+
+def dump_value(engine, column, value, *, inner=False):
+    """Dump a value through the typedef at the column's path, or its inner typedef."""
+    typedef = typedef_of(column)
+    if inner:
+        typedef = typedef.inner_typedef
+    return engine._dump(typedef, value)
+
+
+def build_condition(obj, condition, atomic):
+    """The condition to render for a conditional operation, including the object's version or atomic snapshot."""
+    condition = condition or Condition()
+    version = obj.Meta.version if obj is not None else None
+    if version is not None:
+        # Versioned models only compare the version, whether or not atomic is True
+        condition = condition & version.is_(getattr(obj, version.name, None))
+    elif atomic:
+        condition = condition & get_snapshot(obj)
+    return condition
+
+
+def normalize(condition, engine):
+    """Returns an equivalent condition with less to render.
+
+    Nested AND and OR conditions are flattened, empty and duplicate conditions are dropped, a double NOT is
+    removed, and AND or OR with one condition become that condition.  Within an OR, ``==`` comparisons and IN
+    conditions against values of the same column are collapsed into one IN condition, as long as it has at most
+    :data:`MAX_IN_VALUES` values.  An IN condition with more values becomes an OR of IN conditions that each have at
+    most that many.  The given condition isn't modified.
+
+    :param engine: Used to dump the values of collapsed comparisons.
+    """
+    cls = condition.__class__
+    if cls is NotCondition:
+        inner = normalize(condition.values[0], engine)
+        if not inner:
+            return Condition()
+        if inner.__class__ is NotCondition:
+            return inner.values[0]
+        return NotCondition(inner)
+    if cls is InCondition and len(condition.values) > MAX_IN_VALUES:
+        return OrCondition(*split_in(condition))
+    if cls not in (AndCondition, OrCondition):
+        return condition
+    values = []
+    for value in condition.values:
+        value = normalize(value, engine)
+        # (a & ()) -> a
+        if not value:
+            continue
+        # (a & (b & c)) -> (a & b & c)
+        if value.__class__ is cls:
+            values.extend(value.values)
+        else:
+            values.append(value)
+    values = unique(values)
+    if cls is OrCondition:
+        values = collapse_in(values, engine)
+    if not values:
+        return Condition()
+    if len(values) == 1:
+        return values[0]
+    return cls(*values)
+
+
+def split_in(condition):
+    """Splits an IN condition into IN conditions of at most :data:`MAX_IN_VALUES` values each."""
+    conditions = []
+    for start in range(0, len(condition.values), MAX_IN_VALUES):
+        chunk = InCondition(column=condition.column, values=condition.values[start:start + MAX_IN_VALUES])
+        chunk.dumped = condition.dumped
+        conditions.append(chunk)
+    return conditions
+
+
+def unique(conditions):
+    """Drops conditions equal to an earlier condition, keeping their order."""
+    seen = collections.defaultdict(list)
+    values = []
+    for condition in conditions:
+        # Only compare conditions on the same column, and against the same values when they're hashable
+        key = condition.operation, id(proxied(condition.column))
+        # Dumped values are dicts
+        if condition.column is not None and not condition.dumped:
+            try:
+                key = key, hash(tuple(condition.values))
+            except TypeError:
+                pass
+        bucket = seen[key]
+        if condition not in bucket:
+            bucket.append(condition)
+            values.append(condition)
+    return values
+
+
+def collapse_in(conditions, engine):
+    """Replaces two or more ``==`` or IN conditions on the same column with one IN condition.
+
+    The new condition holds dumped values, so that values which dump to None (rendered as ``attribute_not_exists``)
+    are never collapsed.  It takes the place of the first condition it replaces."""
+    groups = collections.defaultdict(list)
+    for condition in conditions:
+        if condition.__class__ in (ComparisonCondition, InCondition) and condition.operation in ("==", "in"):
+            groups[column_shape(condition.column)].append(condition)
+
+    collapsed = {}
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        typedef = typedef_of(group[0].column)
+        if not typedef.supports_operation("in"):
+            continue
+        replaced, values = [], []
+        for condition in group:
+            dumped = []
+            for value in condition.values:
+                if isinstance(value, ComparisonMixin):
+                    break
+                if not condition.dumped:
+                    value = engine._dump(typedef, value)
+                if value is None:
+                    break
+                dumped.append(value)
+            else:
+                if dumped:
+                    replaced.append(condition)
+                    values.extend(dumped)
+        if len(replaced) < 2 or len(values) > MAX_IN_VALUES:
+            continue
+        collapsed[replaced[0]] = InCondition(column=replaced[0].column, values=values)
+        collapsed[replaced[0]].dumped = True
+        for condition in replaced[1:]:
+            collapsed[condition] = None
+
+    if not collapsed:
+        return conditions
+    values = [collapsed.get(condition, condition) for condition in conditions]
+    return [value for value in values if value is not None]
+
+
+class Uncacheable(Exception):
+    """Raised when something can't be described by a shape, such as a custom condition class."""
+
+
+def column_shape(column):
+    return proxied(column), tuple(path_of(column))
+
+
+def condition_shape(condition, values):
+    """Returns a hashable shape of everything in the condition except its values.
+
+    Each value that will be rendered as a value ref is appended to ``values`` as ``(column, value, dumped, inner)``,
+    in the order the renderer will dump it.
+    """
+    cls = condition.__class__
+    if cls is Condition:
+        return cls,
+    if cls in (AndCondition, OrCondition, NotCondition):
+        return cls, tuple(condition_shape(value, values) for value in condition.values)
+    # Subclasses may render differently
+    if cls not in (ComparisonCondition, BeginsWithCondition, BetweenCondition, ContainsCondition, InCondition):
+        raise Uncacheable(cls)
+    inner = cls is ContainsCondition
+    shape = [cls, condition.operation, column_shape(condition.column), condition.dumped]
+    for value in condition.values:
+        if isinstance(value, ComparisonMixin):
+            shape.append(column_shape(value))
+        else:
+            shape.append(None)
+            values.append((condition.column, value, condition.dumped, inner))
+    return tuple(shape)
+
+
+def update_shape(obj, values):
+    """Returns a hashable shape of the object's update expression, and appends its values like condition_shape.
+
+    Follows the order of :func:`ConditionRenderer.render_update_expression`."""
+    shape = []
+    version = obj.Meta.version
+    if version is not None:
+        shape.append(version)
+        values.append((version, next_version(obj), False, False))
+    for column in sorted(
+            filter(lambda c: c not in obj.Meta.keys and c is not version, get_marked(obj)),
+            key=lambda c: c.dynamo_name):
+        value = getattr(obj, column.name, None)
+        if isinstance(value, Action):
+            shape.append((column, value.type))
+            values.append((column, value.value, False, False))
+            if value.type is ActionType.Append:
+                values.append((column, {"L": []}, True, False))
+        elif isinstance(value, ComparisonMixin):
+            shape.append((column, column_shape(value)))
+        elif get_synced_document(obj, column) is not None:
+            # The rendered paths depend on what changed in the document
+            raise Uncacheable(column)
+        else:
+            shape.append(column)
+            values.append((column, value, False, False))
+    return tuple(shape)
+
+
+class RenderCache:
+    """Reuses the expressions and names rendered for the same shape of request.
+
+    The shape includes the kind and order of every condition, the columns and paths they use, the projected columns,
+    and the columns in an update, but not the values compared or set.  Values are still dumped for every request, and
+    whether each one dumps to None is part of the shape, since that changes the expression (``attribute_not_exists``
+    or ``REMOVE``).  Anything the cache can't describe, such as a custom condition class or a changed Map or List
+    column, is rendered without it.
+
+    .. code-block:: python
+
+        cache = RenderCache(maxsize=256)
+        request = render(engine, obj=user, condition=User.age >= 18, update=True, cache=cache)
+        print(cache.hits, cache.misses)
+
+    :param int maxsize: Most shapes to keep.  The least recently used shape is dropped first.  Default is 1024.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.templates = collections.OrderedDict()
+        #: Number of renders that reused a cached shape
+        self.hits = 0
+        #: Number of renders that built their expressions
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def render(self, engine, obj=None, filter=None, projection=None, key=None, atomic=None, condition=None,
+               update=None):
+        """Same as :func:`~bloop.conditions.render`, using a cached shape when possible."""
+        if (atomic or update) and not obj:
+            raise InvalidCondition("An object is required to render atomic conditions or updates without an object.")
+        values = []
+        try:
+            shape = (
+                condition_shape(normalize(filter, engine), values) if filter else None,
+                tuple(projection) if projection else None,
+                condition_shape(normalize(key, engine), values) if key else None,
+                condition_shape(normalize(build_condition(obj, condition, atomic), engine), values),
+                update_shape(obj, values) if update else None,
+            )
+        except Uncacheable:
+            return render(engine, obj=obj, filter=filter, projection=projection, key=key, atomic=atomic,
+                          condition=condition, update=update)
+        dumped = [
+            value if is_dumped else dump_value(engine, column, value, inner=inner)
+            for (column, value, is_dumped, inner) in values]
+        shape += tuple(value is None for value in dumped),
+
+        with self._lock:
+            template = self.templates.get(shape)
+            if template is not None:
+                self.templates.move_to_end(shape)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if template is None:
+            renderer = ConditionRenderer(engine)
+            renderer.render(
+                obj=obj, condition=condition,
+                atomic=atomic, update=update,
+                filter=filter, projection=projection, key=key,
+            )
+            rendered = renderer.rendered
+            self.store(shape, rendered, renderer.refs.value_refs, dumped)
+            return rendered
+
+        expressions, names, refs = template
+        rendered = dict(expressions)
+        if names:
+            rendered["ExpressionAttributeNames"] = dict(names)
+        attr_values = {ref: value for (ref, value) in zip(refs, dumped) if ref is not None}
+        if attr_values:
+            rendered["ExpressionAttributeValues"] = attr_values
+        return rendered
+
+    def store(self, shape, rendered, value_refs, dumped):
+        # Only keep a template when the renderer dumped exactly the values the shape found, in the same order
+        if len(value_refs) != len(dumped) or any(value != d for ((_, value), d) in zip(value_refs, dumped)):
+            logger.debug("not caching render of shape {}".format(shape))
+            return
+        attr_values = rendered.get("ExpressionAttributeValues", {})
+        expressions = {
+            k: v for (k, v) in rendered.items()
+            if k not in ("ExpressionAttributeNames", "ExpressionAttributeValues")}
+        names = dict(rendered.get("ExpressionAttributeNames", {}))
+        refs = [ref if ref in attr_values else None for (ref, _) in value_refs]
+        with self._lock:
+            self.templates[shape] = expressions, names, refs
+            while len(self.templates) > self.maxsize:
+                self.templates.popitem(last=False)
+
+
+def render(
+        engine, obj=None, filter=None, projection=None, key=None, atomic=None, condition=None, update=None,
+        cache=None):
+    if cache is not None:
+        return cache.render(
+            engine, obj=obj, condition=condition,
+            atomic=atomic, update=update,
+            filter=filter, projection=projection, key=key,
+        )
     renderer = ConditionRenderer(engine)
     renderer.render(
         obj=obj, condition=condition,
@@ -306,9 +783,10 @@ class ConditionRenderer:
             If atomic is True, the two are rendered in an AND condition.  Default is None.
         :type condition: :class:`~bloop.conditions.BaseCondition`
         :param bool atomic: *(Optional)*  True if an atomic condition should be created for ``obj`` and rendered as
-            a "ConditionExpression".  Default is False.
-        :param bool update: *(Optional)*  True if an "UpdateExpression" should be rendered for ``obj``.
-            Default is False.
+            a "ConditionExpression".  When ``obj`` has a ``Meta.version`` column, only the version is compared and
+            it's always compared.  Default is False.
+        :param bool update: *(Optional)*  True if an "UpdateExpression" should be rendered for ``obj``.  The update
+            sets the version column to its next value.  Default is False.
         :param filter: *(Optional)* A filter condition for a query or scan, rendered as a "FilterExpression".
             Default is None.
         :type filter: :class:`~bloop.conditions.BaseCondition`
@@ -322,16 +800,16 @@ class ConditionRenderer:
             raise InvalidCondition("An object is required to render atomic conditions or updates without an object.")
 
         if filter:
-            self.render_filter_expression(filter)
+            self.render_filter_expression(normalize(filter, self.engine))
 
         if projection:
             self.render_projection_expression(projection)
 
         if key:
-            self.render_key_expression(key)
+            self.render_key_expression(normalize(key, self.engine))
 
         # Condition requires a bit of work, because either one can be empty/false
-        condition = (condition or Condition()) & (get_snapshot(obj) if atomic else Condition())
+        condition = normalize(build_condition(obj, condition, atomic), self.engine)
         if condition:
             self.render_condition_expression(condition)
 
@@ -358,16 +836,39 @@ class ConditionRenderer:
             ref_names.append(ref.name)
         self.expressions["ProjectionExpression"] = ", ".join(ref_names)
 
-    def render_update_expression(self, obj):
+    def render_update_expression(self, obj, include_version=True):
         updates = {
             "set": [],
-            "remove": []}
+            "remove": [],
+            "add": [],
+            "delete": []}
+        version = obj.Meta.version
+        if version is not None and include_version:
+            name_ref = self.refs.any_ref(column=version)
+            value_ref = self.refs.any_ref(column=version, value=next_version(obj))
+            updates["set"].append("{}={}".format(name_ref.name, value_ref.name))
         for column in sorted(
-                # Don't include key columns in an UpdateExpression
-                filter(lambda c: c not in obj.Meta.keys, get_marked(obj)),
+                # Don't include key columns in an UpdateExpression, or the version which was set above
+                filter(lambda c: c not in obj.Meta.keys and c is not version, get_marked(obj)),
                 key=lambda c: c.dynamo_name):
             name_ref = self.refs.any_ref(column=column)
-            value_ref = self.refs.any_ref(column=column, value=getattr(obj, column.name, None))
+            value = getattr(obj, column.name, None)
+            if isinstance(value, Action):
+                self.render_action(updates, column, name_ref, value)
+                continue
+            dumped = False
+            synced = get_synced_document(obj, column)
+            if synced is not None and not isinstance(value, ComparisonMixin):
+                value = self.engine._dump(column.typedef, value)
+                changes = list(diff_document(synced, value))
+                partial = changes and (changes[0][0] or changes[0][1] == "append")
+                if not changes or (partial and is_small_diff(changes, value)):
+                    # Nothing changed, or a few paths within the document changed, or the list was extended
+                    self.refs.pop_refs(name_ref)
+                    self.render_document_changes(updates, column, changes)
+                    continue
+                dumped = True
+            value_ref = self.refs.any_ref(column=column, value=value, dumped=dumped)
             # Can't set to an empty value
             if is_empty(value_ref):
                 self.refs.pop_refs(value_ref)
@@ -381,9 +882,44 @@ class ConditionRenderer:
             expression += "SET " + ", ".join(updates["set"])
         if updates["remove"]:
             expression += " REMOVE " + ", ".join(updates["remove"])
+        if updates["add"]:
+            expression += " ADD " + ", ".join(updates["add"])
+        if updates["delete"]:
+            expression += " DELETE " + ", ".join(updates["delete"])
         if expression:
             self.expressions["UpdateExpression"] = expression.strip()
 
+    def render_document_changes(self, updates, column, changes):
+        for path, operation, value in changes:
+            name_ref = self.refs.any_ref(column=Proxy(column, path))
+            if operation == "remove":
+                updates["remove"].append(name_ref.name)
+                continue
+            value_ref = self.refs.any_ref(column=Proxy(column, path), value=value, dumped=True)
+            if operation == "append":
+                updates["set"].append("{name}=list_append({name}, {value})".format(
+                    name=name_ref.name, value=value_ref.name))
+            else:
+                updates["set"].append("{}={}".format(name_ref.name, value_ref.name))
+
+    def render_action(self, updates, column, name_ref, action):
+        if not action.type.supports(column.typedef):
+            raise InvalidCondition(
+                "Can't {} a column with backing type {!r}: {!r}".format(
+                    action.type.wire_key, column.typedef.backing_type, column))
+        value_ref = self.refs.any_ref(column=column, value=action.value)
+        # Adding, deleting or appending nothing doesn't change the stored value
+        if is_empty(value_ref):
+            self.refs.pop_refs(value_ref, name_ref)
+            return
+        if action.type is ActionType.Append:
+            # list_append fails if the list doesn't exist yet
+            empty_ref = self.refs.any_ref(column=column, value={"L": []}, dumped=True)
+            updates["set"].append("{name}=list_append(if_not_exists({name}, {empty}), {value})".format(
+                name=name_ref.name, empty=empty_ref.name, value=value_ref.name))
+        else:
+            updates[action.type.wire_key].append("{} {}".format(name_ref.name, value_ref.name))
+
     @property
     def rendered(self):
         """The rendered wire format for all conditions that have been rendered.  Rendered conditions are never
@@ -957,8 +1493,214 @@ def iter_columns(condition):
         if column not in visited:
             visited.add(column)
             yield column
-            for value in condition.values:
-                if isinstance(value, ComparisonMixin):
-                    if value not in visited:
-                        visited.add(value)
-                        yield value
+        for value in condition.values:
+            if isinstance(value, ComparisonMixin):
+                value = proxied(value)
+                if value not in visited:
+                    visited.add(value)
+                    yield value
+
+
+# EVALUATION ============================================================================================== EVALUATION
+
+
+def compile_condition(condition, engine):
+    """Compile a condition into a function that evaluates it locally, without calling DynamoDB.
+
+    The function takes a model instance, or an item of DynamoDB values by dynamo_name such as the ``Items`` of a
+    Query or a stream record's ``NewImage``, and returns True if the condition matches.  Values are compared the way
+    DynamoDB compares them: numbers by value, strings by code point and binary by byte.  Values of different types
+    are never equal or ordered, and a comparison with a missing attribute is False.  Compare to None to check if an
+    attribute exists.
+
+    .. code-block:: pycon
+
+        >>> matches = compile_condition(User.age.between(18, 30) & User.email.begins_with("admin"), engine)
+        >>> matches(user)
+        True
+        >>> matches({"age": {"N": "40"}, "email": {"S": "admin@domain.com"}})
+        False
+
+    :param condition: The condition to evaluate.
+    :param engine: :class:`~bloop.engine.Engine` to dump values and model instances with.
+    :return: A function of one model instance or item that returns a bool.
+    :raises bloop.exceptions.InvalidCondition: if the condition couldn't be rendered, or an instance has a pending
+        update action for a column in the condition.
+    """
+    condition = normalize(condition, engine)
+    test = compile_test(condition, engine)
+    # Only the columns in the condition are dumped from an instance
+    columns = []
+    if condition:
+        columns = [(column.name, column.dynamo_name, column.typedef) for column in iter_columns(condition)]
+
+    def evaluate(obj):
+        if isinstance(obj, dict):
+            return test(obj)
+        item = {}
+        for name, dynamo_name, typedef in columns:
+            value = getattr(obj, name, None)
+            if isinstance(value, Action):
+                raise InvalidCondition("Can't evaluate a condition on {!r} with a pending action.".format(name))
+            value = engine._dump(typedef, value)
+            if value is not None:
+                item[dynamo_name] = value
+        return test(item)
+    return evaluate
+
+
+def compile_test(condition, engine):
+    """Compile a normalized condition into a function of an item that returns a bool."""
+    operation = condition.operation
+    if operation is None:
+        return lambda item: True
+    if operation in ("and", "or"):
+        tests = [compile_test(value, engine) for value in condition.values]
+        if operation == "and":
+            return lambda item: all(test(item) for test in tests)
+        return lambda item: any(test(item) for test in tests)
+    if operation == "not":
+        inner = compile_test(condition.values[0], engine)
+        return lambda item: not inner(item)
+
+    get = compile_operand(condition.column, engine)
+    # contains dumps its value through the inner type, like rendering
+    operands = [
+        compile_operand(value, engine, condition, inner=operation == "contains")
+        for value in condition.values]
+    if operation in comparisons:
+        other, = operands
+        # == None is attribute_not_exists, != None is attribute_exists
+        if other is None and operation in ("==", "!="):
+            exists = operation == "!="
+            return lambda item: (get(item) is not missing) is exists
+        if other is None:
+            raise InvalidCondition("Comparison <{!r}> is against the value None.".format(condition))
+        return lambda item: compare(operation, get(item), other(item))
+    if operation == "in" and not operands:
+        raise InvalidCondition("Condition <{!r}> is missing values.".format(condition))
+    if any(operand is None for operand in operands):
+        raise InvalidCondition("Condition <{!r}> includes the value None.".format(condition))
+    if operation == "begins_with":
+        prefix, = operands
+        return lambda item: begins_with(get(item), prefix(item))
+    if operation == "between":
+        lower, upper = operands
+        return lambda item: is_ordered(lower(item), get(item), upper(item))
+    if operation == "contains":
+        element, = operands
+        return lambda item: contains(get(item), element(item))
+    if not any(isinstance(value, ComparisonMixin) for value in condition.values):
+        # Only constants, which don't depend on the item
+        keys = {operand(None) for operand in operands}
+        return lambda item: get(item) in keys
+    return lambda item: any(compare("==", get(item), operand(item)) for operand in operands)
+
+
+def compile_operand(value, engine, condition=None, *, inner=False):
+    """A function of an item that returns the wire key of a column's value, or of a constant value.
+
+    Returns None when the constant dumps to None.  Pass the condition for a value, but not for its column."""
+    if condition is None or isinstance(value, ComparisonMixin):
+        name, path = proxied(value).dynamo_name, path_of(value)
+        return lambda item: wire_key(get_path(item, name, path))
+    if not condition.dumped:
+        value = dump_value(engine, condition.column, value, inner=inner)
+    if value is None:
+        return None
+    key = wire_key(value)
+    return lambda item: key
+
+
+def get_path(item, name, path):
+    """The DynamoDB value at a document path in an item, or None."""
+    value = item.get(name)
+    for segment in path:
+        if value is None:
+            break
+        if isinstance(segment, int):
+            values = value.get("L")
+            value = values[segment] if values is not None and 0 <= segment < len(values) else None
+        else:
+            value = value.get("M", {}).get(segment)
+    return value
+
+
+def wire_key(value):
+    """A hashable (type, value) pair for a DynamoDB value, equal for values that DynamoDB considers equal.
+
+    Returns :data:`~bloop.util.missing` for None."""
+    if value is None:
+        return missing
+    (backing_type, inner), = value.items()
+    if backing_type == "N":
+        return backing_type, decimal.Decimal(inner)
+    if backing_type == "B":
+        return backing_type, as_bytes(inner)
+    if backing_type == "NS":
+        return backing_type, frozenset(decimal.Decimal(element) for element in inner)
+    if backing_type == "SS":
+        return backing_type, frozenset(inner)
+    if backing_type == "BS":
+        return backing_type, frozenset(as_bytes(element) for element in inner)
+    if backing_type == "L":
+        return backing_type, tuple(wire_key(element) for element in inner)
+    if backing_type == "M":
+        return backing_type, frozenset((key, wire_key(element)) for (key, element) in inner.items())
+    # S, BOOL, NULL
+    return backing_type, inner
+
+
+def as_bytes(value):
+    """Binary values are base64 encoded on the wire, unless a client already decoded them."""
+    if isinstance(value, bytes):
+        return value
+    return base64.b64decode(value)
+
+
+def is_ordered(*keys):
+    """True if each key is a string, number or binary of the same type, in ascending order."""
+    if any(key is missing for key in keys):
+        return False
+    backing_type = keys[0][0]
+    if backing_type not in ordered_types or any(key[0] != backing_type for key in keys):
+        return False
+    values = [key[1] for key in keys]
+    return all(lower <= upper for (lower, upper) in zip(values, values[1:]))
+
+
+def begins_with(key, prefix):
+    if key is missing or prefix is missing or key[0] != prefix[0] or key[0] not in ("S", "B"):
+        return False
+    return key[1].startswith(prefix[1])
+
+
+def contains(key, element):
+    if key is missing or element is missing:
+        return False
+    backing_type = key[0]
+    # Substring of a string or binary
+    if backing_type in ("S", "B"):
+        return element[0] == backing_type and element[1] in key[1]
+    # Element of a set with the same type
+    if backing_type in ("SS", "NS", "BS"):
+        return element[0] == backing_type[0] and element[1] in key[1]
+    if backing_type == "L":
+        return element in key[1]
+    return False
+
+
+def compare(operation, key, other):
+    if key is missing or other is missing:
+        # DynamoDB matches "a <> :v" when a doesn't exist, but not when neither side exists
+        return operation == "!=" and (key is not missing or other is not missing)
+    if operation == "==":
+        return key == other
+    if operation == "!=":
+        return key != other
+    if key[0] != other[0] or key[0] not in ordered_types:
+        return False
+    return orderings[operation](key[1], other[1])
+
+
+# END EVALUATION ====================================================================================== END EVALUATION
@@ -1,8 +1,10 @@
 import logging
 from typing import Any, Callable, Union
 
-from .conditions import render
+from .actions import Action
+from .conditions import ConditionRenderer, RenderCache, get_tracking, next_version, render
 from .exceptions import (
+    InvalidCondition,
     InvalidModel,
     InvalidStream,
     InvalidTemplate,
@@ -10,8 +12,14 @@ from .exceptions import (
     MissingObjects,
     UnknownType,
 )
-from .models import BaseModel, Index, subclassof, unpack_from_dynamodb
-from .search import Search
+from .models import (
+    BaseModel,
+    Index,
+    subclassof,
+    unpack_dict_from_dynamodb,
+    unpack_from_dynamodb,
+)
+from .search import Search, plan_search
 from .session import SessionWrapper
 from .signals import (
     before_create_table,
@@ -63,6 +71,128 @@ def dump_key(engine, obj):
     return key
 
 
+def batch_write_request(engine, objs, render_request):
+    """build the RequestItems for a BatchWriteItem call, one request per unique table and key
+
+    render_request(obj, key) returns the PutRequest or DeleteRequest for a single object
+    """
+    request = {}
+    for obj in objs:
+        table_name = engine._compute_table_name(obj.__class__)
+        key = dump_key(engine, obj)
+        # BatchWriteItem rejects a request that includes the same key twice
+        request.setdefault(table_name, {})[index_for(key)] = render_request(obj, key)
+    return {table_name: list(by_key.values()) for table_name, by_key in request.items()}
+
+
+def load_request(engine, objs, consistent):
+    """build the RequestItems for a BatchGetItem call, and the indexes to match each loaded item to its objects
+
+    returns (request, table_index, object_index) where table_index[table_name] is the table's key shape and
+    object_index[table_name][index_for(key)] is the set of objects with that key
+    """
+    table_index, object_index, request = {}, {}, {}
+
+    for obj in objs:
+        table_name = engine._compute_table_name(obj.__class__)
+        key = dump_key(engine, obj)
+        index = index_for(key)
+
+        if table_name not in object_index:
+            table_index[table_name] = list(sorted(key.keys()))
+            object_index[table_name] = {}
+            request[table_name] = {"Keys": [], "ConsistentRead": consistent}
+
+        if index not in object_index[table_name]:
+            request[table_name]["Keys"].append(key)
+            object_index[table_name][index] = set()
+        object_index[table_name][index].add(obj)
+    return request, table_index, object_index
+
+
+def unpack_load_response(engine, objs, response, table_index, object_index, as_dict=False, lazy=False):
+    """unpack each loaded item into its objects, raising MissingObjects for any that weren't loaded
+
+    when as_dict is True the objects aren't modified; returns a dict of {obj: loaded values by column name}
+    """
+    loaded = {}
+    for table_name, list_of_attrs in response.items():
+        for attrs in list_of_attrs:
+            key_shape = table_index[table_name]
+            key = extract_key(key_shape, attrs)
+            index = index_for(key)
+
+            for obj in object_index[table_name].pop(index):
+                if as_dict:
+                    loaded[obj] = unpack_dict_from_dynamodb(
+                        attrs=attrs, expected=obj.Meta.columns, engine=engine)
+                    continue
+                unpack_from_dynamodb(
+                    attrs=attrs, expected=obj.Meta.columns, engine=engine, obj=obj, lazy=lazy)
+                object_loaded.send(engine, engine=engine, obj=obj)
+            if not object_index[table_name]:
+                object_index.pop(table_name)
+
+    if object_index:
+        not_loaded = set()
+        for index in object_index.values():
+            for index_set in index.values():
+                not_loaded.update(index_set)
+        logger.warning("loaded {} of {} objects".format(len(objs) - len(not_loaded), len(objs)))
+        raise MissingObjects("Failed to load some objects.", objects=not_loaded)
+    logger.info("successfully loaded {} objects".format(len(objs)))
+    return loaded if as_dict else None
+
+
+def concrete_models(model):
+    """the model (unless it's abstract) and its non-abstract subclasses"""
+    concrete = set(filter(lambda m: not m.Meta.abstract, walk_subclasses(model)))
+    if not model.Meta.abstract:
+        concrete.add(model)
+    logger.debug("binding non-abstract models {}".format(
+        sorted(c.__name__ for c in concrete)
+    ))
+    return concrete
+
+
+def validate_batch_write(objs, condition, atomic):
+    if condition or atomic:
+        raise InvalidCondition("Batched writes can not use a condition or atomic.")
+    for obj in objs:
+        if obj.Meta.version is not None:
+            raise InvalidCondition(
+                "Batched writes can not check the version of {!r}.".format(obj.__class__.__name__))
+
+
+def validate_no_actions(objs):
+    for obj in objs:
+        if any(isinstance(value, Action) for value in obj.__dict__.values()):
+            raise InvalidCondition(
+                "Batched saves can not apply update actions to {!r}.".format(obj.__class__.__name__))
+
+
+def bump_version(obj):
+    """Set the object's version column to the value its save just wrote, if the model has one."""
+    if obj.Meta.version is not None:
+        setattr(obj, obj.Meta.version.name, next_version(obj))
+
+
+def is_unchanged(engine, obj, condition, atomic, request):
+    """True if saving an object that was already loaded or saved wouldn't write or check anything.
+
+    A versioned model always checks and increments its version, so only its other columns are compared."""
+    if condition or atomic:
+        return False
+    # Never synced, so the item may not exist yet and the update would create it
+    if get_tracking(obj)["synced"] is None:
+        return False
+    if obj.Meta.version is None:
+        return "UpdateExpression" not in request and "ConditionExpression" not in request
+    renderer = ConditionRenderer(engine)
+    renderer.render_update_expression(obj, include_version=False)
+    return "UpdateExpression" not in renderer.expressions
+
+
 def validate_not_abstract(*objs):
     for obj in objs:
         if obj.Meta.abstract:
@@ -120,16 +250,30 @@ class Engine:
     :param table_name_template: Customize the table name of each model bound to the engine.  If a string
         is provided, string.format(table_name=model.Meta.table_name) will be called.  If a function is provided, the
         function will be called with the model as its sole argument.  Defaults to "{table_name}".
+    :param session: *(Optional)* A :class:`~bloop.session.SessionWrapper` to use instead of building one from
+        ``dynamodb`` and ``dynamodbstreams``.  Use this to configure the session, for example
+        ``SessionWrapper(max_workers=8)``.  Can't be used with ``dynamodb`` or ``dynamodbstreams``.
     """
     def __init__(
             self, *,
             dynamodb=None, dynamodbstreams=None,
-            table_name_template: Union[str, TableNameFormatter] = "{table_name}"):
+            table_name_template: Union[str, TableNameFormatter] = "{table_name}",
+            session: SessionWrapper = None):
         self._compute_table_name = create_get_table_name_func(table_name_template)
-        self.session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams)
+        if session is None:
+            session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams)
+        elif dynamodb is not None or dynamodbstreams is not None:
+            raise ValueError("session can't be used with dynamodb or dynamodbstreams")
+        self.session = session
+        # Shared by every load and dump that isn't given a context
+        self._context = {"engine": self}
+        #: Number of saves that weren't sent because the object had no changes and no condition
+        self.skipped_saves = 0
+        #: Reuses rendered expressions for requests with the same shape.  Set to None to render every request.
+        self.render_cache = RenderCache()
 
     def _dump(self, model, obj, context=None, **kwargs):
-        context = context or {"engine": self}
+        context = context or self._context
         try:
             dump = model._dump
         except AttributeError as e:
@@ -138,7 +282,7 @@ class Engine:
             return dump(obj, context=context, **kwargs)
 
     def _load(self, model, value, context=None, **kwargs):
-        context = context or {"engine": self}
+        context = context or self._context
         try:
             load = model._load
         except AttributeError as e:
@@ -146,131 +290,182 @@ class Engine:
         else:
             return load(value, context=context, **kwargs)
 
-    def bind(self, model, *, skip_table_setup=False):
-        """Create backing tables for a model and its non-abstract subclasses.
+    # The methods below build each request and handle each result for both Engine and AsyncEngine,
+    # which only differ in how they call the session.
 
-        :param model: Base model to bind.  Can be abstract.
-        :param skip_table_setup: Don't create or verify the table in DynamoDB.  Default is False.
-        :raises bloop.exceptions.InvalidModel: if ``model`` is not a subclass of :class:`~bloop.models.BaseModel`.
-        """
+    def _models_to_bind(self, model, skip_table_setup):
         # Make sure we're looking at models
         validate_is_model(model)
-
-        concrete = set(filter(lambda m: not m.Meta.abstract, walk_subclasses(model)))
-        if not model.Meta.abstract:
-            concrete.add(model)
-        logger.debug("binding non-abstract models {}".format(
-            sorted(c.__name__ for c in concrete)
-        ))
+        concrete = concrete_models(model)
 
         # create_table doesn't block until ACTIVE or validate.
         # It also doesn't throw when the table already exists, making it safe
         # to call multiple times for the same unbound model.
         if skip_table_setup:
             logger.info("skip_table_setup is True; not trying to create tables or validate models during bind")
+        return concrete
+
+    def _before_create_table(self, model):
+        table_name = self._compute_table_name(model)
+        before_create_table.send(self, engine=self, model=model)
+        return table_name
+
+    def _setup_table(self, model, is_creating):
+        table_name = self._compute_table_name(model)
+        if is_creating:
+            # polls until table is active
+            self.session.describe_table(table_name)
+            if model.Meta.ttl:
+                self.session.enable_ttl(table_name, model)
+            if model.Meta.backups and model.Meta.backups["enabled"]:
+                self.session.enable_backups(table_name, model)
+        self.session.validate_table(table_name, model)
+
+    def _bound(self, model):
+        model_validated.send(self, engine=self, model=model)
+        model_bound.send(self, engine=self, model=model)
+
+    def _delete_request(self, obj, condition, atomic):
+        return {
+            "TableName": self._compute_table_name(obj.__class__),
+            "Key": dump_key(self, obj),
+            **render(self, obj=obj, atomic=atomic, condition=condition, cache=self.render_cache)
+        }
+
+    def _batch_delete_request(self, objs, condition, atomic):
+        validate_batch_write(objs, condition, atomic)
+        return batch_write_request(self, objs, lambda obj, key: {"DeleteRequest": {"Key": key}})
+
+    def _save_request(self, obj, condition, atomic):
+        """The UpdateItem request for an object, or None when the save is skipped"""
+        request = render(self, obj=obj, atomic=atomic, condition=condition, update=True, cache=self.render_cache)
+        if is_unchanged(self, obj, condition, atomic, request):
+            self.skipped_saves += 1
+            return None
+        return {
+            "TableName": self._compute_table_name(obj.__class__),
+            "Key": dump_key(self, obj),
+            **request
+        }
+
+    def _batch_save_request(self, objs, condition, atomic):
+        validate_batch_write(objs, condition, atomic)
+        validate_no_actions(objs)
+        return batch_write_request(
+            self, objs, lambda obj, key: {"PutRequest": {"Item": self._dump(obj.__class__, obj)}})
+
+    def _saved(self, obj):
+        bump_version(obj)
+        object_saved.send(self, engine=self, obj=obj)
 
+    def bind(self, model, *, skip_table_setup=False):
+        """Create backing tables for a model and its non-abstract subclasses.
+
+        :param model: Base model to bind.  Can be abstract.
+        :param skip_table_setup: Don't create or verify the table in DynamoDB.  Default is False.
+        :raises bloop.exceptions.InvalidModel: if ``model`` is not a subclass of :class:`~bloop.models.BaseModel`.
+        """
+        concrete = self._models_to_bind(model, skip_table_setup)
         is_creating = {}
 
         for model in concrete:
-            table_name = self._compute_table_name(model)
-            before_create_table.send(self, engine=self, model=model)
+            table_name = self._before_create_table(model)
             if not skip_table_setup:
-                creating = self.session.create_table(table_name, model)
-                is_creating[model] = creating
+                is_creating[model] = self.session.create_table(table_name, model)
 
         for model in concrete:
             if not skip_table_setup:
-                table_name = self._compute_table_name(model)
-                if is_creating[model]:
-                    # polls until table is active
-                    self.session.describe_table(table_name)
-                    if model.Meta.ttl:
-                        self.session.enable_ttl(table_name, model)
-                    if model.Meta.backups and model.Meta.backups["enabled"]:
-                        self.session.enable_backups(table_name, model)
-                self.session.validate_table(table_name, model)
-
-            model_validated.send(self, engine=self, model=model)
-
-            model_bound.send(self, engine=self, model=model)
+                self._setup_table(model, is_creating[model])
+            self._bound(model)
 
         logger.info("successfully bound {} models to the engine".format(len(concrete)))
 
-    def delete(self, *objs, condition=None, atomic=False):
+    def delete(self, *objs, condition=None, atomic=False, batch=False):
         """Delete one or more objects.
 
         :param objs: objects to delete.
         :param condition: only perform each delete if this condition holds.
         :param bool atomic: only perform each delete if the local and DynamoDB versions of the object match.
-        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic) is not met.
+        :param bool batch: send the deletes in chunks of 25 with `BatchWriteItem`__.  Batched deletes can't use
+            a condition or atomic.  Default is False.
+        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic, or the version) is not met.
+        :raises bloop.exceptions.InvalidCondition: if batch is True and a condition or atomic is provided,
+            or an object's model has a version column.
+
+        __ http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_BatchWriteItem.html
         """
         objs = set(objs)
         validate_not_abstract(*objs)
+        if batch:
+            self.session.write_items(self._batch_delete_request(objs, condition, atomic))
+            for obj in objs:
+                object_deleted.send(self, engine=self, obj=obj)
+            logger.info("successfully deleted {} objects".format(len(objs)))
+            return
         for obj in objs:
-            self.session.delete_item({
-                "TableName": self._compute_table_name(obj.__class__),
-                "Key": dump_key(self, obj),
-                **render(self, obj=obj, atomic=atomic, condition=condition)
-            })
+            self.session.delete_item(self._delete_request(obj, condition, atomic))
             object_deleted.send(self, engine=self, obj=obj)
         logger.info("successfully deleted {} objects".format(len(objs)))
 
-    def load(self, *objs, consistent=False):
+    def find(self, model, condition=None, projection="all", consistent=False, prefetch=0, as_dict=False, lazy=False):
+        """Search for the objects that match a condition, using the best query or scan for it.
+
+        The condition's top-level AND terms are split into a key condition and a filter for the table or the index
+        that matches the most key columns.  An index that doesn't include every column that's needed is searched
+        for keys, and the full items are loaded from the table.  When no index can be queried, the table is scanned.
+
+        .. code-block:: pycon
+
+            >>> users = engine.find(User, (User.email == "user@domain.com") & (User.age > 30))
+            >>> print(users.plan.explain())
+            Query User.by_email
+              key: (User.email == 'user@domain.com')
+              filter: (User.age > 30)
+
+        :param model: A model to search.  For example, ``User``.
+        :param condition: Condition that each result must match.  Default is None (every object).
+        :param projection: "all", a list of column names, or a list of :class:`~bloop.models.Column`.  "all"
+            includes every column of the model, even when an index is searched.
+        :param bool consistent: Use `strongly consistent reads`__ if True.  GSIs are never used.  Default is False.
+        :param int prefetch: Number of pages to request in a background thread while the current page is consumed.
+        :param bool as_dict: Return a dict of loaded values by column name for each result instead of a model
+            instance.  Default is False.
+        :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+            Default is False.
+        :return: A reusable search iterator, whose ``plan`` is the chosen :class:`~bloop.search.Plan`.
+        :rtype: :class:`~bloop.search.QueryIterator`, :class:`~bloop.search.ScanIterator`, or
+            :class:`~bloop.search.FetchIterator`
+
+        __ http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/HowItWorks.ReadConsistency.html
+        """
+        validate_not_abstract(model)
+        plan = plan_search(self, model, condition, projection=projection, consistent=consistent)
+        return plan.search(self, prefetch=prefetch, as_dict=as_dict, lazy=lazy)
+
+    def load(self, *objs, consistent=False, as_dict=False, lazy=False):
         """Populate objects from DynamoDB.
 
         :param objs: objects to delete.
         :param bool consistent: Use `strongly consistent reads`__ if True.  Default is False.
+        :param bool as_dict: Don't modify the objects or send ``object_loaded``.  Instead, return a dict that maps
+            each object to a dict of its loaded values by column name.  Default is False.
+        :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+            Default is False.
+        :return: None, or a dict of loaded values for each object when ``as_dict`` is True.
         :raises bloop.exceptions.MissingKey: if any object doesn't provide a value for a key column.
         :raises bloop.exceptions.MissingObjects: if one or more objects aren't loaded.
 
         __ http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/HowItWorks.ReadConsistency.html
         """
-        get_table_name = self._compute_table_name
         objs = set(objs)
         validate_not_abstract(*objs)
-
-        table_index, object_index, request = {}, {}, {}
-
-        for obj in objs:
-            table_name = get_table_name(obj.__class__)
-            key = dump_key(self, obj)
-            index = index_for(key)
-
-            if table_name not in object_index:
-                table_index[table_name] = list(sorted(key.keys()))
-                object_index[table_name] = {}
-                request[table_name] = {"Keys": [], "ConsistentRead": consistent}
-
-            if index not in object_index[table_name]:
-                request[table_name]["Keys"].append(key)
-                object_index[table_name][index] = set()
-            object_index[table_name][index].add(obj)
-
+        request, table_index, object_index = load_request(self, objs, consistent)
         response = self.session.load_items(request)
+        return unpack_load_response(self, objs, response, table_index, object_index, as_dict=as_dict, lazy=lazy)
 
-        for table_name, list_of_attrs in response.items():
-            for attrs in list_of_attrs:
-                key_shape = table_index[table_name]
-                key = extract_key(key_shape, attrs)
-                index = index_for(key)
-
-                for obj in object_index[table_name].pop(index):
-                    unpack_from_dynamodb(
-                        attrs=attrs, expected=obj.Meta.columns, engine=self, obj=obj)
-                    object_loaded.send(self, engine=self, obj=obj)
-                if not object_index[table_name]:
-                    object_index.pop(table_name)
-
-        if object_index:
-            not_loaded = set()
-            for index in object_index.values():
-                for index_set in index.values():
-                    not_loaded.update(index_set)
-            logger.warning("loaded {} of {} objects".format(len(objs) - len(not_loaded), len(objs)))
-            raise MissingObjects("Failed to load some objects.", objects=not_loaded)
-        logger.info("successfully loaded {} objects".format(len(objs)))
-
-    def query(self, model_or_index, key, filter=None, projection="all", consistent=False, forward=True):
+    def query(
+            self, model_or_index, key, filter=None, projection="all", consistent=False, forward=True,
+            prefetch=0, as_dict=False, lazy=False, fetch=False):
         """Create a reusable :class:`~bloop.search.QueryIterator`.
 
         :param model_or_index: A model or index to query.  For example, ``User`` or ``User.by_email``.
@@ -283,8 +478,19 @@ class Engine:
             "count", you must advance the iterator to retrieve the count.
         :param bool consistent: Use `strongly consistent reads`__ if True.  Default is False.
         :param bool forward:  Query in ascending or descending order.  Default is True (ascending).
-
-        :return: A reusable query iterator with helper methods.
+        :param int prefetch: Number of pages to request in a background thread while the current page is consumed.
+            ``count``, ``scanned``, and ``exhausted`` only include pages that have been consumed.  Default is 0.
+        :param bool as_dict: Return a dict of loaded values by column name for each result instead of a model
+            instance.  No objects are created and no signals are sent.  Default is False.
+        :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+            Default is False.
+        :param bool fetch: Query for keys only, then load each result's full item from the table with
+            ``BatchGetItem``.  The projection can include any of the model's columns, even when the index doesn't.
+            Results keep the query's order, and only ``prefetch`` pages (at least 1) are loaded at once.
+            Default is False.
+
+        :return: A reusable query iterator with helper methods.  When fetch is True, a
+            :class:`~bloop.search.FetchIterator`.
         :rtype: :class:`~bloop.search.QueryIterator`
 
         __ http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/HowItWorks.ReadConsistency.html
@@ -296,29 +502,49 @@ class Engine:
         validate_not_abstract(model)
         q = Search(
             mode="query", engine=self, model=model, index=index, key=key, filter=filter,
-            projection=projection, consistent=consistent, forward=forward)
+            projection=projection, consistent=consistent, forward=forward, prefetch=prefetch, as_dict=as_dict,
+            lazy=lazy, fetch=fetch)
         return iter(q.prepare())
 
-    def save(self, *objs, condition=None, atomic=False):
+    def save(self, *objs, condition=None, atomic=False, batch=False):
         """Save one or more objects.
 
+        An object that was already loaded or saved is skipped when there's no ``condition``, ``atomic`` is False, and
+        it has nothing to update: no marked columns besides its keys (and version), or only documents that didn't
+        change.  A versioned object that's skipped keeps its version.  Skipped objects don't send ``object_saved``,
+        and are counted in :attr:`skipped_saves`.
+
         :param objs: objects to save.
         :param condition: only perform each save if this condition holds.
         :param bool atomic: only perform each save if the local and DynamoDB versions of the object match.
-        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic) is not met.
+        :param bool batch: send the saves in chunks of 25 with `BatchWriteItem`__.  Each object **replaces** the
+            existing item, instead of updating the columns that changed.  Batched saves can't use a condition or
+            atomic.  Default is False.
+        :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic, or the version) is not met.
+        :raises bloop.exceptions.InvalidCondition: if batch is True and a condition or atomic is provided,
+            an object's model has a version column, or an object has a column set to an update action.
+
+        __ http://docs.aws.amazon.com/amazondynamodb/latest/APIReference/API_BatchWriteItem.html
         """
         objs = set(objs)
         validate_not_abstract(*objs)
+        if batch:
+            self.session.write_items(self._batch_save_request(objs, condition, atomic))
+            for obj in objs:
+                self._saved(obj)
+            logger.info("successfully saved {} objects".format(len(objs)))
+            return
         for obj in objs:
-            self.session.save_item({
-                "TableName": self._compute_table_name(obj.__class__),
-                "Key": dump_key(self, obj),
-                **render(self, obj=obj, atomic=atomic, condition=condition, update=True)
-            })
-            object_saved.send(self, engine=self, obj=obj)
+            request = self._save_request(obj, condition, atomic)
+            if request is None:
+                continue
+            self.session.save_item(request)
+            self._saved(obj)
         logger.info("successfully saved {} objects".format(len(objs)))
 
-    def scan(self, model_or_index, filter=None, projection="all", consistent=False, parallel=None):
+    def scan(
+            self, model_or_index, filter=None, projection="all", consistent=False, parallel=None,
+            prefetch=0, as_dict=False, lazy=False):
         """Create a reusable :class:`~bloop.search.ScanIterator`.
 
         :param model_or_index: A model or index to scan.  For example, ``User`` or ``User.by_email``.
@@ -327,9 +553,17 @@ class Engine:
             "all", "count", a list of column names, or a list of :class:`~bloop.models.Column`.  When projection is
             "count", you must exhaust the iterator to retrieve the count.
         :param bool consistent: Use `strongly consistent reads`__ if True.  Default is False.
-        :param tuple parallel: Perform a `parallel scan`__.  A tuple of (Segment, TotalSegments)
-            for this portion the scan. Default is None.
-        :return: A reusable scan iterator with helper methods.
+        :param parallel: Perform a `parallel scan`__.  A tuple of (Segment, TotalSegments) for this portion the
+            scan, or the number of segments to scan at once from a thread pool.  "auto" picks the number of segments
+            from the number of cpus.  Default is None.
+        :param int prefetch: Number of pages to request in a background thread while the current page is consumed.
+            ``count``, ``scanned``, and ``exhausted`` only include pages that have been consumed.  Default is 0.
+        :param bool as_dict: Return a dict of loaded values by column name for each result instead of a model
+            instance.  No objects are created and no signals are sent.  Default is False.
+        :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+            Default is False.
+        :return: A reusable scan iterator with helper methods.  When parallel is a number of segments or "auto",
+            a :class:`~bloop.search.ParallelScanIterator`.
         :rtype: :class:`~bloop.search.ScanIterator`
 
         __ http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/HowItWorks.ReadConsistency.html
@@ -342,7 +576,8 @@ class Engine:
         validate_not_abstract(model)
         s = Search(
             mode="scan", engine=self, model=model, index=index, filter=filter,
-            projection=projection, consistent=consistent, parallel=parallel)
+            projection=projection, consistent=consistent, parallel=parallel, prefetch=prefetch,
+            as_dict=as_dict, lazy=lazy)
         return iter(s.prepare())
 
     def stream(self, model, position):
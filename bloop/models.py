@@ -1,12 +1,13 @@
 import collections
 import collections.abc
+import functools
 import inspect
 import logging
 from copy import copy as copyfn
 from typing import Callable, Dict, Optional, Set
 
 from . import util
-from .conditions import ComparisonMixin
+from .conditions import ComparisonMixin, mark_loaded, only_tracking_modified
 from .exceptions import InvalidModel, InvalidStream
 from .signals import model_created, object_modified
 from .types import DateTime, Number, Type
@@ -52,6 +53,7 @@ class IMeta:
     ttl: Optional[Dict]
     encryption: Optional[Dict]
     backups: Optional[Dict]
+    version: Optional["Column"]
 
     model: "BaseModel"
 
@@ -87,7 +89,11 @@ class BaseModel:
     By default, the ``__init__`` method is not called when new instances are
     required, for example when iterating results from Query, Scan or a Stream.
 
+    Each instance keeps its tracking state for atomic conditions and updates in a slot.
+
     """
+    __slots__ = ("_bloop_tracking",)
+
     class Meta(IMeta):
         abstract = True
 
@@ -193,6 +199,7 @@ class BaseModel:
         validate_ttl(meta)
         validate_encryption(meta)
         validate_backups(meta)
+        validate_version(meta)
 
         # 3.0 Fire model_created for customizing the class after creation
         model_created.send(None, model=cls)
@@ -211,14 +218,14 @@ class BaseModel:
         """ obj -> dict """
         if obj is None:
             return None
-        dump = context["engine"]._dump
-        filtered = filter(
-            lambda item: item[1] is not None,
-            ((
-                column.dynamo_name,
-                dump(column.typedef, getattr(obj, column.name, None), context=context, **kwargs)
-            ) for column in cls.Meta.columns))
-        return dict(filtered) or None
+        return cls.Meta._dumper(obj, context, kwargs)
+
+    def __getstate__(self):
+        # Copies and pickles get their own column values, and never the tracking state
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
 
     def __repr__(self):
         attrs = ", ".join("{}={!r}".format(*item) for item in loaded_columns(self))
@@ -514,9 +521,14 @@ class Column(ComparisonMixin):
         if self._name is None:
             raise AttributeError("Can't get field without binding to model")
         try:
-            return obj.__dict__[self._name]
+            value = obj.__dict__[self._name]
         except KeyError:
             raise AttributeError(f"'{obj.__class__}' has no attribute '{self._name}'")
+        if isinstance(value, util.LazyValue):
+            # Loaded with lazy=True and this is the first read.  The column was already marked when it was
+            # unpacked, so replacing the placeholder doesn't send object_modified.
+            value = obj.__dict__[self._name] = value.load()
+        return value
 
     def __delete__(self, obj):
         try:
@@ -582,8 +594,12 @@ def loaded_columns(obj: BaseModel):
             yield column.name, value
 
 
-def unpack_from_dynamodb(*, attrs, expected, model=None, obj=None, engine=None, context=None, **kwargs):
-    """Push values by dynamo_name into an object"""
+def unpack_from_dynamodb(
+        *, attrs, expected, model=None, obj=None, engine=None, context=None, lazy=False, **kwargs):
+    """Push values by dynamo_name into an object
+
+    When lazy is True, each value that's present is kept in its DynamoDB form until the column is first read.
+    """
     context = context or {"engine": engine}
     engine = engine or context.get("engine", None)
     if not engine:
@@ -595,13 +611,120 @@ def unpack_from_dynamodb(*, attrs, expected, model=None, obj=None, engine=None,
     if model:
         obj = model.Meta.init()
 
-    for column in expected:
-        value = attrs.get(column.dynamo_name, None)
-        value = engine._load(column.typedef, value, context=context, **kwargs)
-        setattr(obj, column.name, value)
+    loader = loader_for(obj, expected)
+    values, loaded = loader(attrs, context, lazy, kwargs)
+    if loader.default_set and can_bulk_load(obj, ()):
+        obj.__dict__.update(values)
+        mark_loaded(obj, loaded)
+    else:
+        for name, value in values.items():
+            setattr(obj, name, value)
     return obj
 
 
+def can_bulk_load(obj, columns):
+    """True if unpacking can write to the object's __dict__ and mark every column at once.
+
+    Only when setting each column wouldn't do anything else: the model and columns don't override
+    ``__setattr__`` or ``__set__``, and nothing besides bloop's tracking receives object_modified.
+    """
+    if type(obj).__setattr__ is not object.__setattr__ or not hasattr(obj, "__dict__"):
+        return False
+    if not all(type(column).__set__ is Column.__set__ for column in columns):
+        return False
+    return only_tracking_modified()
+
+
+def resolve_typedef(typedef, method):
+    """Look up a typedef's ``_load`` or ``_dump`` once, instead of through the engine for every value.
+
+    Typedefs without the method fall back to the engine at call time, which raises UnknownType.
+    """
+    resolved = getattr(typedef, method, None)
+    if resolved is not None:
+        return resolved
+
+    def through_engine(value, *, context, **kwargs):
+        return getattr(context["engine"], method)(typedef, value, context=context, **kwargs)
+    return through_engine
+
+
+def compile_loader(columns):
+    """Build a function that loads each of the columns from a dict of DynamoDB attributes.
+
+    The function returns two dicts: the loaded values by column name, and the DynamoDB value of each column
+    (None when it's missing).  It has a ``default_set`` attribute that's True when none of the columns
+    override ``__set__``.
+    """
+    plan = tuple(
+        (column, column.name, column.dynamo_name, resolve_typedef(column.typedef, "_load"))
+        for column in columns)
+
+    def load(attrs, context, lazy, kwargs):
+        values, loaded = {}, {}
+        for column, name, dynamo_name, load_value in plan:
+            value = loaded[column] = attrs.get(dynamo_name, None)
+            if lazy and value is not None:
+                values[name] = util.LazyValue(value, functools.partial(load_value, value, context=context, **kwargs))
+            else:
+                values[name] = load_value(value, context=context, **kwargs)
+        return values, loaded
+    load.size = len(plan)
+    load.default_set = all(type(column).__set__ is Column.__set__ for column in columns)
+    return load
+
+
+def compile_dumper(columns):
+    """Build a function that dumps an object's columns into a dict by dynamo_name, or None if it's empty."""
+    plan = tuple((column.name, column.dynamo_name, resolve_typedef(column.typedef, "_dump")) for column in columns)
+
+    def dump(obj, context, kwargs):
+        dumped = {}
+        for name, dynamo_name, dump_value in plan:
+            value = dump_value(getattr(obj, name, None), context=context, **kwargs)
+            if value is not None:
+                dumped[dynamo_name] = value
+        return dumped or None
+    return dump
+
+
+def compile_model(meta):
+    """Rebuild the model's load and dump functions after its columns change."""
+    meta._loader = compile_loader(meta.columns)
+    meta._dumper = compile_dumper(meta.columns)
+    meta._loaders = {}
+
+
+def loader_for(obj, expected):
+    """The load function for a set of an object's columns: all of them, or a projection cached on the model."""
+    meta = getattr(obj, "Meta", None)
+    if getattr(meta, "_loaders", None) is None:
+        return compile_loader(expected)
+    if expected is meta.columns and len(expected) == meta._loader.size:
+        return meta._loader
+    key = frozenset(expected)
+    loader = meta._loaders.get(key)
+    if loader is None:
+        loader = meta._loaders[key] = compile_loader(key)
+    return loader
+
+
+def unpack_dict_from_dynamodb(*, attrs, expected, engine=None, context=None, **kwargs):
+    """Load values by dynamo_name into a dict by column name, without creating an object or sending signals.
+
+    Columns that aren't in attrs are left out of the dict.
+    """
+    context = context or {"engine": engine}
+    engine = engine or context.get("engine", None)
+    if not engine:
+        raise ValueError("You must provide engine or a context with an engine.")
+    return {
+        column.name: engine._load(column.typedef, attrs[column.dynamo_name], context=context, **kwargs)
+        for column in expected
+        if column.dynamo_name in attrs
+    }
+
+
 def validate_projection(projection):
     validated_projection = {
         "mode": None,
@@ -715,6 +838,28 @@ def validate_ttl(meta):
     ttl.setdefault("enabled", "disabled")
 
 
+def validate_version(meta):
+    version = meta.version
+    if version is None:
+        return
+    if isinstance(version, Column):
+        # late-bind to column by name in case it was re-bound since declaration
+        version = version.name
+    if not isinstance(version, str):
+        raise InvalidModel("Version must be None, a column name, or a column instance.")
+    try:
+        version = meta.columns_by_name[version]
+    except KeyError:
+        raise InvalidModel(f"Version column {version!r} is not a column of {meta.model.__name__}.") from None
+    if version.typedef.backing_type != Number.backing_type:
+        raise InvalidModel(
+            "Version column must be a number with backing_type 'N' but was "
+            f"{version.typedef.backing_type!r} instead.")
+    if version in meta.keys:
+        raise InvalidModel("Version column can't be a hash or range key.")
+    meta.version = version
+
+
 def unbound_repr(obj):
     class UNBOUND:
         pass
@@ -773,6 +918,7 @@ def initialize_meta(cls: type):
     setdefault(meta, "ttl", None)
     setdefault(meta, "encryption", None)
     setdefault(meta, "backups", None)
+    setdefault(meta, "version", None)
 
     setdefault(meta, "hash_key", None)
     setdefault(meta, "range_key", None)
@@ -794,6 +940,7 @@ def initialize_meta(cls: type):
         "strict": True
     })
 
+    compile_model(meta)
     return meta
 
 
@@ -909,6 +1056,7 @@ def bind_column(model, name, column, force=False, recursive=False, copy=False) -
     except KeyError as e:
         raise InvalidModel(
             f"Binding column {column} removed a required column for index {unbound_repr(index)}") from e
+    compile_model(meta)
 
     if recursive:
         for subclass in util.walk_subclasses(meta.model):
@@ -1119,6 +1267,7 @@ def unbind(meta, name=None, dynamo_name=None) -> None:
             meta.range_key = None
 
         delattr(meta.model, column.name)
+        compile_model(meta)
 
     if indexes:
         [index] = indexes
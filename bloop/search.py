@@ -1,12 +1,38 @@
 import collections
-
-from .conditions import BaseCondition, iter_columns, render
+import concurrent.futures
+import os
+import queue
+import threading
+import weakref
+
+from .conditions import (
+    MAX_EXPRESSION_LENGTH,
+    AndCondition,
+    BaseCondition,
+    ComparisonMixin,
+    OrCondition,
+    compile_condition,
+    iter_columns,
+    normalize,
+    render,
+)
 from .exceptions import ConstraintViolation, InvalidSearch
-from .models import Column, GlobalSecondaryIndex, unpack_from_dynamodb
+from .models import Column, GlobalSecondaryIndex, unpack_dict_from_dynamodb, unpack_from_dynamodb
 from .signals import object_loaded
 
 
-__all__ = ["ScanIterator", "QueryIterator"]
+__all__ = [
+    "FetchIterator", "MultiSearchIterator", "Page", "ParallelScanIterator", "Plan", "ScanIterator", "QueryIterator"]
+
+# DynamoDB accepts at most this many segments in a parallel scan
+MAX_SEGMENTS = 1000000
+
+Page = collections.namedtuple("Page", ["items", "last_evaluated_key", "consumed_capacity"])
+Page.__doc__ = """One page of search results from :func:`~bloop.search.SearchIterator.iter_pages`.
+
+Holds the page's ``items``, the ``last_evaluated_key`` to continue from (None on the last page), and the
+``consumed_capacity`` that DynamoDB returned.  Searches ask for the capacity of the table and each index they use.
+"""
 
 
 def printable_query(query_on):
@@ -35,6 +61,66 @@ def validate_search_mode(mode):
         raise InvalidSearch("{!r} is not a valid search mode.".format(mode))
 
 
+def validate_prefetch(prefetch):
+    if not isinstance(prefetch, int) or isinstance(prefetch, bool) or prefetch < 0:
+        raise InvalidSearch("prefetch must be a non-negative integer, not {!r}.".format(prefetch))
+
+
+def validate_parallel(parallel):
+    if not parallel or parallel == "auto" or isinstance(parallel, tuple):
+        return
+    if not isinstance(parallel, int) or isinstance(parallel, bool) or not (0 < parallel <= MAX_SEGMENTS):
+        raise InvalidSearch(
+            "parallel must be a (Segment, TotalSegments) tuple, \"auto\", "
+            "or a number of segments from 1 to {}, not {!r}.".format(MAX_SEGMENTS, parallel))
+
+
+def auto_segments():
+    """Number of segments for ``parallel="auto"``.  Same as the default worker count of a ThreadPoolExecutor."""
+    return min(32, (os.cpu_count() or 1) + 4)
+
+
+def key_of(item, names):
+    """A hashable key for an item from the DynamoDB values of its key columns."""
+    return tuple(tuple(item[name].items()) for name in names)
+
+
+def split_filter(condition, render_filter):
+    """Splits a filter into filters that together match the same items, until each one renders within
+    :data:`~bloop.conditions.MAX_EXPRESSION_LENGTH`.
+
+    :param condition: A normalized filter condition.
+    :param render_filter: Called with each filter, returns the rendered request.
+    :return: The rendered request for each filter.
+    """
+    rendered = render_filter(condition)
+    if len(rendered["FilterExpression"].encode()) <= MAX_EXPRESSION_LENGTH:
+        return [rendered]
+    halves = halve(condition)
+    if halves is None:
+        raise InvalidSearch(
+            "The filter is longer than {} bytes and can't be split into shorter filters.".format(
+                MAX_EXPRESSION_LENGTH))
+    return [each for half in halves for each in split_filter(half, render_filter)]
+
+
+def halve(condition):
+    """Returns two conditions that together match the same items as the condition, or None if it can't be split.
+
+    An OR is split into its first and second half.  An AND is split on its first condition that can be split, and
+    the rest of its conditions are kept in both halves.  Nothing inside a NOT is split."""
+    if condition.operation == "or" and len(condition.values) > 1:
+        middle = len(condition.values) // 2
+        return [OrCondition(*condition.values[:middle]), OrCondition(*condition.values[middle:])]
+    if condition.operation == "and":
+        for i, value in enumerate(condition.values):
+            halves = halve(value)
+            if halves is not None:
+                before, after = condition.values[:i], condition.values[i + 1:]
+                return [AndCondition(*before, half, *after) for half in halves]
+    return None
+
+
 def validate_key_condition(model, index, key):
     # Model will always be provided, but Index has priority
     query_on = index or model.Meta
@@ -157,6 +243,166 @@ def fail_bad_range(query_on):
     raise InvalidSearch(msg.format(printable_query(query_on)))
 
 
+class Plan:
+    """How :func:`Engine.find <bloop.engine.Engine.find>` searches for the objects that match a condition.
+
+    :param str mode: Search type, either "query" or "scan".
+    :param model: :class:`~bloop.models.BaseModel` being searched.
+    :param index: :class:`~bloop.models.Index` to search, or None to search the table.
+    :param key: *(Query only)* Key condition.
+    :param filter: Filter condition sent with each request, or None.
+    :param set projected: Set of :class:`~bloop.models.Column` that are loaded for each result.
+    :param bool consistent: Use strongly consistent reads.
+    :param bool fetch: Search the index for keys, then load each result's full item from the table.
+    :param local: Condition that's evaluated against each full item after it's loaded, or None.
+    """
+    def __init__(self, *, mode, model, index, key, filter, projected, consistent, fetch=False, local=None):
+        self.mode = mode
+        self.model = model
+        self.index = index
+        self.key = key
+        self.filter = filter
+        self.projected = projected
+        self.consistent = consistent
+        self.fetch = fetch
+        self.local = local
+
+    def __repr__(self):
+        return search_repr(self.__class__, self.model, self.index)
+
+    def explain(self):
+        """A description of the plan, one step per line.
+
+        .. code-block:: pycon
+
+            >>> print(engine.find(User, User.email == "user@domain.com").plan.explain())
+            Query User.by_email
+              key: (User.email == 'user@domain.com')
+              fetch: full items from User with BatchGetItem
+        """
+        target = self.model.__name__
+        if self.index is not None:
+            target += "." + self.index.name
+        lines = ["{} {}".format(self.mode.capitalize(), target)]
+        if self.key is not None:
+            lines.append("  key: {!r}".format(self.key))
+        if self.filter is not None:
+            lines.append("  filter: {!r}".format(self.filter))
+        if self.fetch:
+            lines.append("  fetch: full items from {} with BatchGetItem".format(self.model.__name__))
+        if self.local is not None:
+            lines.append("  local filter: {!r}".format(self.local))
+        return "\n".join(lines)
+
+    def search(self, engine, *, prefetch=0, as_dict=False, lazy=False):
+        """Create the search iterator for this plan.  The iterator's ``plan`` is this plan."""
+        iterator = iter(Search(
+            mode=self.mode, engine=engine, model=self.model, index=self.index, key=self.key, filter=self.filter,
+            projection=list(self.projected), consistent=self.consistent, prefetch=prefetch, as_dict=as_dict,
+            lazy=lazy, fetch=self.fetch).prepare())
+        if self.fetch:
+            iterator.filter = self.local
+        iterator.plan = self
+        return iterator
+
+
+def plan_search(engine, model, condition=None, projection="all", consistent=False):
+    """Pick the cheapest way to find a model's objects that match a condition.
+
+    Each of the condition's top-level AND terms can be part of a key condition.  The table and each index that can
+    be queried with an ``==`` term against its hash key are candidates; GSIs aren't candidates for consistent
+    reads.  Candidates that also match a term against their range key are preferred, then candidates that don't
+    need to load full items from the table, then the table.  When no candidate can be queried, the table is scanned.
+
+    An index that doesn't include every column in the projection, or a column in one of the remaining terms, is
+    searched for keys only.  The full items are then loaded from the table, and the terms that the index can't
+    filter are evaluated locally.
+
+    :param engine: :class:`~bloop.engine.Engine` to normalize the condition with.
+    :param model: :class:`~bloop.models.BaseModel` to search.
+    :param condition: Condition that each result must match, or None.
+    :param projection: "all", a list of column names, or a list of :class:`~bloop.models.Column`.
+    :param bool consistent: Use strongly consistent reads.
+    :return: The chosen :class:`~bloop.search.Plan`.
+    """
+    if projection == "count":
+        raise InvalidSearch("Engine.find can't count results; use Engine.query or Engine.scan.")
+    projected = set(validate_search_projection(model, None, projection))
+    terms = []
+    if condition is not None:
+        condition = normalize(condition, engine)
+        if condition.operation == "and":
+            terms = list(condition.values)
+        elif condition:
+            terms = [condition]
+
+    best = None
+    for index in [None, *sorted(model.Meta.indexes, key=lambda index: index.name)]:
+        if consistent and isinstance(index, GlobalSecondaryIndex):
+            continue
+        plan = plan_query(model, index, terms, projected, consistent)
+        if plan is not None and (best is None or plan_rank(plan) > plan_rank(best)):
+            best = plan
+    if best is not None:
+        return best
+    return Plan(
+        mode="scan", model=model, index=None, key=None, filter=join_terms(terms),
+        projected=projected, consistent=consistent)
+
+
+def plan_query(model, index, terms, projected, consistent):
+    """A query plan for the model or one of its indexes, or None if the terms don't include its hash key."""
+    query_on = index or model.Meta
+    hash_key = find_key_term(query_on, terms, check_hash_key)
+    if hash_key is None:
+        return None
+    terms = [term for term in terms if term is not hash_key]
+    key = hash_key
+    range_key = find_key_term(query_on, terms, check_range_key)
+    if range_key is not None:
+        terms = [term for term in terms if term is not range_key]
+        key = AndCondition(hash_key, range_key)
+
+    # Query filters can't include the key columns
+    available, keys = query_on.projection["available"], set(query_on.keys)
+    filters, local = [], []
+    for term in terms:
+        columns = set(iter_columns(term))
+        if columns <= available and not columns & keys:
+            filters.append(term)
+        else:
+            local.append(term)
+    fetch = bool(local) or not projected <= available
+    # The table has every column, so only a term on its own keys could need a local filter
+    if fetch and index is None:
+        return None
+    return Plan(
+        mode="query", model=model, index=index, key=key, filter=join_terms(filters), projected=projected,
+        consistent=consistent, fetch=fetch, local=join_terms(local))
+
+
+def find_key_term(query_on, terms, check):
+    """The first term that's a valid key condition against a constant value, or None."""
+    for term in terms:
+        if check(query_on, term) and not any(
+                value is None or isinstance(value, ComparisonMixin) for value in term.values):
+            return term
+    return None
+
+
+def plan_rank(plan):
+    """Plans with a range key condition rank higher, then plans that don't fetch, then the table."""
+    return plan.key.operation == "and", not plan.fetch, plan.index is None
+
+
+def join_terms(terms):
+    if not terms:
+        return None
+    if len(terms) == 1:
+        return terms[0]
+    return AndCondition(*terms)
+
+
 class Search:
     """A user-created search object.
 
@@ -173,8 +419,17 @@ class Search:
         When projection is "count", you must advance the iterator to retrieve the count.
     :param bool consistent: Use `strongly consistent reads`__ if True.  Not applicable to GSIs.  Default is False.
     :param bool forward: *(Query only)* Use ascending or descending order.  Default is True (ascending).
-    :param tuple parallel: *(Scan only)* A tuple of (Segment, TotalSegments) for this portion of a `parallel scan`__.
-            Default is None.
+    :param parallel: *(Scan only)* A tuple of (Segment, TotalSegments) for this portion of a `parallel scan`__,
+        or the number of segments (or "auto") to scan at once with a :class:`~bloop.search.ParallelScanIterator`.
+        Default is None.
+    :param int prefetch: Number of pages to request in the background ahead of the page being consumed.
+        Default is 0 (only request a page when the buffer is empty).
+    :param bool as_dict: Return a dict of loaded values by column name for each result instead of a model instance.
+        Default is False.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.  Default is False.
+    :param bool fetch: Search for keys only, then load each result's full item from the table with a
+        :class:`~bloop.search.FetchIterator`.  The projection can include any of the model's columns.
+        Default is False.
 
     __ http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/HowItWorks.ReadConsistency.html
     __ http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/QueryAndScan.html#QueryAndScanParallelScan
@@ -182,7 +437,8 @@ class Search:
 
     def __init__(
             self, mode=None, engine=None, model=None, index=None, key=None, filter=None,
-            projection=None, consistent=False, forward=True, parallel=None):
+            projection=None, consistent=False, forward=True, parallel=None, prefetch=0, as_dict=False,
+            lazy=False, fetch=False):
         self.mode = mode
         self.engine = engine
         self.model = model
@@ -193,6 +449,10 @@ class Search:
         self.consistent = consistent
         self.forward = forward
         self.parallel = parallel
+        self.prefetch = prefetch
+        self.as_dict = as_dict
+        self.lazy = lazy
+        self.fetch = fetch
 
     def __repr__(self):
         return search_repr(self.__class__, self.model, self.index)
@@ -210,7 +470,11 @@ class Search:
             projection=self.projection,
             consistent=self.consistent,
             forward=self.forward,
-            parallel=self.parallel
+            parallel=self.parallel,
+            prefetch=self.prefetch,
+            as_dict=self.as_dict,
+            lazy=self.lazy,
+            fetch=self.fetch
         )
         return p
 
@@ -239,20 +503,30 @@ class PreparedSearch:
 
         self.forward = None
         self.parallel = None
+        self.prefetch = None
+        self.as_dict = False
+        self.lazy = False
+        self.fetch = False
 
         self._request = None
+        # One request per filter when the filter is too long for one request
+        self._requests = None
 
     def prepare(
             self, engine=None, mode=None, model=None, index=None, key=None,
-            filter=None, projection=None, consistent=None, forward=None, parallel=None):
+            filter=None, projection=None, consistent=None, forward=None, parallel=None, prefetch=0,
+            as_dict=False, lazy=False, fetch=False):
         """Validates the search parameters and builds the base request dict for each Query/Scan call."""
+        self.as_dict = as_dict
+        self.lazy = lazy
+        self.fetch = fetch
 
         self.prepare_iterator_cls(engine, mode)
         self.prepare_model(model, index, consistent)
         self.prepare_key(key)
         self.prepare_projection(projection)
         self.prepare_filter(filter)
-        self.prepare_constraints(forward, parallel)
+        self.prepare_constraints(forward, parallel, prefetch)
 
         self.prepare_request()
 
@@ -274,7 +548,13 @@ class PreparedSearch:
         validate_key_condition(self.model, self.index, self.key)
 
     def prepare_projection(self, projection):
-        self._projected_columns = validate_search_projection(self.model, self.index, projection)
+        if self.fetch:
+            if projection == "count":
+                raise InvalidSearch("A search that loads full items can't count them; set fetch to False.")
+            # Full items come from the table, so the projection isn't limited to the index
+            self._projected_columns = validate_search_projection(self.model, None, projection)
+        else:
+            self._projected_columns = validate_search_projection(self.model, self.index, projection)
 
         if self._projected_columns is None:
             self._projection_mode = "count"
@@ -294,18 +574,33 @@ class PreparedSearch:
         available_columns = (self.index or self.model.Meta).projection["available"]
         validate_filter_condition(self.filter, available_columns, column_blacklist)
 
-    def prepare_constraints(self, forward, parallel):
+    def prepare_constraints(self, forward, parallel, prefetch=0):
         self.forward = forward
         self.parallel = parallel
+        self.prefetch = prefetch
+        validate_prefetch(prefetch)
+        if self.mode == "scan":
+            validate_parallel(parallel)
+
+    @property
+    def segments(self):
+        """Number of segments a managed parallel scan runs at once, or None if this isn't a managed scan."""
+        if self.mode != "scan" or not self.parallel or isinstance(self.parallel, tuple):
+            return None
+        if self.parallel == "auto":
+            return auto_segments()
+        return self.parallel
 
     def prepare_request(self):
         request = self._request = {}
         request["TableName"] = self.engine._compute_table_name(self.model)
         request["ConsistentRead"] = self.consistent
+        # Each page reports the capacity it used, including each index, for Page.consumed_capacity
+        request["ReturnConsumedCapacity"] = "INDEXES"
 
         if self.mode == "scan":
-            if self.parallel:
-                request["Segments"], request["TotalSegments"] = self.parallel
+            if isinstance(self.parallel, tuple):
+                request["Segment"], request["TotalSegments"] = self.parallel
         else:
             request["ScanIndexForward"] = self.forward
 
@@ -320,20 +615,86 @@ class PreparedSearch:
             projected = None
         else:
             request["Select"] = "SPECIFIC_ATTRIBUTES"
-            projected = self._projected_columns
-
-        request.update(render(self.engine, filter=self.filter, projection=projected, key=self.key))
+            # Only the keys are needed to load the full items
+            projected = self.model.Meta.keys if self.fetch else self._projected_columns
+
+        rendered = render(
+            self.engine, filter=self.filter, projection=projected, key=self.key, cache=self.engine.render_cache)
+        self._requests = None
+        if len(rendered.get("FilterExpression", "").encode()) > MAX_EXPRESSION_LENGTH:
+            if self.fetch:
+                raise InvalidSearch("A search that loads full items can't split a filter that's too long.")
+            # Each result needs its key so that items matched by more than one filter are only returned once
+            keys = set(self.model.Meta.keys)
+            split_request = {**request, "Select": "SPECIFIC_ATTRIBUTES"}
+            split_projection = keys if projected is None else set(projected) | keys
+
+            def render_filter(filter):
+                return render(
+                    self.engine, filter=filter, projection=split_projection, key=self.key,
+                    cache=self.engine.render_cache)
+            self._requests = [
+                {**split_request, **each}
+                for each in split_filter(normalize(self.filter, self.engine), render_filter)]
+        request.update(rendered)
 
     def __repr__(self):
         return search_repr(self.__class__, self.model, self.index)
 
     def __iter__(self):
+        segments = self.segments
+        if self.fetch:
+            return FetchIterator(
+                engine=self.engine,
+                mode=self.mode,
+                model=self.model,
+                index=self.index,
+                request=self._request,
+                projected=self._projected_columns,
+                consistent=self.consistent,
+                prefetch=self.prefetch,
+                as_dict=self.as_dict,
+                lazy=self.lazy
+            )
+        if self._requests is not None:
+            requests = self._requests
+            if segments is not None:
+                requests = [
+                    {**request, "Segment": segment, "TotalSegments": segments}
+                    for request in requests for segment in range(segments)]
+            return MultiSearchIterator(
+                engine=self.engine,
+                mode=self.mode,
+                model=self.model,
+                index=self.index,
+                request=self._request,
+                requests=requests,
+                projected=self._projected_columns,
+                prefetch=self.prefetch,
+                as_dict=self.as_dict,
+                lazy=self.lazy
+            )
+        if segments is not None:
+            return ParallelScanIterator(
+                engine=self.engine,
+                model=self.model,
+                index=self.index,
+                request=self._request,
+                projected=self._projected_columns,
+                prefetch=self.prefetch,
+                as_dict=self.as_dict,
+                lazy=self.lazy,
+                segments=segments
+            )
         return self._iterator_cls(
             engine=self.engine,
             model=self.model,
             index=self.index,
             request=self._request,
-            projected=self._projected_columns
+            projected=self._projected_columns,
+            prefetch=self.prefetch,
+            as_dict=self.as_dict,
+            lazy=self.lazy
         )
 
 
@@ -345,12 +706,15 @@ class SearchIterator:
     :param index: :class:`~bloop.models.Index` to search, or None.
     :param dict request: The base request dict for each search.
     :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param int prefetch: Number of pages to request from a background thread while the current page is consumed.
+        Pages are only counted once they reach the buffer.  Default is 0.
     """
     mode = "<mode-placeholder>"
 
-    def __init__(self, *, session, model, index, request, projected):
+    def __init__(self, *, session, model, index, request, projected, prefetch=0):
         self.session = session
         self.request = request
+        self.prefetch = prefetch
 
         self.model = model
         self.index = index
@@ -362,6 +726,9 @@ class SearchIterator:
         self._scanned = 0
         self._exhausted = False
 
+        self._executor = None
+        self._pending = collections.deque()
+
     @property
     def count(self):
         """Number of items that have been loaded from DynamoDB so far, including buffered items."""
@@ -389,11 +756,16 @@ class SearchIterator:
     def first(self):
         """Return the first result.  If there are no results, raises :exc:`~bloop.exceptions.ConstraintViolation`.
 
+        Requests running in the background are stopped once the result is found.
+
         :return: The first result.
         :raises bloop.exceptions.ConstraintViolation: No results.
         """
         self.reset()
-        value = next(self, None)
+        try:
+            value = next(self, None)
+        finally:
+            self.close()
         if value is None:
             raise ConstraintViolation("{} did not find any results.".format(self.mode.capitalize()))
         return value
@@ -402,15 +774,27 @@ class SearchIterator:
         """Return the unique result.  If there is not exactly one result,
         raises :exc:`~bloop.exceptions.ConstraintViolation`.
 
+        Requests running in the background are stopped once the results are found.
+
         :return: The unique result.
         :raises bloop.exceptions.ConstraintViolation: Not exactly one result.
         """
-        first = self.first()
-        second = next(self, None)
+        self.reset()
+        try:
+            first = next(self, None)
+            second = next(self, None)
+        finally:
+            self.close()
+        if first is None:
+            raise ConstraintViolation("{} did not find any results.".format(self.mode.capitalize()))
         if second is not None:
             raise ConstraintViolation("{} found more than one result.".format(self.mode.capitalize()))
         return first
 
+    def close(self):
+        """Stop any pages being loaded in the background.  The next step continues from the last page returned."""
+        self._stop_prefetch()
+
     def reset(self):
         """Reset to the initial state, clearing the buffer and zeroing count and scanned."""
         self.buffer.clear()
@@ -418,12 +802,33 @@ class SearchIterator:
         self._scanned = 0
         self._exhausted = False
         self.request.pop("ExclusiveStartKey", None)
+        self._stop_prefetch()
 
     @property
     def exhausted(self):
         """True if there are no more results."""
         return self._exhausted and len(self.buffer) == 0
 
+    def iter_pages(self):
+        """Iterate the remaining results one DynamoDB page at a time.
+
+        Continues from the current position; any buffered results are returned first as their own page.  Pages can
+        be empty.  :attr:`count` and :attr:`scanned` are updated as each page is returned.
+
+        :return: A generator of :class:`~bloop.search.Page`.
+        """
+        if self.buffer:
+            yield self._pop_page(self.request.get("ExclusiveStartKey"), None)
+        while not self._exhausted:
+            response = self._next_response()
+            self._apply_response(response)
+            yield self._pop_page(response.get("LastEvaluatedKey"), response.get("ConsumedCapacity"))
+
+    def _pop_page(self, last_evaluated_key, consumed_capacity):
+        items = list(self.buffer)
+        self.buffer.clear()
+        return Page(items, last_evaluated_key or None, consumed_capacity)
+
     def __repr__(self):
         return search_repr(self.__class__, self.model, self.index)
 
@@ -432,15 +837,7 @@ class SearchIterator:
 
     def __next__(self):
         while (not self._exhausted) and len(self.buffer) == 0:
-            response = self.session.search_items(self.mode, self.request)
-            continuation_token = self.request["ExclusiveStartKey"] = response.get("LastEvaluatedKey", None)
-            self._exhausted = not continuation_token
-
-            self._count += response["Count"]
-            self._scanned += response["ScannedCount"]
-
-            # Each item is a dict of attributes
-            self.buffer.extend(response.get("Items", []))
+            self._apply_response(self._next_response())
 
         if self.buffer:
             return self.buffer.popleft()
@@ -449,6 +846,57 @@ class SearchIterator:
         # No more continue tokens (while not _exhausted)
         raise StopIteration
 
+    def _apply_response(self, response):
+        continuation_token = self.request["ExclusiveStartKey"] = response.get("LastEvaluatedKey", None)
+        self._exhausted = not continuation_token
+
+        self._count += response["Count"]
+        self._scanned += response["ScannedCount"]
+
+        # Each item is a dict of attributes
+        self.buffer.extend(response.get("Items", []))
+
+    def _next_response(self):
+        if not self.prefetch:
+            return self._request_page(self.request)
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._pending.append(self._executor.submit(self._fetch_page, dict(self.request), None))
+        future = self._pending.popleft()
+        # Each page needs the LastEvaluatedKey of the one before it, so queued fetches are chained.
+        # The single worker runs them in order; once the previous page has no key, the rest return None.
+        while len(self._pending) < self.prefetch:
+            previous = self._pending[-1] if self._pending else future
+            self._pending.append(self._executor.submit(self._fetch_page, dict(self.request), previous))
+        try:
+            response = future.result()
+        except Exception:
+            self._stop_prefetch()
+            raise
+        if not response.get("LastEvaluatedKey"):
+            self._stop_prefetch()
+        return response
+
+    def _fetch_page(self, request, previous):
+        if previous is not None:
+            response = previous.result()
+            if response is None or not response.get("LastEvaluatedKey"):
+                return None
+            request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        return self._request_page(request)
+
+    def _request_page(self, request):
+        return self.session.search_items(self.mode, request)
+
+    def _stop_prefetch(self):
+        # Any page already on the wire is discarded; the next fetch starts from request["ExclusiveStartKey"]
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
 
 class SearchModelIterator(SearchIterator):
     """Reusable search iterator that unpacks result dicts into model instances.
@@ -458,26 +906,52 @@ class SearchModelIterator(SearchIterator):
     :param index: :class:`~bloop.models.Index` to search, or None.
     :param dict request: The base request dict for each search call.
     :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param int prefetch: Number of pages to request from a background thread while the current page is consumed.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.  No objects are
+        created and ``object_loaded`` isn't sent.  Default is False.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.  Default is False.
     """
-    def __init__(self, *, engine, model, index, request, projected):
+    def __init__(self, *, engine, model, index, request, projected, prefetch=0, as_dict=False, lazy=False):
         self.engine = engine
+        self.as_dict = as_dict
+        self.lazy = lazy
 
         self.model = model
 
         super().__init__(
             session=engine.session, model=model, index=index,
-            request=request, projected=projected)
+            request=request, projected=projected, prefetch=prefetch)
 
-    def __next__(self):
-        attrs = super().__next__()
+    def iter_pages(self, raw=False):
+        """Iterate the remaining results one DynamoDB page at a time.
+
+        Continues from the current position; any buffered results are returned first as their own page.  Pages can
+        be empty.  :attr:`count` and :attr:`scanned` are updated as each page is returned.
+
+        :param bool raw: Return the attribute dicts of each page as DynamoDB sent them, instead of model instances (or
+            dicts of loaded values, when the iterator is ``as_dict``).  Default is False.
+        :return: A generator of :class:`~bloop.search.Page`.
+        """
+        for page in super().iter_pages():
+            if not raw:
+                page = page._replace(items=[self._unpack(attrs) for attrs in page.items])
+            yield page
+
+    def _unpack(self, attrs):
+        if self.as_dict:
+            return unpack_dict_from_dynamodb(attrs=attrs, expected=self.projected, engine=self.engine)
         obj = unpack_from_dynamodb(
             attrs=attrs,
             expected=self.projected,
             model=self.model,
-            engine=self.engine)
+            engine=self.engine,
+            lazy=self.lazy)
         object_loaded.send(self.engine, engine=self.engine, obj=obj)
         return obj
 
+    def __next__(self):
+        return self._unpack(super().__next__())
+
 
 # noinspection PyUnresolvedReferences
 class ScanIterator(SearchModelIterator):
@@ -490,6 +964,9 @@ class ScanIterator(SearchModelIterator):
     :param index: :class:`~bloop.models.Index` to scan, or None.
     :param dict request: The base request dict for each Scan call.
     :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param int prefetch: Number of pages to request from a background thread while the current page is consumed.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
     """
     mode = "scan"
 
@@ -505,5 +982,289 @@ class QueryIterator(SearchModelIterator):
     :param index: :class:`~bloop.models.Index` to query, or None.
     :param dict request: The base request dict for each Query call.
     :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param int prefetch: Number of pages to request from a background thread while the current page is consumed.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
     """
     mode = "query"
+
+
+class ConcurrentSearchIterator(SearchModelIterator):
+    """Reusable search iterator that sends several requests at once from a pool of daemon worker threads.
+
+    Results are returned in the order their pages arrive.  :attr:`count` and :attr:`scanned` are totals across all
+    requests.  Subclasses provide the requests with :func:`_requests`.  The workers stop when the search is
+    exhausted, reset, closed, or garbage collected, and after :func:`first` and :func:`one`.
+
+    :param engine: :class:`~bloop.engine.Engine` to unpack models with.
+    :param model: :class:`~bloop.models.BaseModel` being searched.
+    :param index: :class:`~bloop.models.Index` to search, or None.
+    :param dict request: The base request dict for each search call.
+    :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param int prefetch: Number of pages each request can load ahead of the page being consumed.  At least 1 page
+        is always buffered per request.  Default is 0.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+    :param int workers: Most requests sent at once.  Default is None (every request).
+    """
+    def __init__(
+            self, *, engine, model, index, request, projected, prefetch=0, as_dict=False, lazy=False, workers=None):
+        super().__init__(
+            engine=engine, model=model, index=index,
+            request=request, projected=projected, prefetch=prefetch, as_dict=as_dict, lazy=lazy)
+        self.workers = workers
+
+        self._results = None
+        self._slots = None
+        self._stopped = None
+        self._threads = None
+        self._stop_workers = None
+        self._running = 0
+
+    def _requests(self):
+        """The first request for each worker."""
+        raise NotImplementedError
+
+    def _next_response(self):
+        if self._threads is None:
+            self._start_requests()
+        worker, response, error = self._results.get()
+        if error is not None:
+            # The other requests can't be resumed without repeating results; reset() to search again.
+            self._stop_prefetch()
+            self._exhausted = True
+            raise error
+        # This request may load another page now that this one is leaving the queue
+        self._slots[worker].release()
+        if not response.get("LastEvaluatedKey"):
+            self._running -= 1
+        return response
+
+    def _apply_response(self, response):
+        self._exhausted = self._running == 0
+        if self._exhausted:
+            self._stop_prefetch()
+
+        self._count += response["Count"]
+        self._scanned += response["ScannedCount"]
+        self.buffer.extend(response.get("Items", []))
+
+    def _start_requests(self):
+        requests = self._requests()
+        self._results = queue.Queue()
+        self._slots = [threading.Semaphore(max(1, self.prefetch)) for _ in requests]
+        self._stopped = threading.Event()
+        self._running = len(requests)
+        pending = queue.Queue()
+        for worker, request in enumerate(requests):
+            pending.put((worker, request))
+        # Daemon threads that don't hold a reference to the iterator: an abandoned iterator is collected and its
+        # workers stopped without waiting for reset() or the last page, and the interpreter can exit without them
+        self._threads = [
+            threading.Thread(
+                target=search_worker, daemon=True,
+                args=(self.session, self.mode, pending, self._results, self._slots, self._stopped))
+            for _ in range(min(self.workers or len(requests), len(requests)))]
+        self._stop_workers = weakref.finalize(self, stop_workers, self._slots, self._stopped)
+        for thread in self._threads:
+            thread.start()
+
+    def close(self):
+        """Stop the requests running in the background.  The search can't continue where it stopped; call
+        :func:`reset` to search again."""
+        if self._threads is not None:
+            self._stop_prefetch()
+            self._exhausted = True
+
+    def _stop_prefetch(self):
+        if self._threads is None:
+            return
+        self._stop_workers()
+        self._stop_workers = None
+        self._threads = None
+
+
+def search_worker(session, mode, pending, results, slots, stopped):
+    """Sends the requests of a :class:`ConcurrentSearchIterator` from ``pending`` one at a time, with each of their
+    following pages, and puts every response in ``results``.  Waits for the request's slot before each page."""
+    while not stopped.is_set():
+        try:
+            worker, request = pending.get_nowait()
+        except queue.Empty:
+            return
+        slot = slots[worker]
+        try:
+            while True:
+                slot.acquire()
+                if stopped.is_set():
+                    return
+                response = session.search_items(mode, request)
+                results.put((worker, response, None))
+                if not response.get("LastEvaluatedKey"):
+                    break
+                request = {**request, "ExclusiveStartKey": response["LastEvaluatedKey"]}
+        except Exception as error:
+            results.put((worker, None, error))
+            return
+
+
+def stop_workers(slots, stopped):
+    """Stops every :func:`search_worker` of a search."""
+    stopped.set()
+    # Wake any request that's waiting for room in the queue so it sees the stop
+    for slot in slots:
+        slot.release()
+
+
+class ParallelScanIterator(ConcurrentSearchIterator, ScanIterator):
+    """Reusable scan iterator that scans every segment of a `parallel scan`__ at once.
+
+    Returned from :func:`Engine.scan <bloop.engine.Engine.scan>` when ``parallel`` is a number of segments or "auto".
+    Up to ``workers`` segments are scanned at once, each by its own worker thread, and results are returned in the
+    order their pages arrive.  :attr:`count` and :attr:`scanned` are totals across all segments.
+
+    :param engine: :class:`~bloop.engine.Engine` to unpack models with.
+    :param model: :class:`~bloop.models.BaseModel` being scanned.
+    :param index: :class:`~bloop.models.Index` to scan, or None.
+    :param dict request: The base request dict for each Scan call.
+    :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param int prefetch: Number of pages each segment can load ahead of the page being consumed.  At least 1 page
+        is always buffered per segment.  Default is 0.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+    :param int segments: Number of segments to scan.
+    :param int workers: Most segments scanned at once.  Default is None (the number of segments, up to
+        :func:`auto_segments`).
+
+    __ http://docs.aws.amazon.com/amazondynamodb/latest/developerguide/Scan.html#Scan.ParallelScan
+    """
+    def __init__(
+            self, *, engine, model, index, request, projected, prefetch=0, as_dict=False, lazy=False, segments,
+            workers=None):
+        super().__init__(
+            engine=engine, model=model, index=index, request=request, projected=projected, prefetch=prefetch,
+            as_dict=as_dict, lazy=lazy, workers=workers or min(segments, auto_segments()))
+        self.segments = segments
+
+    def _requests(self):
+        request = {key: value for (key, value) in self.request.items() if key != "ExclusiveStartKey"}
+        return [{**request, "Segment": segment, "TotalSegments": self.segments} for segment in range(self.segments)]
+
+
+class MultiSearchIterator(ConcurrentSearchIterator):
+    """Reusable search iterator that sends a query or scan for each of several filters at once, and returns each
+    item once.
+
+    Returned from :func:`Engine.query <bloop.engine.Engine.query>` and :func:`Engine.scan <bloop.engine.Engine.scan>`
+    when the filter renders to more than :data:`~bloop.conditions.MAX_EXPRESSION_LENGTH` bytes.  The filter is split
+    into shorter filters that together match the same items.  Results are returned in the order their pages arrive,
+    so a query's results aren't sorted.  :attr:`count` only includes each item once; :attr:`scanned` is the total
+    across all requests.
+
+    :param engine: :class:`~bloop.engine.Engine` to unpack models with.
+    :param str mode: Search type, either "query" or "scan".
+    :param model: :class:`~bloop.models.BaseModel` being searched.
+    :param index: :class:`~bloop.models.Index` to search, or None.
+    :param dict request: The request the search would send without splitting the filter.
+    :param list requests: The request dict for each filter.  Each result must include the model's keys.
+    :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param int prefetch: Number of pages each request can load ahead of the page being consumed.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+    """
+    def __init__(
+            self, *, engine, mode, model, index, request, requests, projected, prefetch=0, as_dict=False,
+            lazy=False):
+        super().__init__(
+            engine=engine, model=model, index=index, request=request, projected=projected, prefetch=prefetch,
+            as_dict=as_dict, lazy=lazy, workers=min(len(requests), auto_segments()))
+        self.mode = mode
+        self.requests = requests
+        self._keys = [column.dynamo_name for column in model.Meta.keys]
+        self._seen = set()
+
+    def _requests(self):
+        return self.requests
+
+    def reset(self):
+        super().reset()
+        self._seen.clear()
+
+    def _apply_response(self, response):
+        self._exhausted = self._running == 0
+        if self._exhausted:
+            self._stop_prefetch()
+
+        items = []
+        for item in response.get("Items", []):
+            key = key_of(item, self._keys)
+            if key not in self._seen:
+                self._seen.add(key)
+                items.append(item)
+        self._count += len(items)
+        self._scanned += response["ScannedCount"]
+        # Items were only requested to count them
+        if self.request["Select"] != "COUNT":
+            self.buffer.extend(items)
+
+
+class FetchIterator(SearchModelIterator):
+    """Reusable search iterator that loads the full item for each result of an index search.
+
+    Returned from :func:`Engine.query <bloop.engine.Engine.query>` when ``fetch`` is True, and from
+    :func:`Engine.find <bloop.engine.Engine.find>` when the chosen index doesn't include every column that's needed.
+    The keys in each page of the index search are loaded from the table with
+    :func:`SessionWrapper.load_items <bloop.session.SessionWrapper.load_items>`, which sends chunks of 100 keys at
+    once when the session has more than one worker.  Results are returned in the index's order, and at most
+    ``prefetch`` pages (or 1) of full items are held at once.  Items that were deleted after the index returned their
+    keys are skipped.  :attr:`count` only includes items that were loaded and matched the local filter.
+
+    :param engine: :class:`~bloop.engine.Engine` to unpack models with.
+    :param str mode: Search type, either "query" or "scan".
+    :param model: :class:`~bloop.models.BaseModel` being searched.
+    :param index: :class:`~bloop.models.Index` to search.
+    :param dict request: The base request dict for each search call.  Each result must include the model's keys.
+    :param set projected: Set of :class:`~bloop.models.Column` that should be included in each result.
+    :param filter: Condition that each full item must match, evaluated locally.  Default is None.
+    :param bool consistent: Load the full items with strongly consistent reads.  Default is False.
+    :param int prefetch: Number of pages to request from a background thread while the current page is consumed.
+    :param bool as_dict: Return a dict of loaded values by column name instead of a model instance.
+    :param bool lazy: Keep each column's value in its DynamoDB form until the column is first read.
+    """
+    def __init__(
+            self, *, engine, mode, model, index, request, projected, filter=None, consistent=False, prefetch=0,
+            as_dict=False, lazy=False):
+        super().__init__(
+            engine=engine, model=model, index=index,
+            request=request, projected=projected, prefetch=prefetch, as_dict=as_dict, lazy=lazy)
+        self.mode = mode
+        self.consistent = consistent
+        self.filter = filter
+        self._keys = [column.dynamo_name for column in model.Meta.keys]
+
+    @property
+    def filter(self):
+        """Condition that each full item must match, evaluated locally, or None."""
+        return self._filter
+
+    @filter.setter
+    def filter(self, filter):
+        self._filter = filter
+        self._matches = None if filter is None else compile_condition(filter, self.engine)
+
+    def _request_page(self, request):
+        # Runs on the prefetch thread too, so pages ahead of the current one are loaded in the background
+        response = super()._request_page(request)
+        items = self._load_items(response.get("Items", []))
+        return {**response, "Items": items, "Count": len(items)}
+
+    def _load_items(self, items):
+        """The full item for each key, in the same order, that matches the filter."""
+        if not items:
+            return []
+        table_name = self.engine._compute_table_name(self.model)
+        keys = [{name: item[name] for name in self._keys} for item in items]
+        response = self.session.load_items({table_name: {"Keys": keys, "ConsistentRead": self.consistent}})
+        loaded = {key_of(item, self._keys): item for item in response.get(table_name, [])}
+        found = (loaded.get(key_of(item, self._keys)) for item in items)
+        return [item for item in found if item is not None and (self._matches is None or self._matches(item))]
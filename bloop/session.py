@@ -1,6 +1,10 @@
 import collections
+import concurrent.futures
 import functools
 import logging
+import random
+import threading
+import time
 
 import boto3
 import botocore.exceptions
@@ -22,9 +26,25 @@ logger = logging.getLogger("bloop.session")
 missing = Sentinel("missing")
 ready = Sentinel("ready")
 
-__all__ = ["SessionWrapper"]
+__all__ = ["ExponentialBackoff", "RateLimiter", "RetryPolicy", "SessionWrapper", "TokenBucket"]
 # https://boto3.readthedocs.io/en/latest/reference/services/dynamodb.html#DynamoDB.Client.batch_get_item
 BATCH_GET_ITEM_CHUNK_SIZE = 100
+# https://boto3.readthedocs.io/en/latest/reference/services/dynamodb.html#DynamoDB.Client.batch_write_item
+BATCH_WRITE_ITEM_CHUNK_SIZE = 25
+
+# https://docs.aws.amazon.com/amazondynamodb/latest/developerguide/Programming.Errors.html
+RETRYABLE_ERROR_CODES = {
+    "InternalServerError",
+    "LimitExceededException",
+    "ProvisionedThroughputExceededException",
+    "RequestLimitExceeded",
+    "ServiceUnavailable",
+    "ThrottlingException",
+}
+# Errors after which DynamoDB may or may not have applied the request
+SERVER_ERROR_CODES = {"InternalServerError", "ServiceUnavailable"}
+# Operations that can apply twice when sent again, eg. an UpdateExpression with ADD or SET count = count + 1
+NON_IDEMPOTENT_OPERATIONS = {"update_item"}
 
 SHARD_ITERATOR_TYPES = {
     "at_sequence": "AT_SEQUENCE_NUMBER",
@@ -33,6 +53,306 @@ SHARD_ITERATOR_TYPES = {
     "latest": "LATEST"
 }
 
+# Operations that consume provisioned capacity, and which kind of capacity they consume
+CAPACITY_MODES = {
+    "batch_get_item": "read",
+    "query": "read",
+    "scan": "read",
+    "batch_write_item": "write",
+    "delete_item": "write",
+    "update_item": "write",
+}
+
+
+class ExponentialBackoff:
+    """Exponential backoff with "full jitter".  The delay before retry ``n`` is a random number of seconds between
+    0 and ``min(cap, base * 2**n)``.
+
+    .. seealso::
+
+        `Exponential Backoff and Jitter`__ on the AWS Architecture Blog
+
+    :param float base: Upper bound of the first delay, in seconds.  Default is 0.05.
+    :param float cap: Largest upper bound of any delay, in seconds.  Default is 5.
+    :param bool jitter: Wait a random fraction of the upper bound.  Default is True.
+
+    __ https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    """
+    def __init__(self, base=0.05, cap=5.0, jitter=True):
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+
+    def __call__(self, attempt):
+        delay = min(self.cap, self.base * 2 ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+class RetryPolicy:
+    """Controls how long a :class:`~bloop.session.SessionWrapper` waits before re-sending unprocessed keys and items
+    from a batch call, and which failed calls it retries.
+
+    botocore already retries throttled calls and server errors inside each client call, up to the ``max_attempts``
+    of the client's retry config.  Retries from this policy happen after those, so each retry here can be several
+    calls to DynamoDB.  By default this policy only re-sends unprocessed keys and items, which botocore doesn't.
+    To have the policy retry errors instead of botocore, turn off the client's retries and pass ``retry_on``:
+
+    .. code-block:: python
+
+        config = botocore.config.Config(retries={"max_attempts": 0})
+        policy = RetryPolicy(max_attempts=5, deadline=2.0, retry_on=RETRYABLE_ERROR_CODES)
+        engine = Engine(session=SessionWrapper(
+            dynamodb=boto3.client("dynamodb", config=config),
+            dynamodbstreams=boto3.client("dynamodbstreams", config=config),
+            retry_policy=policy))
+        ...
+        print(policy.retries)
+        # Counter({'batch_get_item': 3, 'query': 1})
+
+    A call in :data:`~bloop.session.NON_IDEMPOTENT_OPERATIONS` is never retried after one of the
+    :data:`~bloop.session.SERVER_ERROR_CODES`, since DynamoDB may have applied it already.
+
+    :param int max_attempts: Most calls made for a single request, including the first.  Default is 10.
+    :param float deadline: *(Optional)* Seconds after the first call when no more retries are made.
+        Default is None (no deadline).
+    :param backoff: *(Optional)* Called with the 0-based retry number, returns the seconds to wait before that retry.
+        Default is :class:`~bloop.session.ExponentialBackoff` with its default arguments.
+    :param retry_on: *(Optional)* Error codes that can be retried, such as
+        :data:`~bloop.session.RETRYABLE_ERROR_CODES`.  Default is none, and botocore's retries are used.
+    """
+    def __init__(self, *, max_attempts=10, deadline=None, backoff=None, retry_on=()):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.deadline = deadline
+        self.backoff = backoff or ExponentialBackoff()
+        self.retry_on = set(retry_on)
+
+        #: Number of retries per operation name, eg. ``retries["query"]``
+        self.retries = collections.Counter()
+        #: Number of requests per operation name that ran out of attempts or time
+        self.exhausted = collections.Counter()
+        self._lock = threading.Lock()
+
+    def call(self, operation, method, **request):
+        """Call ``method(**request)``, retrying errors in :attr:`retry_on` until the attempts or deadline run out.
+
+        :param str operation: Name used for the counters, eg. "update_item".
+        :param method: Client method to call.
+        :raises botocore.exceptions.ClientError: The last error, if it can't be retried.
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                return method(**request)
+            except botocore.exceptions.ClientError as error:
+                if not self.can_retry(operation, error):
+                    raise
+                if not self.wait(operation, attempt, started):
+                    raise
+            attempt += 1
+
+    def can_retry(self, operation, error):
+        """True if the error's code is in :attr:`retry_on`, and sending the call again can't apply it twice.
+
+        :param str operation: Name of the call that failed, eg. "update_item".
+        :param error: The :exc:`botocore.exceptions.ClientError` that the call raised.
+        :rtype: bool
+        """
+        code = error.response["Error"]["Code"]
+        if code not in self.retry_on:
+            return False
+        return not (operation in NON_IDEMPOTENT_OPERATIONS and code in SERVER_ERROR_CODES)
+
+    def wait(self, operation, attempt, started):
+        """Sleep before retry number ``attempt``, unless the attempts or deadline have run out.
+
+        :param str operation: Name used for the counters, eg. "batch_get_item".
+        :param int attempt: 0-based retry number.
+        :param float started: :func:`time.monotonic` when the first call was made.
+        :return: True if the caller should retry, False if it should give up.
+        :rtype: bool
+        """
+        delay = self.next_delay(operation, attempt, started)
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    def next_delay(self, operation, attempt, started):
+        """Count retry number ``attempt`` and return the seconds to wait before it, without sleeping.
+
+        :param str operation: Name used for the counters, eg. "batch_get_item".
+        :param int attempt: 0-based retry number.
+        :param float started: :func:`time.monotonic` when the first call was made.
+        :return: Seconds to wait, or None if the attempts or deadline have run out.
+        :rtype: float
+        """
+        delay = self.backoff(attempt)
+        out_of_attempts = attempt + 1 >= self.max_attempts
+        out_of_time = self.deadline is not None and (time.monotonic() - started + delay) > self.deadline
+        with self._lock:
+            if out_of_attempts or out_of_time:
+                self.exhausted[operation] += 1
+                return None
+            self.retries[operation] += 1
+        logger.debug(f"retrying {operation} in {delay:.3f} seconds (retry {attempt + 1})")
+        return delay
+
+
+class TokenBucket:
+    """Refills ``rate`` tokens per second up to ``capacity``.
+
+    Since DynamoDB only reports the capacity a call consumed after the call finishes, callers
+    :func:`~bloop.session.TokenBucket.acquire` before a call (which blocks while the bucket is in debt) and then
+    :func:`~bloop.session.TokenBucket.consume` the reported units, which can leave the bucket negative.
+
+    :param float rate: Tokens added per second.
+    :param float capacity: Most tokens the bucket can hold.  The bucket starts full.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+
+    def delay(self):
+        """Seconds until the bucket is no longer in debt."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Block until the bucket is no longer in debt."""
+        delay = self.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def consume(self, tokens):
+        """Remove tokens from the bucket.  The bucket can go into debt."""
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+
+
+class RateLimiter:
+    """Keeps calls to each table and GSI under a share of their provisioned read and write units.
+
+    Buckets are configured from ``Meta.read_units``, ``Meta.write_units`` and each GSI's units when the session
+    validates a model's table, or by calling :func:`~bloop.session.RateLimiter.configure` directly (for example, when
+    binding with ``skip_table_setup=True``).  Every call made through the session for a configured table requests
+    ``ReturnConsumedCapacity`` and subtracts the consumed units.  Calls wait while a table or index they use is over
+    its budget.  LSIs share their table's bucket.
+
+    .. code-block:: python
+
+        # Keep this engine's background scans under 20% of each table's capacity
+        limiter = RateLimiter(share=0.2)
+        background = Engine(session=SessionWrapper(rate_limiter=limiter))
+
+    :param float share: Fraction of the provisioned units that calls can use.  Default is 1.0.
+    :param float burst: Seconds of unused capacity each bucket can save up.  Default is 1.0.
+    """
+    def __init__(self, share=1.0, burst=1.0):
+        if not 0 < share <= 1:
+            raise ValueError("share must be greater than 0 and at most 1")
+        self.share = share
+        self.burst = burst
+        # (table_name, index_name or None, "read" or "write") -> TokenBucket
+        self.buckets = {}
+
+    def configure(self, table_name, model):
+        """Create buckets for the table and its GSIs from the model's current read and write units.
+
+        Tables and indexes without provisioned units (eg. on-demand tables) are not limited.
+
+        :param str table_name: The name of the model's table.
+        :param model: The :class:`~bloop.models.BaseModel` with the table's provisioned units.
+        """
+        self._add_bucket(table_name, None, "read", model.Meta.read_units)
+        self._add_bucket(table_name, None, "write", model.Meta.write_units)
+        for index in model.Meta.gsis:
+            self._add_bucket(table_name, index.dynamo_name, "read", index.read_units)
+            self._add_bucket(table_name, index.dynamo_name, "write", index.write_units)
+
+    def _add_bucket(self, table_name, index_name, mode, units):
+        key = (table_name, index_name, mode)
+        if not units:
+            self.buckets.pop(key, None)
+            return
+        rate = units * self.share
+        self.buckets[key] = TokenBucket(rate=rate, capacity=rate * self.burst)
+        logger.debug(f"limiting {mode} on {table_name}.{index_name} to {rate} units per second")
+
+    def limits(self, request):
+        """True if the call uses a configured table."""
+        return any(table_name == key[0] for table_name in tables_of(request) for key in self.buckets)
+
+    def acquire(self, operation, request):
+        """Block until every bucket the call will use has capacity."""
+        for bucket in self.buckets_for(operation, request):
+            bucket.acquire()
+
+    def buckets_for(self, operation, request):
+        """The buckets a call will use.
+
+        Queries and scans on a GSI use the index's bucket; writes use the table and its GSIs.
+        """
+        mode = CAPACITY_MODES[operation]
+        index_name = request.get("IndexName")
+        buckets = []
+        for table_name in tables_of(request):
+            for (bucket_table, bucket_index, bucket_mode), bucket in list(self.buckets.items()):
+                if bucket_table != table_name or bucket_mode != mode:
+                    continue
+                if mode == "read" and bucket_index != self._read_index(table_name, index_name):
+                    continue
+                buckets.append(bucket)
+        return buckets
+
+    def consume(self, operation, response):
+        """Subtract the units in the response's ``ConsumedCapacity`` from each table and index bucket."""
+        mode = CAPACITY_MODES[operation]
+        consumed = response.get("ConsumedCapacity") or []
+        if isinstance(consumed, dict):
+            consumed = [consumed]
+        for capacity in consumed:
+            table_name = capacity["TableName"]
+            gsis = capacity.get("GlobalSecondaryIndexes", {})
+            if "Table" in capacity:
+                # LSIs use the table's capacity
+                table_units = capacity["Table"].get("CapacityUnits", 0) + sum(
+                    lsi.get("CapacityUnits", 0) for lsi in capacity.get("LocalSecondaryIndexes", {}).values())
+            else:
+                # the total already includes LSIs; take out what the GSIs used
+                table_units = capacity.get("CapacityUnits", 0) - sum(
+                    gsi.get("CapacityUnits", 0) for gsi in gsis.values())
+            self._consume(table_name, None, mode, table_units)
+            for index_name, index_capacity in gsis.items():
+                self._consume(table_name, index_name, mode, index_capacity.get("CapacityUnits", 0))
+
+    def _consume(self, table_name, index_name, mode, units):
+        bucket = self.buckets.get((table_name, index_name, mode))
+        if bucket is not None and units:
+            bucket.consume(units)
+
+    def _read_index(self, table_name, index_name):
+        # Reads from an LSI (or an unknown index) use the table's bucket
+        if (table_name, index_name, "read") in self.buckets:
+            return index_name
+        return None
+
 
 class SessionWrapper:
     """Provides a consistent interface to DynamoDb and DynamoDbStreams clients.
@@ -41,13 +361,35 @@ class SessionWrapper:
 
     :param dynamodb: A boto3 client for DynamoDB.  Defaults to ``boto3.client("dynamodb")``.
     :param dynamodbstreams: A boto3 client for DynamoDbStreams.  Defaults to ``boto3.client("dynamodbstreams")``.
+    :param int max_workers: *(Optional)* Number of threads used to send chunks of a batch request at the same time.
+        Default is 1, which sends each chunk one after another.
+    :param retry_policy: *(Optional)* Applied to every DynamoDB and DynamoDBStreams call.
+        Default is a new :class:`~bloop.session.RetryPolicy` with its default arguments.
+    :param rate_limiter: *(Optional)* A :class:`~bloop.session.RateLimiter` that keeps reads and writes under a share
+        of each table's provisioned units.  Default is None (no limit).
     """
-    def __init__(self, dynamodb=None, dynamodbstreams=None):
+    def __init__(
+            self, dynamodb=None, dynamodbstreams=None, *,
+            max_workers=1, retry_policy=None, rate_limiter=None):
         dynamodb = dynamodb or boto3.client("dynamodb")
         dynamodbstreams = dynamodbstreams or boto3.client("dynamodbstreams")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
 
         self.dynamodb_client = dynamodb
         self.stream_client = dynamodbstreams
+        self.max_workers = max_workers
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+
+    def _call(self, client, operation, **request):
+        buckets = limit_request(self.rate_limiter, operation, request)
+        for bucket in buckets or ():
+            bucket.acquire()
+        response = self.retry_policy.call(operation, getattr(client, operation), **request)
+        if buckets is not None:
+            self.rate_limiter.consume(operation, response)
+        return response
 
     def save_item(self, item):
         """Save an object to DynamoDB.
@@ -56,7 +398,7 @@ class SessionWrapper:
         :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic) is not met.
         """
         try:
-            self.dynamodb_client.update_item(**item)
+            self._call(self.dynamodb_client, "update_item", **item)
         except botocore.exceptions.ClientError as error:
             handle_constraint_violation(error)
 
@@ -67,32 +409,75 @@ class SessionWrapper:
         :raises bloop.exceptions.ConstraintViolation: if the condition (or atomic) is not met.
         """
         try:
-            self.dynamodb_client.delete_item(**item)
+            self._call(self.dynamodb_client, "delete_item", **item)
         except botocore.exceptions.ClientError as error:
             handle_constraint_violation(error)
 
+    def write_items(self, items):
+        """Puts and deletes any number of items in chunks, re-sending unprocessed items with backoff.
+
+        Unlike :func:`~bloop.session.SessionWrapper.save_item` and :func:`~bloop.session.SessionWrapper.delete_item`
+        these writes can't be conditional.
+
+        :param items: Unpacked in chunks into "RequestItems" for :func:`boto3.DynamoDB.Client.batch_write_item`.
+        :raises bloop.exceptions.BloopException: if items are still unprocessed when the retry policy runs out.
+        """
+        for request in create_batch_write_chunks(items):
+            self._write_chunk(request)
+
+    def _write_chunk(self, request):
+        """Writes a single chunk of at most 25 items, re-sending any unprocessed items."""
+        started, attempt = time.monotonic(), 0
+        while request:
+            try:
+                response = self._call(self.dynamodb_client, "batch_write_item", RequestItems=request)
+            except botocore.exceptions.ClientError as error:
+                raise BloopException("Unexpected error while writing items.") from error
+
+            # "UnprocessedItems" is {} if this request is done
+            request = response.get("UnprocessedItems")
+            if request:
+                if not self.retry_policy.wait("batch_write_item", attempt, started):
+                    raise BloopException("Ran out of retries while writing unprocessed items.")
+                attempt += 1
+
     def load_items(self, items):
         """Loads any number of items in chunks, handling continuation tokens.
 
+        When the session has more than one worker, chunks are sent at the same time and their results are
+        merged once every chunk is loaded.
+
         :param items: Unpacked in chunks into "RequestItems" for :func:`boto3.DynamoDB.Client.batch_get_item`.
+        :raises bloop.exceptions.BloopException: if keys are still unprocessed when the retry policy runs out.
         """
+        chunks = list(create_batch_get_chunks(items))
+        workers = min(self.max_workers, len(chunks))
+        if workers > 1:
+            logger.debug(f"load_items: sending {len(chunks)} chunks with {workers} workers")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(self._load_chunk, chunks))
+        else:
+            responses = map(self._load_chunk, chunks)
+        return merge_loaded_items({}, responses)
+
+    def _load_chunk(self, request):
+        """Loads a single chunk of at most 100 keys, re-sending any unprocessed keys."""
         loaded_items = {}
-        requests = collections.deque(create_batch_get_chunks(items))
-        while requests:
-            request = requests.pop()
+        started, attempt = time.monotonic(), 0
+        while request:
             try:
-                response = self.dynamodb_client.batch_get_item(RequestItems=request)
+                response = self._call(self.dynamodb_client, "batch_get_item", RequestItems=request)
             except botocore.exceptions.ClientError as error:
                 raise BloopException("Unexpected error while loading items.") from error
 
-            # Accumulate results
-            for table_name, table_items in response.get("Responses", {}).items():
-                loaded_items.setdefault(table_name, []).extend(table_items)
+            merge_loaded_items(loaded_items, [response.get("Responses", {})])
 
-            # Push additional request onto the deque.
             # "UnprocessedKeys" is {} if this request is done
-            if response["UnprocessedKeys"]:
-                requests.append(response["UnprocessedKeys"])
+            request = response["UnprocessedKeys"]
+            if request:
+                if not self.retry_policy.wait("batch_get_item", attempt, started):
+                    raise BloopException("Ran out of retries while loading unprocessed keys.")
+                attempt += 1
         return loaded_items
 
     def query_items(self, request):
@@ -122,9 +507,8 @@ class SessionWrapper:
         :param request: Unpacked into :func:`boto3.DynamoDB.Client.query` or :func:`boto3.DynamoDB.Client.scan`
         """
         validate_search_mode(mode)
-        method = getattr(self.dynamodb_client, mode)
         try:
-            response = method(**request)
+            response = self._call(self.dynamodb_client, mode, **request)
         except botocore.exceptions.ClientError as error:
             raise BloopException("Unexpected error during {}.".format(mode)) from error
         standardize_query_response(response)
@@ -143,7 +527,7 @@ class SessionWrapper:
         """
         table = create_table_request(table_name, model)
         try:
-            self.dynamodb_client.create_table(**table)
+            self._call(self.dynamodb_client, "create_table", **table)
             is_creating = True
         except botocore.exceptions.ClientError as error:
             handle_table_exists(error, model)
@@ -167,30 +551,20 @@ class SessionWrapper:
         while status is not ready:
             calls += 1
             try:
-                description = self.dynamodb_client.describe_table(TableName=table_name)["Table"]
+                description = self._call(self.dynamodb_client, "describe_table", TableName=table_name)["Table"]
             except botocore.exceptions.ClientError as error:
                 raise BloopException("Unexpected error while describing table.") from error
             status = simple_table_status(description)
         logger.debug("describe_table: table \"{}\" was in ACTIVE state after {} calls".format(table_name, calls))
         try:
-            ttl = self.dynamodb_client.describe_time_to_live(TableName=table_name)
+            ttl = self._call(self.dynamodb_client, "describe_time_to_live", TableName=table_name)
         except botocore.exceptions.ClientError as error:
             raise BloopException("Unexpected error while describing ttl.") from error
         try:
-            backups = self.dynamodb_client.describe_continuous_backups(TableName=table_name)
+            backups = self._call(self.dynamodb_client, "describe_continuous_backups", TableName=table_name)
         except botocore.exceptions.ClientError as error:
             raise BloopException("Unexpected error while describing continuous backups.") from error
-
-        description["TimeToLiveDescription"] = {
-            "AttributeName": _read_field(ttl, None, "TimeToLiveDescription", "AttributeName"),
-            "TimeToLiveStatus": _read_field(ttl, None, "TimeToLiveDescription", "TimeToLiveStatus"),
-        }
-        description["ContinuousBackupsDescription"] = {
-            "ContinuousBackupsStatus": _read_field(
-                backups, None, "ContinuousBackupsDescription", "ContinuousBackupsStatus"),
-        }
-
-        return sanitize_table_description(description)
+        return merge_table_description(description, ttl, backups)
 
     def validate_table(self, table_name, model):
         """Polls until a creating table is ready, then verifies the description against the model's requirements.
@@ -204,39 +578,7 @@ class SessionWrapper:
         :raises bloop.exceptions.TableMismatch: When the table does not meet the constraints of the model.
         """
         actual = self.describe_table(table_name)
-        if not compare_tables(model, actual):
-            raise TableMismatch("The expected and actual tables for {!r} do not match.".format(model.__name__))
-
-        # In the following blocks, insert values/arns that the model didn't specify or can't know ahead of time.
-        if model.Meta.stream:
-            stream_arn = model.Meta.stream["arn"] = actual["LatestStreamArn"]
-            logger.debug(f"Set {model.__name__}.Meta.stream['arn'] to '{stream_arn}' from DescribeTable response")
-        if model.Meta.ttl:
-            ttl_enabled = actual["TimeToLiveDescription"]["TimeToLiveStatus"].lower()
-            model.Meta.ttl["enabled"] = ttl_enabled
-            logger.debug(f"Set {model.__name__}.Meta.ttl['enabled'] to '{ttl_enabled}' from DescribeTable response")
-        if model.Meta.read_units is None:
-            read_units = model.Meta.read_units = actual["ProvisionedThroughput"]["ReadCapacityUnits"]
-            logger.debug(
-                f"Set {model.__name__}.Meta.read_units to {read_units} from DescribeTable response")
-        if model.Meta.write_units is None:
-            write_units = model.Meta.write_units = actual["ProvisionedThroughput"]["WriteCapacityUnits"]
-            logger.debug(
-                f"Set {model.__name__}.Meta.write_units to {write_units} from DescribeTable response")
-
-        # Replace any ``None`` values for read_units, write_units in GSIs with their actual values
-        gsis = {index["IndexName"]: index for index in actual["GlobalSecondaryIndexes"]}
-        for index in model.Meta.gsis:
-            read_units = gsis[index.dynamo_name]["ProvisionedThroughput"]["ReadCapacityUnits"]
-            write_units = gsis[index.dynamo_name]["ProvisionedThroughput"]["WriteCapacityUnits"]
-            if index.read_units is None:
-                index.read_units = read_units
-                logger.debug(
-                    f"Set {model.__name__}.{index.name}.read_units to {read_units} from DescribeTable response")
-            if index.write_units is None:
-                index.write_units = write_units
-                logger.debug(
-                    f"Set {model.__name__}.{index.name}.write_units to {write_units} from DescribeTable response")
+        validate_table_description(table_name, model, actual, self.rate_limiter)
 
     def enable_ttl(self, table_name, model):
         """Calls UpdateTimeToLive on the table according to model.Meta["ttl"]
@@ -244,13 +586,9 @@ class SessionWrapper:
         :param table_name: The name of the table to enable the TTL setting on
         :param model: The model to get TTL settings from
         """
-        ttl_name = model.Meta.ttl["column"].dynamo_name
-        request = {
-            "TableName": table_name,
-            "TimeToLiveSpecification": {"AttributeName": ttl_name, "Enabled": True}
-        }
+        request = enable_ttl_request(table_name, model)
         try:
-            self.dynamodb_client.update_time_to_live(**request)
+            self._call(self.dynamodb_client, "update_time_to_live", **request)
         except botocore.exceptions.ClientError as error:
             raise BloopException("Unexpected error while setting TTL.") from error
 
@@ -260,12 +598,9 @@ class SessionWrapper:
         :param table_name: The name of the table to enable Continuous Backups on
         :param model: The model to get Continuous Backups settings from
         """
-        request = {
-            "TableName": table_name,
-            "PointInTimeRecoverySpecification": {"PointInTimeRecoveryEnabled": True}
-        }
+        request = enable_backups_request(table_name)
         try:
-            self.dynamodb_client.update_continuous_backups(**request)
+            self._call(self.dynamodb_client, "update_continuous_backups", **request)
         except botocore.exceptions.ClientError as error:
             raise BloopException("Unexpected error while setting Continuous Backups.") from error
 
@@ -278,25 +613,13 @@ class SessionWrapper:
         :rtype: dict
         """
         description = {"Shards": []}
-
-        request = {"StreamArn": stream_arn, "ExclusiveStartShardId": first_shard}
-        # boto3 isn't down with literal Nones.
-        if first_shard is None:
-            request.pop("ExclusiveStartShardId")
-
+        request = describe_stream_request(stream_arn, first_shard)
         while request.get("ExclusiveStartShardId") is not missing:
             try:
-                response = self.stream_client.describe_stream(**request)["StreamDescription"]
+                response = self._call(self.stream_client, "describe_stream", **request)["StreamDescription"]
             except botocore.exceptions.ClientError as error:
-                if error.response["Error"]["Code"] == "ResourceNotFoundException":
-                    raise InvalidStream(f"The stream arn {stream_arn!r} does not exist.") from error
-                raise BloopException("Unexpected error while describing stream.") from error
-            # Docs aren't clear if the terminal value is null, or won't exist.
-            # Since we don't terminate the loop on None, the "or missing" here
-            # will ensure we stop on a falsey value.
-            request["ExclusiveStartShardId"] = response.pop("LastEvaluatedShardId", None) or missing
-            description["Shards"].extend(response.pop("Shards", []))
-            description.update(response)
+                handle_describe_stream_error(error, stream_arn)
+            merge_stream_description(description, request, response)
         return description
 
     def get_shard_iterator(self, *, stream_arn, shard_id, iterator_type, sequence_number=None):
@@ -310,22 +633,11 @@ class SessionWrapper:
         :rtype: str
         :raises bloop.exceptions.RecordsExpired: Tried to get an iterator beyond the Trim Horizon.
         """
-        real_iterator_type = validate_stream_iterator_type(iterator_type)
-        request = {
-            "StreamArn": stream_arn,
-            "ShardId": shard_id,
-            "ShardIteratorType": real_iterator_type,
-            "SequenceNumber": sequence_number
-        }
-        # boto3 isn't down with literal Nones.
-        if sequence_number is None:
-            request.pop("SequenceNumber")
+        request = shard_iterator_request(stream_arn, shard_id, iterator_type, sequence_number)
         try:
-            return self.stream_client.get_shard_iterator(**request)["ShardIterator"]
+            return self._call(self.stream_client, "get_shard_iterator", **request)["ShardIterator"]
         except botocore.exceptions.ClientError as error:
-            if error.response["Error"]["Code"] == "TrimmedDataAccessException":
-                raise RecordsExpired from error
-            raise BloopException("Unexpected error while creating shard iterator") from error
+            handle_shard_iterator_error(error)
 
     def get_stream_records(self, iterator_id):
         """Wraps :func:`boto3.DynamoDBStreams.Client.get_records`.
@@ -337,13 +649,9 @@ class SessionWrapper:
         :raises bloop.exceptions.ShardIteratorExpired: The iterator was created more than 15 minutes ago.
         """
         try:
-            return self.stream_client.get_records(ShardIterator=iterator_id)
+            return self._call(self.stream_client, "get_records", ShardIterator=iterator_id)
         except botocore.exceptions.ClientError as error:
-            if error.response["Error"]["Code"] == "TrimmedDataAccessException":
-                raise RecordsExpired from error
-            elif error.response["Error"]["Code"] == "ExpiredIteratorException":
-                raise ShardIteratorExpired from error
-            raise BloopException("Unexpected error while getting records.") from error
+            handle_get_records_error(error)
 
 
 def validate_search_mode(mode):
@@ -358,6 +666,13 @@ def validate_stream_iterator_type(iterator_type):
         raise InvalidShardIterator(f"Unknown iterator type {iterator_type!r}")
 
 
+def tables_of(request):
+    """Table names used by a single or batch request"""
+    if "TableName" in request:
+        return [request["TableName"]]
+    return list(request.get("RequestItems", {}).keys())
+
+
 def handle_constraint_violation(error):
     error_code = error.response["Error"]["Code"]
     if error_code == "ConditionalCheckFailedException":
@@ -373,6 +688,106 @@ def handle_table_exists(error, model):
     # Don't raise if the table already exists
 
 
+def handle_describe_stream_error(error, stream_arn):
+    if error.response["Error"]["Code"] == "ResourceNotFoundException":
+        raise InvalidStream(f"The stream arn {stream_arn!r} does not exist.") from error
+    raise BloopException("Unexpected error while describing stream.") from error
+
+
+def handle_shard_iterator_error(error):
+    if error.response["Error"]["Code"] == "TrimmedDataAccessException":
+        raise RecordsExpired from error
+    raise BloopException("Unexpected error while creating shard iterator") from error
+
+
+def handle_get_records_error(error):
+    error_code = error.response["Error"]["Code"]
+    if error_code == "TrimmedDataAccessException":
+        raise RecordsExpired from error
+    elif error_code == "ExpiredIteratorException":
+        raise ShardIteratorExpired from error
+    raise BloopException("Unexpected error while getting records.") from error
+
+
+# REQUEST HELPERS ==================================================================================== REQUEST HELPERS
+
+
+def limit_request(limiter, operation, request):
+    """The buckets a call must wait on before it's sent, or None when the call isn't rate limited.
+
+    Limited calls ask for ``ReturnConsumedCapacity`` so the response can be passed to
+    :func:`RateLimiter.consume <bloop.session.RateLimiter.consume>`.
+    """
+    if limiter is None or operation not in CAPACITY_MODES or not limiter.limits(request):
+        return None
+    request.setdefault("ReturnConsumedCapacity", "INDEXES")
+    return limiter.buckets_for(operation, request)
+
+
+def merge_loaded_items(loaded_items, responses):
+    """Add each {table_name: [item, ...]} in responses to loaded_items"""
+    for response in responses:
+        for table_name, table_items in response.items():
+            loaded_items.setdefault(table_name, []).extend(table_items)
+    return loaded_items
+
+
+def enable_ttl_request(table_name, model):
+    ttl_name = model.Meta.ttl["column"].dynamo_name
+    return {
+        "TableName": table_name,
+        "TimeToLiveSpecification": {"AttributeName": ttl_name, "Enabled": True}
+    }
+
+
+def enable_backups_request(table_name):
+    return {
+        "TableName": table_name,
+        "PointInTimeRecoverySpecification": {"PointInTimeRecoveryEnabled": True}
+    }
+
+
+def describe_stream_request(stream_arn, first_shard):
+    request = {"StreamArn": stream_arn, "ExclusiveStartShardId": first_shard}
+    # boto3 isn't down with literal Nones.
+    if first_shard is None:
+        request.pop("ExclusiveStartShardId")
+    return request
+
+
+def merge_stream_description(description, request, response):
+    """Add a page of DescribeStream to the description, and point the request at the next page"""
+    # Docs aren't clear if the terminal value is null, or won't exist.
+    # Since we don't terminate the loop on None, the "or missing" here
+    # will ensure we stop on a falsey value.
+    request["ExclusiveStartShardId"] = response.pop("LastEvaluatedShardId", None) or missing
+    description["Shards"].extend(response.pop("Shards", []))
+    description.update(response)
+
+
+def shard_iterator_request(stream_arn, shard_id, iterator_type, sequence_number):
+    request = {
+        "StreamArn": stream_arn,
+        "ShardId": shard_id,
+        "ShardIteratorType": validate_stream_iterator_type(iterator_type),
+        "SequenceNumber": sequence_number
+    }
+    # boto3 isn't down with literal Nones.
+    if sequence_number is None:
+        request.pop("SequenceNumber")
+    return request
+
+
+def validate_table_description(table_name, model, actual, rate_limiter):
+    """Verifies the description against the model, then sizes the rate limiter's buckets for the table.
+
+    :raises bloop.exceptions.TableMismatch: When the table does not meet the constraints of the model.
+    """
+    apply_table_description(model, actual)
+    if rate_limiter is not None:
+        rate_limiter.configure(table_name, model)
+
+
 # MODEL HELPERS ======================================================================================== MODEL HELPERS
 
 
@@ -403,6 +818,21 @@ def create_batch_get_chunks(items):
     if buffer:
         yield buffer
 
+
+def create_batch_write_chunks(items):
+    buffer, count = {}, 0
+    for table_name, table_requests in items.items():
+        for request in table_requests:
+            buffer.setdefault(table_name, []).append(request)
+            count += 1
+            if count >= BATCH_WRITE_ITEM_CHUNK_SIZE:
+                yield buffer
+                buffer, count = {}, 0
+
+    # Last chunk, less than batch_size items
+    if buffer:
+        yield buffer
+
 # TABLE HELPERS ======================================================================================== TABLE HELPERS
 
 
@@ -540,6 +970,46 @@ def compare_tables(model, actual):
     return matches
 
 
+def apply_table_description(model, actual):
+    """Verifies a sanitized table description against the model, then inserts the values the model didn't specify.
+
+    :raises bloop.exceptions.TableMismatch: When the table does not meet the constraints of the model.
+    """
+    if not compare_tables(model, actual):
+        raise TableMismatch("The expected and actual tables for {!r} do not match.".format(model.__name__))
+
+    # In the following blocks, insert values/arns that the model didn't specify or can't know ahead of time.
+    if model.Meta.stream:
+        stream_arn = model.Meta.stream["arn"] = actual["LatestStreamArn"]
+        logger.debug(f"Set {model.__name__}.Meta.stream['arn'] to '{stream_arn}' from DescribeTable response")
+    if model.Meta.ttl:
+        ttl_enabled = actual["TimeToLiveDescription"]["TimeToLiveStatus"].lower()
+        model.Meta.ttl["enabled"] = ttl_enabled
+        logger.debug(f"Set {model.__name__}.Meta.ttl['enabled'] to '{ttl_enabled}' from DescribeTable response")
+    if model.Meta.read_units is None:
+        read_units = model.Meta.read_units = actual["ProvisionedThroughput"]["ReadCapacityUnits"]
+        logger.debug(
+            f"Set {model.__name__}.Meta.read_units to {read_units} from DescribeTable response")
+    if model.Meta.write_units is None:
+        write_units = model.Meta.write_units = actual["ProvisionedThroughput"]["WriteCapacityUnits"]
+        logger.debug(
+            f"Set {model.__name__}.Meta.write_units to {write_units} from DescribeTable response")
+
+    # Replace any ``None`` values for read_units, write_units in GSIs with their actual values
+    gsis = {index["IndexName"]: index for index in actual["GlobalSecondaryIndexes"]}
+    for index in model.Meta.gsis:
+        read_units = gsis[index.dynamo_name]["ProvisionedThroughput"]["ReadCapacityUnits"]
+        write_units = gsis[index.dynamo_name]["ProvisionedThroughput"]["WriteCapacityUnits"]
+        if index.read_units is None:
+            index.read_units = read_units
+            logger.debug(
+                f"Set {model.__name__}.{index.name}.read_units to {read_units} from DescribeTable response")
+        if index.write_units is None:
+            index.write_units = write_units
+            logger.debug(
+                f"Set {model.__name__}.{index.name}.write_units to {write_units} from DescribeTable response")
+
+
 def attribute_definitions(model):
     dedupe_attrs = set()
     attrs = []
@@ -755,6 +1225,19 @@ def sanitize_table_description(description):
     }
 
 
+def merge_table_description(description, ttl, backups):
+    """Inserts the DescribeTimeToLive and DescribeContinuousBackups responses, then sanitizes the description"""
+    description["TimeToLiveDescription"] = {
+        "AttributeName": _read_field(ttl, None, "TimeToLiveDescription", "AttributeName"),
+        "TimeToLiveStatus": _read_field(ttl, None, "TimeToLiveDescription", "TimeToLiveStatus"),
+    }
+    description["ContinuousBackupsDescription"] = {
+        "ContinuousBackupsStatus": _read_field(
+            backups, None, "ContinuousBackupsDescription", "ContinuousBackupsStatus"),
+    }
+    return sanitize_table_description(description)
+
+
 def simple_table_status(description):
     status = ready
     if description.get("TableStatus") != "ACTIVE":
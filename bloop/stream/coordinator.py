@@ -57,7 +57,9 @@ class Coordinator:
     def __next__(self):
         if not self.buffer:
             self.advance_shards()
+        return self._pop_record()
 
+    def _pop_record(self):
         if self.buffer:
             record, shard = self.buffer.pop()
 
@@ -111,12 +113,7 @@ class Coordinator:
         if not to_migrate:
             return
 
-        # Build the count once, rather than look for each shard as we process it below.
-        buffered_count = {}
-        for *_, shard in self.buffer.heap:
-            buffered_count.setdefault(shard, 0)
-            buffered_count[shard] += 1
-
+        buffered_count = self._buffered_count()
         for shard in to_migrate:
             shard.load_children()
             # This call also promotes children to the shard's previous roles
@@ -127,6 +124,14 @@ class Coordinator:
             if shard in buffered_count:
                 self.closed[shard] = buffered_count[shard]
 
+    def _buffered_count(self):
+        # Build the count once, rather than look for each shard as it's migrated.
+        buffered_count = {}
+        for *_, shard in self.buffer.heap:
+            buffered_count.setdefault(shard, 0)
+            buffered_count[shard] += 1
+        return buffered_count
+
     @property
     def token(self):
         """JSON-serializable representation of the current Stream state.
@@ -216,17 +216,19 @@ class Shard:
 
         if self.children:
             return self.children
+        shards = self.session.describe_stream(stream_arn=self.stream_arn, first_shard=self.shard_id)["Shards"]
+        return self._insert_children(shards)
 
+    def _insert_children(self, shards):
+        """Builds this shard's descendants from the "Shards" of a DescribeStream response."""
         # ParentShardId -> [Shard, ...]
         by_parent = collections.defaultdict(list)
         # ShardId -> Shard
         by_id = {}
 
-        for shard in self.session.describe_stream(
-                stream_arn=self.stream_arn,
-                first_shard=self.shard_id)["Shards"]:
+        for shard in shards:
             parent_list = by_parent[shard.get("ParentShardId")]
-            shard = Shard(
+            shard = self.__class__(
                 stream_arn=self.stream_arn,
                 shard_id=shard["ShardId"],
                 parent=shard.get("ParentShardId"),
@@ -303,10 +305,11 @@ def reformat_record(record):
     }
 
 
-def unpack_shards(shards, stream_arn, session):
+def unpack_shards(shards, stream_arn, session, shard_cls=Shard):
     """List[Dict] -> Dict[shard_id, Shard].
 
     Each Shards' parent/children are hooked up with the other Shards in the list.
+    ``shard_cls`` is the class of Shard to create.
     """
     if not shards:
         return {}
@@ -317,9 +320,10 @@ def unpack_shards(shards, stream_arn, session):
         shards = _translate_shards(shards)
 
     by_id = {shard_token["shard_id"]:
-             Shard(stream_arn=stream_arn, shard_id=shard_token["shard_id"],
-                   iterator_type=shard_token.get("iterator_type"), sequence_number=shard_token.get("sequence_number"),
-                   parent=shard_token.get("parent"), session=session)
+             shard_cls(stream_arn=stream_arn, shard_id=shard_token["shard_id"],
+                       iterator_type=shard_token.get("iterator_type"),
+                       sequence_number=shard_token.get("sequence_number"),
+                       parent=shard_token.get("parent"), session=session)
              for shard_token in shards}
 
     for shard in by_id.values():
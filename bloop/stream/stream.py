@@ -26,7 +26,9 @@ class Stream:
         return self
 
     def __next__(self):
-        record = next(self.coordinator)
+        return self._unpack_record(next(self.coordinator))
+
+    def _unpack_record(self, record):
         if record:
             meta = self.model.Meta
             for key, expected in [("new", meta.columns), ("old", meta.columns), ("key", meta.keys)]:
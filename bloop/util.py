@@ -149,6 +149,22 @@ class Sentinel:
         return "<Sentinel[{}]>".format(self.name)
 
 
+class LazyValue:
+    """Holds a column's value in its DynamoDB form until the column is first read.
+
+    :param value: The value as DynamoDB returned it.
+    :param load: Called with no arguments to load the value.
+    """
+    __slots__ = ("value", "load")
+
+    def __init__(self, value, load):
+        self.value = value
+        self.load = load
+
+    def __repr__(self):
+        return "<LazyValue[{!r}]>".format(self.value)
+
+
 class WeakDefaultDictionary(weakref.WeakKeyDictionary):
     """The cross product of :class:`weakref.WeakKeyDictionary` and :class:`collections.defaultdict`."""
     def __init__(self, default_factory):
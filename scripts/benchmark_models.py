@@ -0,0 +1,34 @@
+"""Wide models and items shared by the benchmark scripts.
+
+Each benchmark-* script imports this module from its own directory.
+"""
+from bloop import BaseModel, Column, Integer, String
+from bloop.models import unpack_from_dynamodb
+from bloop.signals import object_loaded
+
+
+def build_model(width, range_key=False):
+    """A model with ``width`` columns: a String hash key (and range key), then Integer columns c0, c1, ..."""
+    attrs = {"id": Column(String, hash_key=True)}
+    if range_key:
+        attrs["name"] = Column(String, range_key=True)
+    for i in range(width - len(attrs)):
+        attrs["c{}".format(i)] = Column(Integer)
+    return type("WideModel", (BaseModel,), attrs)
+
+
+def build_item(width, range_key=False):
+    """The DynamoDB item for an instance of ``build_model(width, range_key)``"""
+    item = {"id": {"S": "some-id"}}
+    if range_key:
+        item["name"] = {"S": "some-name"}
+    for i in range(width - len(item)):
+        item["c{}".format(i)] = {"N": str(i)}
+    return item
+
+
+def load_item(engine, model, item):
+    """Unpack an item the way Engine.load does, including the object_loaded signal"""
+    obj = unpack_from_dynamodb(attrs=item, expected=model.Meta.columns, model=model, engine=engine)
+    object_loaded.send(engine, engine=engine, obj=obj)
+    return obj
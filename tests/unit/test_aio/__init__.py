@@ -0,0 +1,11 @@
+class AsyncClient:
+    """Wraps a Mock so each method returns an awaitable; configure calls through the Mock"""
+    def __init__(self, mock):
+        self.mock = mock
+
+    def __getattr__(self, name):
+        method = getattr(self.mock, name)
+
+        async def call(**kwargs):
+            return method(**kwargs)
+        return call
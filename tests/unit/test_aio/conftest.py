@@ -0,0 +1,51 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from bloop.aio import AsyncEngine, AsyncSessionWrapper
+
+from . import AsyncClient
+
+
+@pytest.fixture
+def run():
+    """Run a coroutine to completion in a new event loop"""
+    def run(coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+    return run
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records asyncio.sleep calls without waiting"""
+    calls = []
+
+    async def sleep(seconds):
+        calls.append(seconds)
+    monkeypatch.setattr("bloop.aio.session.asyncio.sleep", sleep)
+    return calls
+
+
+@pytest.fixture
+def dynamodb():
+    return Mock()
+
+
+@pytest.fixture
+def dynamodbstreams():
+    return Mock()
+
+
+@pytest.fixture
+def session(dynamodb, dynamodbstreams):
+    return AsyncSessionWrapper(AsyncClient(dynamodb), AsyncClient(dynamodbstreams))
+
+
+@pytest.fixture
+def engine(session):
+    return AsyncEngine(session=session)
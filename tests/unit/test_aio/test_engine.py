@@ -0,0 +1,252 @@
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from tests.helpers.models import ComplexModel, User
+
+from bloop.aio import AsyncEngine, AsyncQueryIterator, AsyncScanIterator, AsyncStream
+from bloop.conditions import OrCondition
+from bloop.exceptions import (
+    ConstraintViolation,
+    InvalidCondition,
+    InvalidModel,
+    InvalidSearch,
+    InvalidStream,
+    MissingObjects,
+)
+from bloop.models import BaseModel, Column
+from bloop.signals import object_deleted, object_loaded, object_saved
+from bloop.types import Integer, String
+
+from . import AsyncClient
+from ..test_session import description_for
+
+
+def test_requires_client_or_session(dynamodb, session):
+    with pytest.raises(ValueError):
+        AsyncEngine()
+    with pytest.raises(ValueError):
+        AsyncEngine(session=session, dynamodb=AsyncClient(dynamodb))
+    engine = AsyncEngine(dynamodb=AsyncClient(dynamodb), table_name_template="prefix-{table_name}")
+    assert engine._compute_table_name(User) == "prefix-User"
+
+
+def test_bind(engine, dynamodb, run):
+    dynamodb.describe_table.return_value = {"Table": description_for(User, active=True)}
+    dynamodb.describe_time_to_live.return_value = {}
+    dynamodb.describe_continuous_backups.return_value = {}
+
+    run(engine.bind(User))
+    dynamodb.create_table.assert_called_once()
+    assert dynamodb.describe_table.call_count == 2
+
+
+def test_bind_skip_table_setup(engine, dynamodb, run):
+    run(engine.bind(User, skip_table_setup=True))
+    dynamodb.create_table.assert_not_called()
+    dynamodb.describe_table.assert_not_called()
+
+
+def test_bind_non_model(engine, run):
+    with pytest.raises(InvalidModel):
+        run(engine.bind(object()))
+
+
+def test_save_and_delete(engine, dynamodb, run):
+    user = User(id="user_id", name="foo")
+    saved, deleted = [], []
+
+    with object_saved.connected_to(lambda _, obj, **kwargs: saved.append(obj)):
+        run(engine.save(user))
+    request = dynamodb.update_item.call_args[1]
+    assert request["TableName"] == "User"
+    assert request["Key"] == {"id": {"S": "user_id"}}
+    assert "UpdateExpression" in request
+    assert saved == [user]
+
+    dynamodb.delete_item.side_effect = ConstraintViolation
+    with object_deleted.connected_to(lambda _, obj, **kwargs: deleted.append(obj)):
+        with pytest.raises(ConstraintViolation):
+            run(engine.delete(user, atomic=True))
+    assert not deleted
+
+
+def test_save_unchanged_skipped(engine, dynamodb, run):
+    user = User(id="user_id")
+    run(engine.save(user))
+    run(engine.save(user))
+    dynamodb.update_item.assert_called_once()
+    assert engine.skipped_saves == 1
+
+
+def test_save_versioned(engine, dynamodb, run):
+    class Versioned(BaseModel):
+        class Meta:
+            version = "version"
+        id = Column(String, hash_key=True)
+        version = Column(Integer)
+
+    obj = Versioned(id="obj_id", version=1)
+    run(engine.save(obj))
+    request = dynamodb.update_item.call_args[1]
+    assert request["ConditionExpression"] == "(#n0 = :v1)"
+    assert request["ExpressionAttributeValues"] == {":v1": {"N": "1"}, ":v2": {"N": "2"}}
+    assert obj.version == 2
+
+
+@pytest.mark.parametrize("op_name", ["save", "delete"])
+def test_batch(engine, dynamodb, run, op_name):
+    users = [User(id=str(i)) for i in range(3)]
+    dynamodb.batch_write_item.return_value = {"UnprocessedItems": {}}
+    run(getattr(engine, op_name)(*users, batch=True))
+    request = dynamodb.batch_write_item.call_args[1]["RequestItems"]
+    assert len(request["User"]) == 3
+
+    with pytest.raises(InvalidCondition):
+        run(getattr(engine, op_name)(*users, batch=True, atomic=True))
+
+
+def test_load(engine, dynamodb, run):
+    user, missing = User(id="user_id"), User(id="missing")
+    loaded = []
+    dynamodb.batch_get_item.return_value = {
+        "Responses": {"User": [{"id": {"S": "user_id"}, "name": {"S": "foo"}}]},
+        "UnprocessedKeys": {}}
+
+    with object_loaded.connected_to(lambda _, obj, **kwargs: loaded.append(obj)):
+        run(engine.load(user, consistent=True))
+    assert user.name == "foo"
+    assert loaded == [user]
+    request = dynamodb.batch_get_item.call_args[1]["RequestItems"]
+    assert request == {"User": {"Keys": [{"id": {"S": "user_id"}}], "ConsistentRead": True}}
+
+    with pytest.raises(MissingObjects) as excinfo:
+        run(engine.load(user, missing))
+    assert excinfo.value.objects == [missing]
+
+
+def test_query(engine, dynamodb, run):
+    dynamodb.query.side_effect = [
+        {"Count": 1, "Items": [{"id": {"S": "first"}}], "LastEvaluatedKey": {"id": {"S": "first"}}},
+        {"Count": 1, "Items": [{"id": {"S": "second"}}]}]
+    query = engine.query(User.by_email, key=User.email == "foo@domain.com")
+    assert isinstance(query, AsyncQueryIterator)
+    assert query.index is User.by_email
+
+    users = run(query.all())
+    assert [user.id for user in users] == ["first", "second"]
+    assert query.count == 2
+    assert query.exhausted
+    assert dynamodb.query.call_args_list[1][1]["ExclusiveStartKey"] == {"id": {"S": "first"}}
+
+
+def test_search_as_dict(engine, dynamodb, run):
+    dynamodb.scan.return_value = {"Count": 1, "Items": [{"id": {"S": "only"}}]}
+    scan = engine.scan(User, as_dict=True)
+    assert run(scan.all()) == [{"id": "only"}]
+
+    dynamodb.batch_get_item.return_value = {
+        "Responses": {"User": [{"id": {"S": "only"}, "age": {"N": "3"}}]},
+        "UnprocessedKeys": {}}
+    user = User(id="only")
+    assert run(engine.load(user, as_dict=True)) == {user: {"id": "only", "age": 3}}
+    assert not hasattr(user, "age")
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_query_iter_pages(engine, dynamodb, run, raw):
+    dynamodb.query.side_effect = [
+        {"Count": 1, "Items": [{"id": {"S": "first"}}], "LastEvaluatedKey": {"id": {"S": "first"}}},
+        {"Count": 0, "Items": [], "ConsumedCapacity": {"CapacityUnits": 0.5}}]
+    query = engine.query(User.by_email, key=User.email == "foo@domain.com")
+
+    async def pages():
+        return [page async for page in query.iter_pages(raw=raw)]
+    first, second = run(pages())
+
+    if raw:
+        assert first.items == [{"id": {"S": "first"}}]
+    else:
+        assert [user.id for user in first.items] == ["first"]
+    assert first.last_evaluated_key == {"id": {"S": "first"}}
+    assert second == ([], None, {"CapacityUnits": 0.5})
+    assert query.count == 1
+    assert query.exhausted
+
+
+def test_scan(engine, dynamodb, run):
+    scan = engine.scan(User, parallel=(1, 5))
+    assert isinstance(scan, AsyncScanIterator)
+    assert scan.request["TotalSegments"] == 5
+
+    dynamodb.scan.return_value = {"Count": 1, "Items": [{"id": {"S": "only"}}]}
+    assert run(scan.one()).id == "only"
+
+    dynamodb.scan.return_value = {"Count": 0, "ScannedCount": 4, "Items": []}
+    with pytest.raises(ConstraintViolation):
+        run(scan.first())
+    assert scan.scanned == 4
+
+
+@pytest.mark.parametrize("parallel", [3, "auto"])
+def test_scan_managed_parallel(engine, parallel):
+    """AsyncEngine can't run every segment of a parallel scan"""
+    with pytest.raises(InvalidSearch):
+        engine.scan(User, parallel=parallel)
+
+
+def test_search_split_filter(engine):
+    """AsyncEngine can't send the requests for a filter that's too long"""
+    condition = OrCondition(*(User.email.begins_with("prefix-{}".format(i)) for i in range(400)))
+    with pytest.raises(InvalidSearch):
+        engine.scan(User, filter=condition)
+
+
+def test_find(engine):
+    query = engine.find(User, User.email == "foo@domain.com")
+    assert isinstance(query, AsyncQueryIterator)
+    assert query.plan.index is User.by_email
+    assert isinstance(engine.find(User), AsyncScanIterator)
+
+    # The index doesn't include every column
+    with pytest.raises(InvalidSearch):
+        engine.find(ComplexModel, (ComplexModel.name == uuid.uuid4()) & (ComplexModel.joined > "x"))
+
+
+def test_async_for(engine, dynamodb, run):
+    dynamodb.scan.return_value = {"Count": 2, "Items": [{"id": {"S": "first"}}, {"id": {"S": "second"}}]}
+    scan = engine.scan(User)
+
+    async def collect():
+        return [user.id async for user in scan]
+    assert run(collect()) == ["first", "second"]
+    with pytest.raises(TypeError):
+        iter(scan)
+
+
+def test_stream(engine, dynamodbstreams, run):
+    class StreamModel(BaseModel):
+        class Meta:
+            stream = {"include": {"new"}, "arn": "test-arn-manually-set"}
+        id = Column(String, hash_key=True)
+    run(engine.bind(StreamModel, skip_table_setup=True))
+    dynamodbstreams.describe_stream.return_value = {"StreamDescription": {"Shards": []}}
+
+    stream = run(engine.stream(StreamModel, "latest"))
+    assert isinstance(stream, AsyncStream)
+    assert stream.model is StreamModel
+    assert run(stream.__anext__()) is None
+
+    with pytest.raises(InvalidStream):
+        run(engine.stream(User, "latest"))
+
+
+def test_abstract_operations_raise(engine, run):
+    class Abstract(BaseModel):
+        class Meta:
+            abstract = True
+        id = Column(String, hash_key=True)
+    with pytest.raises(InvalidModel):
+        run(engine.save(Mock(Meta=Abstract.Meta)))
+    with pytest.raises(InvalidModel):
+        engine.scan(Abstract)
@@ -0,0 +1,200 @@
+import botocore.exceptions
+import pytest
+from tests.helpers.models import User
+
+from bloop.aio import AsyncSessionWrapper
+from bloop.exceptions import (
+    BloopException,
+    ConstraintViolation,
+    InvalidStream,
+    RecordsExpired,
+    ShardIteratorExpired,
+    TableMismatch,
+)
+from bloop.session import (
+    BATCH_GET_ITEM_CHUNK_SIZE,
+    RETRYABLE_ERROR_CODES,
+    RateLimiter,
+    RetryPolicy,
+)
+
+from . import AsyncClient
+from ..test_session import description_for
+
+
+def client_error(code):
+    error_response = {"Error": {
+        "Code": code,
+        "Message": "FooMessage"}}
+    operation_name = "OperationName"
+    return botocore.exceptions.ClientError(error_response, operation_name)
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_invalid_max_concurrency(dynamodb, max_concurrency):
+    with pytest.raises(ValueError):
+        AsyncSessionWrapper(AsyncClient(dynamodb), max_concurrency=max_concurrency)
+
+
+def test_save_item(session, dynamodb, run):
+    run(session.save_item({"TableName": "User", "Key": {"id": {"S": "foo"}}}))
+    dynamodb.update_item.assert_called_once_with(TableName="User", Key={"id": {"S": "foo"}})
+
+
+@pytest.mark.parametrize("operation, client_method", [
+    ("save_item", "update_item"),
+    ("delete_item", "delete_item")])
+def test_modify_item_errors(session, dynamodb, run, operation, client_method):
+    getattr(dynamodb, client_method).side_effect = client_error("ConditionalCheckFailedException")
+    with pytest.raises(ConstraintViolation):
+        run(getattr(session, operation)({"TableName": "User"}))
+
+    getattr(dynamodb, client_method).side_effect = client_error("FooError")
+    with pytest.raises(BloopException):
+        run(getattr(session, operation)({"TableName": "User"}))
+
+
+def test_retry_throttled(session, dynamodb, run, sleeps):
+    session.retry_policy = RetryPolicy(max_attempts=3, retry_on=RETRYABLE_ERROR_CODES)
+    dynamodb.delete_item.side_effect = [client_error("ThrottlingException"), {}]
+    run(session.delete_item({"TableName": "User"}))
+    assert dynamodb.delete_item.call_count == 2
+    assert len(sleeps) == 1
+    assert session.retry_policy.retries["delete_item"] == 1
+
+    dynamodb.delete_item.side_effect = client_error("ThrottlingException")
+    with pytest.raises(BloopException):
+        run(session.delete_item({"TableName": "User"}))
+    assert session.retry_policy.exhausted["delete_item"] == 1
+
+
+def test_retry_update_server_error(session, dynamodb, run, sleeps):
+    session.retry_policy = RetryPolicy(retry_on=RETRYABLE_ERROR_CODES)
+    dynamodb.update_item.side_effect = client_error("InternalServerError")
+    with pytest.raises(BloopException):
+        run(session.save_item({"TableName": "User"}))
+    assert dynamodb.update_item.call_count == 1
+    assert not sleeps
+
+
+def test_load_items_chunks(session, dynamodb, run):
+    session.max_concurrency = 4
+    keys = [{"id": {"S": str(i)}} for i in range(BATCH_GET_ITEM_CHUNK_SIZE + 1)]
+
+    def respond(RequestItems):
+        return {
+            "Responses": {"User": RequestItems["User"]["Keys"]},
+            "UnprocessedKeys": {}}
+    dynamodb.batch_get_item.side_effect = respond
+
+    response = run(session.load_items({"User": {"Keys": keys, "ConsistentRead": False}}))
+    assert dynamodb.batch_get_item.call_count == 2
+    assert sorted(item["id"]["S"] for item in response["User"]) == sorted(key["id"]["S"] for key in keys)
+
+
+def test_load_items_unprocessed(session, dynamodb, run, sleeps):
+    request = {"User": {"Keys": [{"id": {"S": "foo"}}], "ConsistentRead": False}}
+    dynamodb.batch_get_item.side_effect = [
+        {"Responses": {}, "UnprocessedKeys": request},
+        {"Responses": {"User": [{"id": {"S": "foo"}}]}, "UnprocessedKeys": {}}]
+    response = run(session.load_items(request))
+    assert response == {"User": [{"id": {"S": "foo"}}]}
+    assert len(sleeps) == 1
+
+    session.retry_policy = RetryPolicy(max_attempts=1)
+    dynamodb.batch_get_item.side_effect = None
+    dynamodb.batch_get_item.return_value = {"Responses": {}, "UnprocessedKeys": request}
+    with pytest.raises(BloopException):
+        run(session.load_items(request))
+
+
+def test_write_items_unprocessed(session, dynamodb, run, sleeps):
+    request = {"User": [{"DeleteRequest": {"Key": {"id": {"S": "foo"}}}}]}
+    dynamodb.batch_write_item.side_effect = [{"UnprocessedItems": request}, {"UnprocessedItems": {}}]
+    run(session.write_items(request))
+    assert dynamodb.batch_write_item.call_count == 2
+    assert len(sleeps) == 1
+
+
+@pytest.mark.parametrize("mode", ["query", "scan"])
+def test_search_items(session, dynamodb, run, mode):
+    getattr(dynamodb, mode).return_value = {"Count": 3}
+    response = run(getattr(session, mode + "_items")({"TableName": "User"}))
+    assert response == {"Count": 3, "ScannedCount": 3}
+
+    getattr(dynamodb, mode).side_effect = client_error("FooError")
+    with pytest.raises(BloopException):
+        run(session.search_items(mode, {"TableName": "User"}))
+
+
+def test_create_table_exists(session, dynamodb, run):
+    assert run(session.create_table("User", User))
+    dynamodb.create_table.side_effect = client_error("ResourceInUseException")
+    assert not run(session.create_table("User", User))
+
+
+def test_validate_table(session, dynamodb, run):
+    """Validating a table fills in the model's unknown units and configures the rate limiter"""
+    session.rate_limiter = RateLimiter()
+    dynamodb.describe_table.side_effect = [
+        {"Table": description_for(User, active=False)},
+        {"Table": description_for(User, active=True)}]
+    dynamodb.describe_time_to_live.return_value = {}
+    dynamodb.describe_continuous_backups.return_value = {}
+
+    run(session.validate_table("User", User))
+    assert dynamodb.describe_table.call_count == 2
+    assert ("User", None, "read") in session.rate_limiter.buckets
+
+    description = description_for(User, active=True)
+    description["AttributeDefinitions"] = []
+    dynamodb.describe_table.side_effect = None
+    dynamodb.describe_table.return_value = {"Table": description}
+    with pytest.raises(TableMismatch):
+        run(session.validate_table("User", User))
+
+
+def test_rate_limiter_requests_consumed_capacity(session, dynamodb, run):
+    session.rate_limiter = RateLimiter()
+    session.rate_limiter.configure("User", User)
+    dynamodb.update_item.return_value = {"ConsumedCapacity": {
+        "TableName": "User", "CapacityUnits": 3.0, "Table": {"CapacityUnits": 3.0}}}
+
+    run(session.save_item({"TableName": "User"}))
+    dynamodb.update_item.assert_called_once_with(TableName="User", ReturnConsumedCapacity="INDEXES")
+    assert session.rate_limiter.buckets["User", None, "write"].tokens < User.Meta.write_units
+
+
+def test_describe_stream_pages(session, dynamodbstreams, run):
+    dynamodbstreams.describe_stream.side_effect = [
+        {"StreamDescription": {"Shards": [{"ShardId": "first"}], "LastEvaluatedShardId": "first"}},
+        {"StreamDescription": {"Shards": [{"ShardId": "second"}], "StreamArn": "arn"}}]
+    description = run(session.describe_stream("arn"))
+    assert description == {"Shards": [{"ShardId": "first"}, {"ShardId": "second"}], "StreamArn": "arn"}
+
+    dynamodbstreams.describe_stream.side_effect = client_error("ResourceNotFoundException")
+    with pytest.raises(InvalidStream):
+        run(session.describe_stream("arn"))
+
+
+def test_get_shard_iterator(session, dynamodbstreams, run):
+    dynamodbstreams.get_shard_iterator.return_value = {"ShardIterator": "iterator-id"}
+    iterator_id = run(session.get_shard_iterator(
+        stream_arn="arn", shard_id="shard-id", iterator_type="at_sequence", sequence_number="3"))
+    assert iterator_id == "iterator-id"
+    dynamodbstreams.get_shard_iterator.assert_called_once_with(
+        StreamArn="arn", ShardId="shard-id", ShardIteratorType="AT_SEQUENCE_NUMBER", SequenceNumber="3")
+
+    dynamodbstreams.get_shard_iterator.side_effect = client_error("TrimmedDataAccessException")
+    with pytest.raises(RecordsExpired):
+        run(session.get_shard_iterator(stream_arn="arn", shard_id="shard-id", iterator_type="latest"))
+
+
+@pytest.mark.parametrize("code, exception", [
+    ("TrimmedDataAccessException", RecordsExpired),
+    ("ExpiredIteratorException", ShardIteratorExpired),
+    ("FooError", BloopException)])
+def test_get_stream_records_errors(session, dynamodbstreams, run, code, exception):
+    dynamodbstreams.get_records.side_effect = client_error(code)
+    with pytest.raises(exception):
+        run(session.get_stream_records("iterator-id"))
@@ -0,0 +1,183 @@
+import datetime
+
+import pytest
+
+from bloop.aio.stream import AsyncCoordinator, AsyncShard, AsyncStream
+from bloop.exceptions import InvalidPosition, InvalidStream, RecordsExpired, ShardIteratorExpired
+from bloop.models import BaseModel, Column
+from bloop.types import String
+
+from ..test_stream import build_get_records_responses, dynamodb_record_with, stream_description
+
+
+@pytest.fixture
+def stream_arn():
+    return "stream-arn"
+
+
+@pytest.fixture
+def coordinator(session, stream_arn):
+    return AsyncCoordinator(session=session, stream_arn=stream_arn)
+
+
+@pytest.fixture
+def shard(session, stream_arn):
+    return AsyncShard(stream_arn=stream_arn, shard_id="shard-id", session=session)
+
+
+@pytest.fixture
+def describe(dynamodbstreams):
+    """Sets the DescribeStream response.  The session mutates each response, so every call gets a new copy."""
+    def describe(n, shape=None):
+        dynamodbstreams.describe_stream.side_effect = lambda **kwargs: {
+            "StreamDescription": stream_description(n, shape, stream_arn="stream-arn")}
+    return describe
+
+
+@pytest.fixture
+def iterators(dynamodbstreams):
+    def get_shard_iterator(ShardId, ShardIteratorType, **kwargs):
+        return {"ShardIterator": "{}-{}".format(ShardId, ShardIteratorType.lower())}
+    dynamodbstreams.get_shard_iterator.side_effect = get_shard_iterator
+    return dynamodbstreams.get_shard_iterator
+
+
+def test_sync_iteration_disabled(coordinator, shard):
+    for obj in [coordinator, shard]:
+        with pytest.raises(TypeError):
+            iter(obj)
+        assert obj.__aiter__() is obj
+
+
+def test_move_to_trim_horizon(coordinator, describe, iterators, run):
+    # shard-id-0 -> shard-id-1, shard-id-2 is a separate root
+    describe(3, {0: 1})
+    run(coordinator.move_to("trim_horizon"))
+
+    assert all(isinstance(shard, AsyncShard) for shard in coordinator.active)
+    assert [shard.shard_id for shard in coordinator.active] == ["shard-id-0", "shard-id-2"]
+    assert [shard.iterator_id for shard in coordinator.active] == [
+        "shard-id-0-trim_horizon", "shard-id-2-trim_horizon"]
+
+
+def test_move_to_latest(coordinator, describe, iterators, run):
+    describe(3, {0: 1})
+    run(coordinator.move_to("latest"))
+    assert [shard.shard_id for shard in coordinator.active] == ["shard-id-1", "shard-id-2"]
+
+
+def test_move_to_token(coordinator, describe, iterators, run, stream_arn):
+    describe(2, {0: 1})
+    token = {
+        "stream_arn": stream_arn,
+        "active": ["shard-id-1"],
+        "shards": [
+            {"shard_id": "shard-id-0"},
+            {"shard_id": "shard-id-1", "parent": "shard-id-0",
+             "iterator_type": "after_sequence", "sequence_number": "3"}]}
+    run(coordinator.move_to(token))
+    assert coordinator.token == token
+    iterators.assert_called_once_with(
+        StreamArn=stream_arn, ShardId="shard-id-1",
+        ShardIteratorType="AFTER_SEQUENCE_NUMBER", SequenceNumber="3")
+
+    # Falls back to trim_horizon when the sequence number expired
+    iterators.side_effect = [RecordsExpired, {"ShardIterator": "trimmed"}]
+    run(coordinator.move_to(token))
+    assert coordinator.active[0].iterator_id == "trimmed"
+
+    token["shards"] = [{"shard_id": "unknown"}]
+    token["active"] = []
+    with pytest.raises(InvalidStream):
+        run(coordinator.move_to(token))
+
+
+def test_move_to_time(coordinator, describe, dynamodbstreams, iterators, run):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    old, new = now - datetime.timedelta(hours=2), now - datetime.timedelta(hours=1)
+    describe(1)
+    dynamodbstreams.get_records.return_value = {
+        "Records": [
+            dynamodb_record_with(key=True, sequence_number=1, creation_time=old),
+            dynamodb_record_with(key=True, sequence_number=2, creation_time=new)],
+        "NextShardIterator": "next"}
+
+    run(coordinator.move_to(now - datetime.timedelta(minutes=90)))
+    record = run(coordinator.__anext__())
+    assert record["meta"]["sequence_number"] == "2"
+
+    # Moving to the future is the same as latest
+    run(coordinator.move_to(now + datetime.timedelta(hours=1)))
+    assert coordinator.active[0].iterator_type == "latest"
+
+
+def test_move_to_invalid(coordinator, run):
+    with pytest.raises(InvalidPosition):
+        run(coordinator.move_to("foo"))
+
+
+def test_next_migrates_closed_shards(coordinator, shard, dynamodbstreams, iterators, run, stream_arn):
+    shard.iterator_id = "iterator-id"
+    coordinator.roots.append(shard)
+    coordinator.active.append(shard)
+    # single page of 2 records, then the shard closes
+    dynamodbstreams.get_records.side_effect = build_get_records_responses(2)
+    dynamodbstreams.describe_stream.return_value = {"StreamDescription": {"Shards": [
+        {"ShardId": "child-id", "ParentShardId": "shard-id"}]}}
+
+    first = run(coordinator.__anext__())
+    assert first["meta"]["sequence_number"] == "0"
+    assert shard.sequence_number == "0"
+    assert [child.shard_id for child in coordinator.active] == ["child-id"]
+    assert coordinator.active[0].iterator_id == "child-id-trim_horizon"
+    assert coordinator.closed == {shard: 1}
+
+    run(coordinator.__anext__())
+    assert not coordinator.closed
+
+
+def test_heartbeat(coordinator, shard, dynamodbstreams, run):
+    shard.iterator_id = "iterator-id"
+    shard.iterator_type = "latest"
+    coordinator.active.append(shard)
+    dynamodbstreams.get_records.return_value = {"Records": [], "NextShardIterator": "next"}
+    run(coordinator.heartbeat())
+    assert dynamodbstreams.get_records.call_args_list[0][1] == {"ShardIterator": "iterator-id"}
+    assert shard.iterator_id == "next"
+
+
+def test_shard_refreshes_expired_iterator(shard, dynamodbstreams, iterators, run):
+    shard.iterator_id = "expired"
+    shard.iterator_type = "after_sequence"
+    shard.sequence_number = "7"
+    dynamodbstreams.get_records.side_effect = [ShardIteratorExpired, *build_get_records_responses(1)]
+    assert len(run(shard.__anext__())) == 1
+    assert dynamodbstreams.get_records.call_args[1] == {"ShardIterator": "shard-id-after_sequence_number"}
+
+    # latest and trim_horizon iterators can't be refreshed without losing records
+    shard.iterator_id = "expired"
+    shard.iterator_type = "latest"
+    dynamodbstreams.get_records.side_effect = ShardIteratorExpired
+    with pytest.raises(ShardIteratorExpired):
+        run(shard.__anext__())
+
+
+def test_stream_unpacks_records(engine, describe, dynamodbstreams, iterators, run, stream_arn):
+    class StreamModel(BaseModel):
+        class Meta:
+            stream = {"include": {"new"}, "arn": stream_arn}
+        forum = Column(String, hash_key=True, dynamo_name="ForumName")
+        subject = Column(String, range_key=True, dynamo_name="Subject")
+
+    describe(1)
+    dynamodbstreams.get_records.return_value = {
+        "Records": [dynamodb_record_with(key=True, new=True)], "NextShardIterator": "next"}
+    stream = AsyncStream(model=StreamModel, engine=engine)
+    run(stream.move_to("trim_horizon"))
+    assert repr(stream) == "<AsyncStream[StreamModel]>"
+
+    record = run(stream.__anext__())
+    assert record["new"].forum == "DynamoDB"
+    assert record["old"] is None
+    assert stream.token["active"] == ["shard-id-0"]
+    run(stream.heartbeat())
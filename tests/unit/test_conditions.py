@@ -1,8 +1,10 @@
+import copy
 import logging
 import operator
 
 import pytest
 
+from bloop import actions
 from bloop.conditions import (
     AndCondition,
     BaseCondition,
@@ -20,18 +22,26 @@ from bloop.conditions import (
     Proxy,
     Reference,
     ReferenceTracker,
+    RenderCache,
+    _obj_tracking,
+    compile_condition,
+    diff_document,
     get_marked,
     get_snapshot,
+    get_tracking,
     iter_columns,
     iter_conditions,
+    mark_loaded,
+    normalize,
+    only_tracking_modified,
     printable_name,
     render,
 )
-from bloop.models import BaseModel, Column
-from bloop.signals import object_deleted, object_loaded, object_saved
+from bloop.models import BaseModel, Column, unpack_from_dynamodb
+from bloop.signals import object_deleted, object_loaded, object_modified, object_saved
 from bloop.types import Binary, Boolean, Integer, List, Map, Set, String
 
-from ..helpers.models import Document, User
+from ..helpers.models import Document, User, VectorModel
 
 
 class MockColumn(Column):
@@ -218,6 +228,38 @@ def test_on_saved(engine):
     )
 
 
+def test_snapshot_built_on_demand(engine):
+    """Syncing only keeps the dumped values; the condition is built and cached by get_snapshot"""
+    user = User(name="foo", age=3)
+    object_saved.send(engine, engine=engine, obj=user)
+    tracking = get_tracking(user)
+    assert tracking["snapshot"] is None
+    assert tracking["synced"] == {User.name: {"S": "foo"}, User.age: {"N": "3"}}
+
+    snapshot = get_snapshot(user)
+    assert get_snapshot(user) is snapshot
+    user.name = "bar"
+    object_saved.send(engine, engine=engine, obj=user)
+    assert get_snapshot(user) == (
+        User.age.is_({"N": "3"}) &
+        User.name.is_({"S": "bar"})
+    )
+
+
+def test_snapshot_keeps_loaded_values(engine):
+    """When every marked column was bulk loaded, DynamoDB's values are kept without dumping anything"""
+    user = User()
+    loaded = {User.id: {"S": "user_id"}, User.age: None}
+    mark_loaded(user, loaded)
+    engine._dump = lambda *_, **__: pytest.fail("nothing should be dumped")
+    object_loaded.send(engine, engine=engine, obj=user)
+    assert get_tracking(user)["synced"] is loaded
+    assert get_snapshot(user) == (
+        User.age.is_(None) &
+        User.id.is_({"S": "user_id"})
+    )
+
+
 # END TRACKING SIGNALS ========================================================================== END TRACKING SIGNALS
 
 
@@ -569,6 +611,75 @@ def test_render_atomic_only_partial(engine):
     }
 
 
+def test_render_atomic_lazy(engine):
+    """Lazy columns use DynamoDB's value for the snapshot, whether or not they've been read"""
+    attrs = {"id": {"S": "user_id"}, "age": {"N": "3"}}
+    eager = unpack_from_dynamodb(attrs=attrs, expected={User.id, User.age}, model=User, engine=engine)
+    lazy = unpack_from_dynamodb(attrs=attrs, expected={User.id, User.age}, model=User, engine=engine, lazy=True)
+    object_loaded.send(engine, engine=engine, obj=eager)
+    object_loaded.send(engine, engine=engine, obj=lazy)
+
+    expected = render(engine, obj=eager, atomic=True)
+    assert render(engine, obj=lazy, atomic=True) == expected
+    assert lazy.age == 3
+    assert render(engine, obj=lazy, atomic=True) == expected
+
+    # Changing the value after it's loaded still updates the column, against the loaded snapshot
+    lazy.age = 4
+    rendered = render(engine, obj=lazy, atomic=True, update=True)
+    assert rendered["ExpressionAttributeValues"][":v4"] == {"N": "4"}
+    assert rendered["UpdateExpression"] == "SET #n0=:v4"
+    assert rendered["ConditionExpression"] == "((#n0 = :v1) AND (#n2 = :v3))"
+
+
+def test_tracking_on_instance():
+    """Models keep their tracking state on the instance; other objects use the weak-keyed dict"""
+    user = User(id="user_id")
+    assert user._bloop_tracking is get_tracking(user)
+    assert get_tracking(user)["marked"] == {User.id}
+    assert user not in _obj_tracking
+
+    class NotAModel:
+        pass
+    obj = NotAModel()
+    User.name.__set__(obj, "name")
+    assert get_marked(obj) == {User.name}
+    assert _obj_tracking[obj] is get_tracking(obj)
+
+
+def test_tracking_not_copied():
+    user = User(id="user_id")
+    same = copy.copy(user)
+    same.name = "name"
+    assert get_marked(user) == {User.id}
+    assert get_marked(same) == {User.name}
+    assert same.id == "user_id"
+
+
+def test_only_tracking_modified():
+    assert only_tracking_modified()
+    with object_modified.connected_to(lambda *_, **__: None):
+        assert not only_tracking_modified()
+
+
+def test_mark_loaded_snapshot(engine):
+    """bulk loaded values are used for the next object_loaded snapshot, unless the column changes first"""
+    user = User(id="user_id", age=3)
+    mark_loaded(user, {User.id: {"S": "user_id"}, User.age: {"N": "3"}, User.email: None})
+    assert get_marked(user) == {User.id, User.age, User.email}
+
+    user.age = 4
+    object_loaded.send(engine, engine=engine, obj=user)
+    assert get_snapshot(user) == (
+        (User.age == {"N": "4"}) & User.email.is_(None) & (User.id == {"S": "user_id"}))
+
+    # Only the next object_loaded uses the loaded values
+    mark_loaded(user, {User.age: {"N": "1"}})
+    object_saved.send(engine, engine=engine, obj=user)
+    assert get_snapshot(user) == (
+        (User.age == {"N": "4"}) & User.email.is_(None) & (User.id == {"S": "user_id"}))
+
+
 def test_render_atomic_and_condition(engine):
     """Atomic condition and condition are ANDed together (condition first)"""
     user = User(id="user_id", age=3, email=None)
@@ -703,6 +814,130 @@ def test_render_update_remove_only(renderer):
     }
 
 
+def test_render_update_actions(renderer):
+    """Actions render as ADD, DELETE, and SET with list_append, after SET and REMOVE"""
+    document = Document(value=actions.add(3), numbers=actions.append([1, 2]), some_string=None)
+    renderer.render_update_expression(document)
+    assert renderer.rendered == {
+        "ExpressionAttributeNames": {"#n0": "numbers", "#n3": "some_string", "#n5": "value"},
+        "ExpressionAttributeValues": {
+            ":v1": {"L": [{"N": "1"}, {"N": "2"}]},
+            ":v2": {"L": []},
+            ":v6": {"N": "3"}},
+        "UpdateExpression": "SET #n0=list_append(if_not_exists(#n0, :v2), :v1) REMOVE #n3 ADD #n5 :v6",
+    }
+
+
+def test_render_update_set_actions(renderer):
+    obj = VectorModel(set_str=actions.delete({"a"}))
+    renderer.render_update_expression(obj)
+    assert renderer.rendered == {
+        "ExpressionAttributeNames": {"#n0": "set_str"},
+        "ExpressionAttributeValues": {":v1": {"SS": ["a"]}},
+        "UpdateExpression": "DELETE #n0 :v1",
+    }
+
+
+def test_render_update_empty_action(renderer):
+    """Actions that don't change anything aren't rendered"""
+    obj = VectorModel(set_str=actions.add(set()), list_str=actions.append([]))
+    renderer.render_update_expression(obj)
+    assert not renderer.rendered
+
+
+@pytest.mark.parametrize("column, action", [
+    (User.name, actions.add("foo")),
+    (User.age, actions.delete(3)),
+    (User.age, actions.append([3])),
+])
+def test_render_update_action_unsupported(renderer, column, action):
+    user = User()
+    setattr(user, column.name, action)
+    with pytest.raises(InvalidCondition):
+        renderer.render_update_expression(user)
+
+
+def test_saved_actions_cleared(engine):
+    """After a save, columns with actions aren't known and aren't marked"""
+    user = User(id="user_id", age=actions.add(1), name="foo")
+    object_saved.send(engine, engine=engine, obj=user)
+    assert not hasattr(user, "age")
+    assert get_marked(user) == {User.id, User.name}
+    assert get_snapshot(user) == (
+        User.id.is_({"S": "user_id"}) &
+        User.name.is_({"S": "foo"})
+    )
+
+
+def n(value):
+    return {"N": str(value)}
+
+
+@pytest.mark.parametrize("old, new, changes", [
+    ({"M": {"a": n(1)}}, {"M": {"a": n(1)}}, []),
+    ({"M": {"a": n(1), "b": n(2)}}, {"M": {"a": n(3), "c": n(4)}}, [
+        (["a"], "set", n(3)), (["c"], "set", n(4)), (["b"], "remove", None)]),
+    ({"M": {"a": {"M": {"b": n(1)}}}}, {"M": {"a": {"M": {"b": n(2)}}}}, [(["a", "b"], "set", n(2))]),
+    ({"M": {"a": n(1)}}, {"M": {"a": {"L": [n(1)]}}}, [(["a"], "set", {"L": [n(1)]})]),
+    ({"L": [n(1), n(2)]}, {"L": [n(1), n(3)]}, [([1], "set", n(3))]),
+    ({"L": [n(1)]}, {"L": [n(1), n(2), n(3)]}, [([], "append", {"L": [n(2), n(3)]})]),
+    ({"L": [n(1), n(2), n(3)]}, {"L": [n(1)]}, [([1], "remove", None), ([2], "remove", None)]),
+    ({"L": [n(1), n(2)]}, {"L": [n(2)]}, [([], "set", {"L": [n(2)]})]),
+    ({"M": {"a": n(1)}}, None, [([], "remove", None)]),
+])
+def test_diff_document(old, new, changes):
+    assert list(diff_document(old, new)) == changes
+
+
+def test_render_update_document_paths(engine, renderer):
+    """Only the parts of a synced Map or List that changed are rendered"""
+    document = Document(id=0, data={"Rating": 3, "Description": {"Heading": "h", "Body": "b"}}, numbers=[1, 2])
+    object_saved.send(engine, engine=engine, obj=document)
+
+    document.data["Description"]["Body"] = "new body"
+    del document.data["Rating"]
+    document.numbers.append(3)
+    document.data = document.data
+    document.numbers = document.numbers
+    renderer.render_update_expression(document)
+    assert renderer.rendered == {
+        "ExpressionAttributeNames": {
+            "#n1": "data", "#n2": "Description", "#n3": "Body", "#n5": "Rating", "#n7": "numbers"},
+        "ExpressionAttributeValues": {":v4": {"S": "new body"}, ":v8": {"L": [{"N": "3"}]}},
+        "UpdateExpression": "SET #n1.#n2.#n3=:v4, #n7=list_append(#n7, :v8) REMOVE #n1.#n5",
+    }
+
+
+def test_render_update_document_unchanged(engine, renderer):
+    """A synced document that didn't change isn't rendered, and a replaced one is set as a whole"""
+    document = Document(id=0, data={"Rating": 3}, nested_numbers=[[1], [2]])
+    object_saved.send(engine, engine=engine, obj=document)
+    document.nested_numbers = [[2]]
+    renderer.render_update_expression(document)
+    assert renderer.rendered == {
+        "ExpressionAttributeNames": {"#n1": "nested_numbers"},
+        "ExpressionAttributeValues": {":v2": {"L": [{"L": [{"N": "2"}]}]}},
+        "UpdateExpression": "SET #n1=:v2",
+    }
+
+
+@pytest.mark.parametrize("column, before, after", [
+    ("numbers", list(range(1000)), [i + 1 for i in range(1000)]),
+    ("nested_numbers", [[i] for i in range(20)], [[i + 1] for i in range(20)]),
+    # Fewer paths, but their values are as large as the whole document
+    ("numbers", [1, 2], [3, 4]),
+])
+def test_render_update_document_rewritten(engine, renderer, column, before, after):
+    """A document with many changed paths, or changes as large as the document, is set as a whole"""
+    document = Document(id=0, **{column: before})
+    object_saved.send(engine, engine=engine, obj=document)
+    setattr(document, column, after)
+    renderer.render_update_expression(document)
+    rendered = renderer.rendered
+    assert rendered["UpdateExpression"] == "SET #n0=:v1"
+    assert rendered["ExpressionAttributeValues"] == {":v1": engine._dump(getattr(Document, column).typedef, after)}
+
+
 def test_render_update_set_and_remove(renderer):
     """Some values set, some values removed"""
     document = Document()
@@ -725,6 +960,137 @@ def test_render_update_set_and_remove(renderer):
     }
 
 
+@pytest.mark.parametrize("build", [
+    lambda value: User.age >= value,
+    lambda value: User.name.begins_with(str(value)),
+    lambda value: User.age.between(value, value + 1),
+    lambda value: User.age.in_(value, value + 1, value + 2),
+    lambda value: ~((User.email == str(value)) | (User.name != "name")),
+    lambda value: User.age == User.age,
+    lambda value: Document.data["Rating"] >= value,
+    lambda value: Document.numbers.contains(value),
+])
+def test_render_cache_conditions(build, engine):
+    """A cached shape renders the same request as the renderer, with the new values"""
+    cache = RenderCache()
+    for value in (1, 2):
+        condition = build(value)
+        expected = render(engine, filter=condition)
+        assert render(engine, filter=condition, cache=cache) == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_render_cache_none_changes_shape(engine):
+    """Values that dump to None render differently, so they're a different shape"""
+    cache = RenderCache()
+    first = render(engine, condition=User.email == "@", cache=cache)
+    second = render(engine, condition=User.email == None, cache=cache)  # noqa: E711
+    assert first["ConditionExpression"] == "(#n0 = :v1)"
+    assert second == {
+        "ConditionExpression": "(attribute_not_exists(#n0))",
+        "ExpressionAttributeNames": {"#n0": "email"}}
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_render_cache_update(engine):
+    """Atomic saves of the same marked columns share a shape"""
+    cache = RenderCache()
+    user = User(id="user_id", age=3, name="name")
+    object_saved.send(engine, engine=engine, obj=user)
+    for age in (4, 5):
+        user.age = age
+        user.email = "e@mail"
+        expected = render(engine, obj=user, atomic=True, update=True)
+        assert render(engine, obj=user, atomic=True, update=True, cache=cache) == expected
+    assert expected["ExpressionAttributeValues"][":v6"] == {"N": "5"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_render_cache_uncacheable(engine):
+    """Custom conditions and changed documents are rendered without the cache"""
+    class CustomCondition(ComparisonCondition):
+        pass
+    cache = RenderCache()
+    condition = CustomCondition("==", User.age, 3)
+    assert render(engine, filter=condition, cache=cache) == render(engine, filter=condition)
+
+    document = Document(id=0, data={"Rating": 3})
+    object_saved.send(engine, engine=engine, obj=document)
+    document.data["Rating"] = 4
+    document.data = document.data
+    assert render(engine, obj=document, update=True, cache=cache) == render(engine, obj=document, update=True)
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_render_cache_results_not_shared(engine):
+    cache = RenderCache(maxsize=1)
+    render(engine, filter=User.age >= 3, cache=cache)["ExpressionAttributeNames"]["#n0"] = "modified"
+    assert render(engine, filter=User.age >= 4, cache=cache)["ExpressionAttributeNames"] == {"#n0": "age"}
+
+    # Only the most recent shape is kept
+    render(engine, filter=User.age <= 4, cache=cache)
+    render(engine, filter=User.age >= 5, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 3)
+    assert len(cache.templates) == 1
+
+
+def test_normalize_flattens(engine):
+    """Nested AND/OR are flattened, and empty or duplicate conditions are dropped"""
+    a, b, c = User.age >= 3, User.name == "foo", User.email.contains("@")
+    condition = AndCondition(a, AndCondition(b, Condition(), OrCondition()), AndCondition(User.age >= 3, c))
+    assert normalize(condition, engine) == AndCondition(a, b, c)
+    # The original isn't modified
+    assert len(condition.values) == 3
+
+    assert normalize(OrCondition(AndCondition(a)), engine) is a
+    assert normalize(NotCondition(NotCondition(a)), engine) is a
+    assert normalize(NotCondition(AndCondition()), engine) == Condition()
+    assert normalize(OrCondition(a, OrCondition(b, c)), engine) == OrCondition(a, b, c)
+    # Different columns, same values
+    assert len(normalize((User.name == "foo") | (User.email == "foo"), engine).values) == 2
+
+
+def test_normalize_collapses_in(engine):
+    """== and IN on one column within an OR become one IN, in place of the first"""
+    condition = (User.age == 1) | (User.name == "foo") | (User.age == 2) | User.age.in_(3, 4)
+    normalized = normalize(condition, engine)
+    expected = InCondition(User.age, [{"N": str(i)} for i in range(1, 5)])
+    assert normalized == OrCondition(expected, User.name == "foo")
+    assert normalized.values[0].dumped
+
+    renderer = ConditionRenderer(engine)
+    renderer.render(filter=condition)
+    assert renderer.rendered == {
+        "ExpressionAttributeNames": {"#n4": "age", "#n5": "name"},
+        "ExpressionAttributeValues": {
+            ":v0": {"N": "1"}, ":v1": {"N": "2"}, ":v2": {"N": "3"}, ":v3": {"N": "4"}, ":v6": {"S": "foo"}},
+        "FilterExpression": "((#n4 IN (:v0, :v1, :v2, :v3)) OR (#n5 = :v6))"
+    }
+
+
+def test_normalize_splits_in(engine):
+    """An IN with more values than DynamoDB allows becomes an OR of smaller INs"""
+    normalized = normalize(User.age.in_(*range(250)), engine)
+    assert normalized.operation == "or"
+    assert [len(value.values) for value in normalized.values] == [100, 100, 50]
+    assert normalized.values[2] == User.age.in_(*range(200, 250))
+
+
+@pytest.mark.parametrize("condition", [
+    # Only one condition for the column
+    (User.age == 1) | (User.age > 2),
+    # Not an OR
+    (User.age == 1) & (User.age == 2),
+    # Rendered as attribute_not_exists
+    (User.age == 1) | (User.age == None) | (User.name == ""),  # noqa: E711
+    # Against another column
+    (User.age == 1) | (User.age == User.age),
+    # Too many values
+    OrCondition(*(User.age == i for i in range(101))),
+])
+def test_normalize_doesnt_collapse(condition, engine):
+    assert normalize(condition, engine) == condition
+
 # END RENDERER ========================================================================================== END RENDERER
 
 
@@ -1531,6 +1897,12 @@ def test_iter_columns_path():
     assert set(iter_columns(path.begins_with("hello, world"))) == {Document.data}
 
 
+def test_iter_columns_value_path():
+    """Columns and paths in values are yielded even when the condition's column was already seen"""
+    condition = (Document.value == 1) & (Document.value < Document.numbers[0])
+    assert set(iter_columns(condition)) == {Document.value, Document.numbers}
+
+
 @pytest.mark.parametrize("condition", [*non_meta_conditions(column=User.age), *meta_conditions(column=User.age)])
 def test_iter_columns_single(condition):
     assert set(iter_columns(condition)) == {User.age}
@@ -1559,3 +1931,103 @@ def test_iter_columns_nested():
 
 
 # END ITERATORS ======================================================================================== END ITERATORS
+
+
+# EVALUATION ============================================================================================== EVALUATION
+
+def n(value):
+    return {"N": str(value)}
+
+
+vector = {
+    "name": {"S": "foo"},
+    "list_str": {"L": [{"S": "a"}, {"S": "b"}]},
+    "set_str": {"SS": ["x", "y"]},
+    "map_nested": {"M": {
+        "bytes": {"B": "Ynl0ZXM="},
+        "str": {"S": "héllo"},
+        "map": {"M": {"int": n(3)}}}}
+}
+
+
+@pytest.mark.parametrize("condition, expected", [
+    (VectorModel.name == "foo", True),
+    (VectorModel.name != "foo", False),
+    (VectorModel.name < "fop", True),
+    (VectorModel.name >= "g", False),
+    (VectorModel.name.begins_with("fo"), True),
+    (VectorModel.name.between("a", "f"), False),
+    (VectorModel.name.in_("bar", "foo"), True),
+    (VectorModel.name.contains("oo"), True),
+    # Missing attributes only match == None, and != anything that exists
+    (VectorModel.name == None, False),  # noqa: E711
+    (VectorModel.list_str[5] == None, True),  # noqa: E711
+    (VectorModel.list_str[5] == "a", False),
+    (VectorModel.list_str[5] != "a", True),
+    (~(VectorModel.list_str[5] == "a"), True),
+    (VectorModel.name != VectorModel.list_str[5], True),
+    (VectorModel.list_str[5] != VectorModel.list_str[6], False),
+    # Document paths
+    (VectorModel.list_str[1] == "b", True),
+    (VectorModel.map_nested["map"]["int"] > 2, True),
+    (VectorModel.map_nested["map"]["int"].between(3, 3), True),
+    (VectorModel.map_nested["map"]["str"] == None, True),  # noqa: E711
+    (VectorModel.map_nested["bytes"].begins_with(b"byt"), True),
+    (VectorModel.map_nested["bytes"] < b"bytez", True),
+    # By code point
+    (VectorModel.map_nested["str"] > "hz", True),
+    # Collections
+    (VectorModel.list_str.contains("a"), True),
+    (VectorModel.set_str.contains("z"), False),
+    (VectorModel.set_str == {"y", "x"}, True),
+    (VectorModel.list_str == ["b", "a"], False),
+    # Another column
+    (VectorModel.name == VectorModel.map_nested["str"], False),
+    (VectorModel.list_str[0] < VectorModel.name, True),
+    (VectorModel.name.in_("bar", VectorModel.name), True),
+    # AND, OR, empty
+    ((VectorModel.name == "foo") & (VectorModel.set_str.contains("x")), True),
+    ((VectorModel.name == "bar") | (VectorModel.list_str[0] == "b"), False),
+    (Condition(), True),
+])
+def test_compile_condition_item(condition, expected, engine):
+    assert compile_condition(condition, engine)(vector) is expected
+
+
+def test_compile_condition_numbers(engine):
+    """Numbers compare by value, not by their string or type"""
+    matches = compile_condition((Document.value == 1) & (Document.numbers[0] < 10), engine)
+    assert matches({"value": {"N": "1.00"}, "numbers": {"L": [n(9)]}})
+    assert not matches({"value": {"S": "1"}, "numbers": {"L": [n(9)]}})
+    assert not matches({"value": n(1), "numbers": {"L": [n(10)]}})
+
+
+def test_compile_condition_instance(engine):
+    user = User(id="user_id", age=20, email="admin@domain.com")
+    condition = User.age.between(18, 30) & User.email.begins_with("admin") & (User.name == None)  # noqa: E711
+    matches = compile_condition(condition, engine)
+    assert matches(user)
+    user.name = "foo"
+    assert not matches(user)
+
+    # Columns compared to other columns are dumped too
+    assert compile_condition((User.age == 20) & (User.age != User.name), engine)(user)
+
+    user.age = actions.add(1)
+    with pytest.raises(InvalidCondition):
+        matches(user)
+
+
+@pytest.mark.parametrize("condition", [
+    User.age < None,
+    User.name.begins_with(None),
+    User.age.between(1, None),
+    User.name.contains(None),
+    InCondition(User.age, []),
+])
+def test_compile_condition_invalid(condition, engine):
+    with pytest.raises(InvalidCondition):
+        compile_condition(condition, engine)
+
+
+# END EVALUATION ====================================================================================== END EVALUATION
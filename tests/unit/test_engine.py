@@ -4,10 +4,13 @@ import uuid
 from unittest.mock import Mock
 
 import pytest
-from tests.helpers.models import ComplexModel, User, VectorModel
+from tests.helpers.models import ComplexModel, Document, User, VectorModel
 
+from bloop import actions
 from bloop.engine import Engine, dump_key
 from bloop.exceptions import (
+    ConstraintViolation,
+    InvalidCondition,
     InvalidModel,
     InvalidStream,
     InvalidTemplate,
@@ -16,10 +19,11 @@ from bloop.exceptions import (
     UnknownType,
 )
 from bloop.models import BaseModel, Column, GlobalSecondaryIndex
+from bloop.search import FetchIterator, ParallelScanIterator, QueryIterator, ScanIterator
 from bloop.session import SessionWrapper
-from bloop.signals import object_saved
+from bloop.signals import object_deleted, object_loaded, object_saved
 from bloop.types import DateTime, Integer, String, Timestamp
-from bloop.util import ordered
+from bloop.util import LazyValue, ordered
 
 
 def test_default_table_name_template(dynamodb, dynamodbstreams, session):
@@ -90,6 +94,16 @@ def test_func_table_name_template(dynamodb, dynamodbstreams, session):
     session.validate_table.assert_called_once_with(expected, LocalModel)
 
 
+def test_session_param(session):
+    engine = Engine(session=session)
+    assert engine.session is session
+
+
+def test_session_param_with_clients(session, dynamodb):
+    with pytest.raises(ValueError):
+        Engine(session=session, dynamodb=dynamodb)
+
+
 def test_missing_objects(engine, session, caplog):
     """When objects aren't loaded, MissingObjects is raised with a list of missing objects"""
     # Patch batch_get_items to return no results
@@ -178,6 +192,39 @@ def test_load_objects(engine, session):
     assert user2.name == "bar"
 
 
+def test_load_as_dict(engine, session):
+    """as_dict returns the loaded values without modifying the objects or sending object_loaded"""
+    user1 = User(id="user1")
+    user2 = User(id="user2", name="unchanged")
+    session.load_items.return_value = {
+        "User": [
+            {"age": {"N": 5}, "name": {"S": "foo"}, "id": {"S": "user1"}},
+            {"id": {"S": "user2"}}
+        ]
+    }
+
+    with object_loaded.connected_to(lambda *_, **__: pytest.fail("object_loaded should not be sent")):
+        loaded = engine.load(user1, user2, as_dict=True)
+
+    assert loaded == {
+        user1: {"id": "user1", "age": 5, "name": "foo"},
+        user2: {"id": "user2"}
+    }
+    assert not hasattr(user1, "age")
+    assert user2.name == "unchanged"
+
+
+def test_load_lazy(engine, session):
+    """lazy keeps values in their DynamoDB form until they're read"""
+    user = User(id="user1")
+    session.load_items.return_value = {"User": [{"age": {"N": "5"}, "id": {"S": "user1"}}]}
+    engine.load(user, lazy=True)
+
+    assert isinstance(user.__dict__["age"], LazyValue)
+    assert user.age == 5
+    assert user.__dict__["age"] == 5
+
+
 def test_load_repeated_objects(engine, session):
     """The same object is only loaded once"""
     user = User(id="user_id")
@@ -384,6 +431,52 @@ def test_save_twice(engine, session):
     assert session.save_item.call_count == 2
 
 
+def test_save_unchanged_skipped(engine, session):
+    """Saving an object that was already saved and has no changes doesn't call DynamoDB"""
+    user = User(id="user_id")
+    engine.save(user)
+    session.save_item.assert_called_once_with({"Key": {"id": {"S": "user_id"}}, "TableName": "User"})
+    assert engine.skipped_saves == 0
+
+    saved = []
+    with object_saved.connected_to(lambda _, obj, **kwargs: saved.append(obj)):
+        engine.save(user)
+    session.save_item.assert_called_once()
+    assert engine.skipped_saves == 1
+    assert not saved
+
+
+@pytest.mark.parametrize("kwargs", [{"condition": User.age.is_(None)}, {"atomic": True}])
+def test_save_unchanged_with_condition(engine, session, kwargs):
+    """Saves with a condition or atomic still check the item"""
+    user = User(id="user_id")
+    object_saved.send(engine, engine=engine, obj=user)
+    engine.save(user, **kwargs)
+    session.save_item.assert_called_once()
+    assert engine.skipped_saves == 0
+
+
+def test_save_unchanged_after_actions(engine, session):
+    """Columns cleared after applying an action don't need to be saved again"""
+    user = User(id="user_id", age=actions.add(1))
+    engine.save(user)
+    engine.save(user)
+    assert session.save_item.call_count == 1
+    assert engine.skipped_saves == 1
+
+
+def test_save_unchanged_document(engine, session):
+    document = Document(id=0, data={"Rating": 3}, numbers=[1, 2])
+    engine.save(document)
+    engine.save(document)
+    assert session.save_item.call_count == 1
+
+    document.numbers.append(3)
+    engine.save(document)
+    assert session.save_item.call_count == 2
+    assert engine.skipped_saves == 1
+
+
 def test_save_list_with_condition(engine, session, caplog):
     users = [User(id=str(i)) for i in range(3)]
     condition = User.id.is_(None)
@@ -500,6 +593,159 @@ def test_save_del_only(engine, session):
     session.save_item.assert_called_once_with(expected)
 
 
+def test_save_batch(engine, session, caplog):
+    """Batched saves put the full item, once per unique key"""
+    users = [User(id=str(i), age=i) for i in range(3)]
+    duplicate = User(id="0", age=0)
+    saved = []
+
+    @object_saved.connect
+    def on_saved(_, obj, **__):
+        saved.append(obj)
+
+    engine.save(*users, duplicate, batch=True)
+    session.write_items.assert_called_once()
+    session.save_item.assert_not_called()
+    request = session.write_items.call_args[0][0]
+    assert ordered(request) == ordered({
+        "User": [
+            {"PutRequest": {"Item": {"id": {"S": user.id}, "age": {"N": str(user.age)}}}}
+            for user in users
+        ]
+    })
+    assert set(saved) == {*users, duplicate}
+    assert caplog.record_tuples[-1] == ("bloop.engine", logging.INFO, "successfully saved 4 objects")
+
+
+@pytest.mark.parametrize("op_name", ["save", "delete"])
+@pytest.mark.parametrize("kwargs", [{"atomic": True}, {"condition": User.age > 3}])
+def test_batch_conditional_raises(engine, session, op_name, kwargs):
+    user = User(id="user_id")
+    with pytest.raises(InvalidCondition):
+        getattr(engine, op_name)(user, batch=True, **kwargs)
+    session.write_items.assert_not_called()
+
+
+class Versioned(BaseModel):
+    class Meta:
+        version = "version"
+    id = Column(String, hash_key=True)
+    data = Column(String)
+    version = Column(Integer, dynamo_name="v")
+
+
+def test_save_versioned(engine, session):
+    """Saves only check the version, with or without atomic, and increment it when they succeed"""
+    obj = Versioned(id="obj_id", data="first")
+    engine.save(obj, atomic=True)
+    session.save_item.assert_called_once_with({
+        "TableName": "Versioned",
+        "Key": {"id": {"S": "obj_id"}},
+        "ConditionExpression": "(attribute_not_exists(#n0))",
+        "UpdateExpression": "SET #n0=:v2, #n3=:v4",
+        "ExpressionAttributeNames": {"#n0": "v", "#n3": "data"},
+        "ExpressionAttributeValues": {":v2": {"N": "1"}, ":v4": {"S": "first"}}})
+    assert obj.version == 1
+
+    session.save_item.reset_mock()
+    engine.save(obj)
+    session.save_item.assert_called_once_with({
+        "TableName": "Versioned",
+        "Key": {"id": {"S": "obj_id"}},
+        "ConditionExpression": "(#n0 = :v1)",
+        "UpdateExpression": "SET #n0=:v2, #n3=:v4",
+        "ExpressionAttributeNames": {"#n0": "v", "#n3": "data"},
+        "ExpressionAttributeValues": {":v1": {"N": "1"}, ":v2": {"N": "2"}, ":v4": {"S": "first"}}})
+    assert obj.version == 2
+
+
+def test_save_versioned_unchanged_skipped(engine, session):
+    """A versioned object with nothing to update besides its version isn't sent, and keeps its version"""
+    obj = Versioned(id="obj_id", version=3)
+    object_saved.send(engine, engine=engine, obj=obj)
+    engine.save(obj)
+    session.save_item.assert_not_called()
+    assert engine.skipped_saves == 1
+    assert obj.version == 3
+
+    # A condition is still checked, and the version still increments
+    engine.save(obj, condition=Versioned.data.is_(None))
+    session.save_item.assert_called_once()
+    assert obj.version == 4
+
+    obj.data = "changed"
+    engine.save(obj)
+    assert session.save_item.call_count == 2
+    assert engine.skipped_saves == 1
+    assert obj.version == 5
+
+
+def test_save_versioned_conflict(engine, session):
+    """The local version isn't changed when the save fails"""
+    obj = Versioned(id="obj_id", version=3)
+    session.save_item.side_effect = ConstraintViolation("conflict", {})
+    with pytest.raises(ConstraintViolation):
+        engine.save(obj)
+    assert obj.version == 3
+
+
+def test_delete_versioned(engine, session):
+    obj = Versioned(id="obj_id", version=3)
+    engine.delete(obj)
+    session.delete_item.assert_called_once_with({
+        "TableName": "Versioned",
+        "Key": {"id": {"S": "obj_id"}},
+        "ConditionExpression": "(#n0 = :v1)",
+        "ExpressionAttributeNames": {"#n0": "v"},
+        "ExpressionAttributeValues": {":v1": {"N": "3"}}})
+
+
+@pytest.mark.parametrize("op_name", ["save", "delete"])
+def test_batch_versioned_raises(engine, session, op_name):
+    with pytest.raises(InvalidCondition):
+        getattr(engine, op_name)(User(id="user_id"), Versioned(id="obj_id"), batch=True)
+    session.write_items.assert_not_called()
+
+
+def test_save_batch_actions_raises(engine, session):
+    """Batched saves replace the whole item, so they can't apply update actions"""
+    with pytest.raises(InvalidCondition):
+        engine.save(User(id="user_id", age=actions.add(1)), batch=True)
+    session.write_items.assert_not_called()
+
+    engine.delete(User(id="user_id", age=actions.add(1)), batch=True)
+    session.write_items.assert_called_once()
+
+
+def test_save_actions(engine, session):
+    user = User(id="user_id", age=actions.add(1))
+    engine.save(user)
+    session.save_item.assert_called_once_with({
+        "TableName": "User",
+        "Key": {"id": {"S": "user_id"}},
+        "UpdateExpression": "ADD #n0 :v1",
+        "ExpressionAttributeNames": {"#n0": "age"},
+        "ExpressionAttributeValues": {":v1": {"N": "1"}}})
+    assert not hasattr(user, "age")
+
+
+def test_delete_batch(engine, session):
+    users = [User(id=str(i)) for i in range(3)]
+    deleted = []
+
+    @object_deleted.connect
+    def on_deleted(_, obj, **__):
+        deleted.append(obj)
+
+    engine.delete(*users, batch=True)
+    session.delete_item.assert_not_called()
+    request = session.write_items.call_args[0][0]
+    assert ordered(request) == ordered({
+        "User": [{"DeleteRequest": {"Key": {"id": {"S": user.id}}}} for user in users]
+    })
+    assert set(deleted) == set(users)
+
+
 def test_delete_multiple_condition(engine, session, caplog):
     users = [User(id=str(i)) for i in range(3)]
     condition = User.id == "foo"
@@ -606,6 +852,103 @@ def test_scan(engine):
     assert model_scan.model is User
     assert model_scan.index is None
 
+    assert engine.scan(User, lazy=True).lazy is True
+    assert engine.query(User, key=User.Meta.hash_key == "other", lazy=True).lazy is True
+
+    managed_scan = engine.scan(User, parallel=4)
+    assert isinstance(managed_scan, ParallelScanIterator)
+    assert managed_scan.segments == 4
+
+
+@pytest.mark.parametrize("search", ["query", "scan"])
+def test_search_prefetch(engine, search):
+    """Engine.query and Engine.scan pass prefetch through to the iterator"""
+    kwargs = {"key": User.Meta.hash_key == "other"} if search == "query" else {}
+    assert getattr(engine, search)(User, **kwargs).prefetch == 0
+    assert getattr(engine, search)(User, prefetch=3, **kwargs).prefetch == 3
+
+
+@pytest.mark.parametrize("condition, kwargs, cls, index", [
+    (User.email == "foo@domain.com", {}, QueryIterator, User.by_email),
+    (User.id == "user_id", {}, QueryIterator, None),
+    # GSIs can't be read consistently
+    (User.email == "foo@domain.com", {"consistent": True}, ScanIterator, None),
+    (User.age > 3, {}, ScanIterator, None),
+    (None, {}, ScanIterator, None),
+])
+def test_find(engine, condition, kwargs, cls, index):
+    """Engine.find queries the table or an index when the condition has its hash key, and scans otherwise"""
+    iterator = engine.find(User, condition, **kwargs)
+    assert isinstance(iterator, cls)
+    assert iterator.index is index
+    assert iterator.plan.index is index
+
+
+def test_find_fetch(engine, session):
+    """An index without every column loads the full items from the table, then filters them locally"""
+    name = uuid.uuid4()
+    session.search_items.return_value = {
+        "Count": 3, "ScannedCount": 3,
+        "Items": [{"name": {"S": str(name)}, "date": {"S": date}} for date in ["c", "b", "a"]]}
+    session.load_items.return_value = {"CustomTableName": [
+        {"name": {"S": str(name)}, "date": {"S": "a"}, "not_projected": {"N": "3"}},
+        {"name": {"S": str(name)}, "date": {"S": "c"}, "not_projected": {"N": "3"}},
+        # Doesn't match the filter
+        {"name": {"S": str(name)}, "date": {"S": "b"}, "not_projected": {"N": "4"}}]}
+    condition = (ComplexModel.name == name) & (ComplexModel.joined > "x") & (ComplexModel.not_projected == 3)
+
+    iterator = engine.find(ComplexModel, condition)
+    assert isinstance(iterator, FetchIterator)
+    assert iterator.index is ComplexModel.by_joined
+    assert [obj.date for obj in iterator] == ["c", "a"]
+    assert iterator.count == 2
+    assert iterator.scanned == 3
+
+    request = session.search_items.call_args[0][1]
+    assert request["IndexName"] == "by_joined"
+    assert "FilterExpression" not in request
+    session.load_items.assert_called_once_with({"CustomTableName": {
+        "Keys": [{"name": {"S": str(name)}, "date": {"S": date}} for date in ["c", "b", "a"]],
+        "ConsistentRead": False}})
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_query_fetch(engine, session, prefetch):
+    """fetch queries the index for keys and loads each page of full items in the index's order"""
+    name = uuid.uuid4()
+
+    def key(date):
+        return {"name": {"S": str(name)}, "date": {"S": date}}
+    pages = [["b", "a"], ["c"]]
+
+    def search_items(mode, request):
+        index = request.get("ExclusiveStartKey") or 0
+        items = [key(date) for date in pages[index]]
+        return {
+            "Count": len(items), "ScannedCount": len(items), "Items": items,
+            "LastEvaluatedKey": index + 1 if index + 1 < len(pages) else None}
+
+    def load_items(request):
+        # "b" was deleted after the index was read
+        return {"CustomTableName": [
+            {**each, "not_projected": {"N": "1"}}
+            for each in reversed(request["CustomTableName"]["Keys"]) if each["date"]["S"] != "b"]}
+    session.search_items.side_effect = search_items
+    session.load_items.side_effect = load_items
+
+    query = engine.query(
+        ComplexModel.by_joined, key=ComplexModel.name == name, projection=["date", "not_projected"],
+        fetch=True, prefetch=prefetch)
+    assert isinstance(query, FetchIterator)
+    assert [(obj.date, obj.not_projected) for obj in query] == [("a", 1), ("c", 1)]
+    assert query.count == 2
+    assert query.scanned == 3
+    assert session.load_items.call_count == 2
+
+    request = session.search_items.call_args[0][1]
+    assert {request["ExpressionAttributeNames"][ref] for ref in request["ProjectionExpression"].split(", ")} == {
+        "name", "date"}
+
 
 def test_stream(engine, session):
     class StreamModel(BaseModel):
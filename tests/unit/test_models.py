@@ -1,10 +1,11 @@
 import datetime
 import logging
 import operator
+from unittest.mock import Mock
 
 import pytest
 
-from bloop.conditions import ConditionRenderer
+from bloop.conditions import ConditionRenderer, get_marked
 from bloop.exceptions import InvalidModel, InvalidStream
 from bloop.models import (
     BaseModel,
@@ -15,9 +16,13 @@ from bloop.models import (
     LocalSecondaryIndex,
     bind_column,
     bind_index,
+    can_bulk_load,
+    loader_for,
     model_created,
     object_modified,
+    resolve_typedef,
     unbind,
+    unpack_dict_from_dynamodb,
     unpack_from_dynamodb,
 )
 from bloop.types import (
@@ -29,6 +34,7 @@ from bloop.types import (
     Timestamp,
     Type,
 )
+from bloop.util import LazyValue
 
 from ..helpers.models import User, VectorModel
 
@@ -475,6 +481,43 @@ def test_ttl_by_name():
     assert Model.Meta.ttl["column"] is my_column
 
 
+def test_version_by_name_or_column():
+    """Meta.version late binds to the column with the same name"""
+    my_column = Column(Integer)
+
+    class ByColumn(BaseModel):
+        class Meta:
+            version = my_column
+        id = Column(Integer, hash_key=True)
+        version = my_column
+    assert ByColumn.Meta.version is my_column
+
+    class ByName(BaseModel):
+        class Meta:
+            version = "version"
+        id = Column(Integer, hash_key=True)
+        version = Column(Integer, dynamo_name="v")
+    assert ByName.Meta.version is ByName.version
+    assert User.Meta.version is None
+
+
+@pytest.mark.parametrize("version, message", [
+    (3, "Version must be None, a column name, or a column instance."),
+    ("missing", "Version column 'missing' is not a column of Model."),
+    ("data", "Version column must be a number with backing_type 'N' but was 'S' instead."),
+    ("id", "Version column can't be a hash or range key."),
+])
+def test_invalid_version(version, message):
+    with pytest.raises(InvalidModel) as excinfo:
+        class Model(BaseModel):
+            class Meta:
+                pass
+            Meta.version = version
+            id = Column(Integer, hash_key=True)
+            data = Column(String)
+    assert str(excinfo.value) == message
+
+
 @pytest.mark.parametrize("invalid_encryption", [False, True, {}, User.age])
 def test_invalid_encryption(invalid_encryption):
     with pytest.raises(InvalidModel):
@@ -1608,6 +1651,49 @@ def test_unbind_bad_call():
         unbind(model.Meta)
 
 
+def test_bind_unbind_rebuilds_plans(engine):
+    """Binding or unbinding a column rebuilds the model's load and dump functions"""
+    model = new_abstract_model()
+    obj = model(data="d")
+    loader = model.Meta._loader
+    assert engine._dump(model, obj) == {"dynamo-data": {"S": "d"}}
+
+    bind_column(model, "other", Column(Integer, dynamo_name="o"))
+    obj.other = 3
+    assert model.Meta._loader is not loader
+    assert engine._dump(model, obj) == {"dynamo-data": {"S": "d"}, "o": {"N": "3"}}
+    loaded = engine._load(model, {"dynamo-data": {"S": "d"}, "o": {"N": "3"}})
+    assert (loaded.data, loaded.other) == ("d", 3)
+
+    unbind(model.Meta, name="data")
+    assert engine._dump(model, obj) == {"o": {"N": "3"}}
+    assert not hasattr(engine._load(model, {"dynamo-data": {"S": "d"}}), "data")
+
+
+def test_loader_for_projection():
+    """Projections share a cached load function until the model's columns change"""
+    model = new_abstract_model(indexes=True)
+    obj = model()
+    assert loader_for(obj, model.Meta.columns) is model.Meta._loader
+
+    keys = {model.my_index_hash, model.email}
+    loader = loader_for(obj, keys)
+    assert loader is loader_for(obj, set(keys))
+    assert loader_for(obj, {model.data}) is not loader
+
+    bind_column(model, "other", Column(Integer))
+    assert loader_for(obj, keys) is not loader
+
+
+def test_resolve_typedef_unknown():
+    """Typedefs without _load or _dump still go through the engine, which raises UnknownType"""
+    engine = Mock()
+    load = resolve_typedef(object, "_load")
+    load({"S": "foo"}, context={"engine": engine}, extra=True)
+    engine._load.assert_called_once_with(object, {"S": "foo"}, context={"engine": engine}, extra=True)
+    assert resolve_typedef(String, "_dump") == String._dump
+
+
 # END BINDING ============================================================================================= END BINDING
 
 
@@ -1643,3 +1729,79 @@ def test_unpack_obj(unpack_kwargs):
     result = unpack_from_dynamodb(**unpack_kwargs)
     assert result.name == "numberoverzero"
     assert result.joined is None
+
+
+def test_unpack_bulk(unpack_kwargs):
+    """without other object_modified receivers, columns are marked without sending the signal"""
+    assert can_bulk_load(User(), unpack_kwargs["expected"])
+    result = unpack_from_dynamodb(**unpack_kwargs)
+    assert result.name == "numberoverzero"
+    assert result.joined is None
+    assert get_marked(result) == {User.name, User.joined}
+
+
+def test_unpack_bulk_other_receiver(unpack_kwargs):
+    """object_modified is sent for each column when anything else is listening"""
+    modified = []
+    with object_modified.connected_to(lambda *_, column, **__: modified.append(column)):
+        assert not can_bulk_load(User(), unpack_kwargs["expected"])
+        result = unpack_from_dynamodb(**unpack_kwargs)
+    assert set(modified) == {User.name, User.joined}
+    assert get_marked(result) == {User.name, User.joined}
+
+
+def test_unpack_bulk_custom_set():
+    """Columns that override __set__ are always set through the descriptor"""
+    calls = []
+
+    class RecordingColumn(Column):
+        def __set__(self, obj, value):
+            calls.append(value)
+            super().__set__(obj, value)
+
+    class Model(BaseModel):
+        id = RecordingColumn(String, hash_key=True)
+
+    assert not can_bulk_load(Model(), Model.Meta.columns)
+    unpack_from_dynamodb(attrs={"id": {"S": "foo"}}, expected=Model.Meta.columns, model=Model, engine=Mock(
+        _load=lambda typedef, value, **_: value["S"]))
+    assert calls == ["foo"]
+
+
+def test_unpack_lazy(unpack_kwargs):
+    """lazy values are loaded on first read, and missing values are loaded immediately"""
+    unpack_kwargs["attrs"] = {"j": {"S": "2016-08-09T01:16:25.322849+00:00"}}
+    unpack_kwargs["lazy"] = True
+    result = unpack_from_dynamodb(**unpack_kwargs)
+
+    assert isinstance(result.__dict__["joined"], LazyValue)
+    assert result.__dict__["joined"].value == {"S": "2016-08-09T01:16:25.322849+00:00"}
+    assert not isinstance(result.__dict__["name"], LazyValue)
+
+    expected = datetime.datetime(2016, 8, 9, 1, 16, 25, 322849, tzinfo=datetime.timezone.utc)
+    assert result.joined == expected
+    assert result.__dict__["joined"] == expected
+    assert get_marked(result) == {User.name, User.joined}
+
+
+def test_unpack_dict(unpack_kwargs):
+    """missing columns are left out, and no object is created or modified"""
+    del unpack_kwargs["model"]
+    unpack_kwargs["attrs"]["j"] = {"S": "2016-08-09T01:16:25.322849+00:00"}
+    with object_modified.connected_to(lambda *_, **__: pytest.fail("no object should be modified")):
+        result = unpack_dict_from_dynamodb(**unpack_kwargs)
+    assert result == {
+        "name": "numberoverzero",
+        "joined": datetime.datetime(2016, 8, 9, 1, 16, 25, 322849, tzinfo=datetime.timezone.utc)
+    }
+
+    del unpack_kwargs["attrs"]["j"]
+    assert unpack_dict_from_dynamodb(**unpack_kwargs) == {"name": "numberoverzero"}
+
+
+def test_unpack_dict_no_engine(unpack_kwargs):
+    del unpack_kwargs["model"]
+    del unpack_kwargs["engine"]
+    del unpack_kwargs["context"]["engine"]
+    with pytest.raises(ValueError):
+        unpack_dict_from_dynamodb(**unpack_kwargs)
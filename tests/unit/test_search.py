@@ -1,9 +1,13 @@
 import collections
 import functools
+import gc
+import threading
+import time
 
 import pytest
 
 from bloop.conditions import (
+    MAX_EXPRESSION_LENGTH,
     AndCondition,
     BeginsWithCondition,
     BetweenCondition,
@@ -14,6 +18,7 @@ from bloop.conditions import (
     NotCondition,
     OrCondition,
     comparison_aliases,
+    normalize,
 )
 from bloop.exceptions import ConstraintViolation, InvalidSearch
 from bloop.models import (
@@ -23,18 +28,28 @@ from bloop.models import (
     LocalSecondaryIndex,
 )
 from bloop.search import (
+    MAX_SEGMENTS,
+    FetchIterator,
+    MultiSearchIterator,
+    Page,
+    ParallelScanIterator,
     PreparedSearch,
     QueryIterator,
     ScanIterator,
     Search,
     SearchIterator,
     SearchModelIterator,
+    auto_segments,
+    halve,
+    plan_search,
     printable_query,
     search_repr,
+    split_filter,
     validate_filter_condition,
     validate_key_condition,
     validate_search_projection,
 )
+from bloop.signals import object_loaded
 from bloop.types import Integer
 from bloop.util import Sentinel
 
@@ -564,9 +579,49 @@ def test_prepare_invalid_filter(valid_search):
 def test_prepare_constraints(valid_search):
     valid_search.forward = False
     valid_search.parallel = (1, 5)
+    valid_search.prefetch = 2
     prepared = valid_search.prepare()
     assert prepared.forward is False
     assert prepared.parallel == (1, 5)
+    assert prepared.prefetch == 2
+    assert iter(prepared).prefetch == 2
+
+
+@pytest.mark.parametrize("parallel, segments", [(3, 3), ("auto", auto_segments())])
+def test_prepare_managed_parallel(valid_search, parallel, segments):
+    valid_search.mode = "scan"
+    valid_search.parallel = parallel
+    prepared = valid_search.prepare()
+    assert prepared.segments == segments
+    assert "Segment" not in prepared._request
+    assert "TotalSegments" not in prepared._request
+
+    iterator = iter(prepared)
+    assert isinstance(iterator, ParallelScanIterator)
+    assert iterator.segments == segments
+
+
+def test_prepare_managed_parallel_query(valid_search):
+    """parallel only applies to scans"""
+    valid_search.parallel = 3
+    prepared = valid_search.prepare()
+    assert prepared.segments is None
+    assert isinstance(iter(prepared), QueryIterator)
+
+
+@pytest.mark.parametrize("parallel", [-1, MAX_SEGMENTS + 1, True, "all", 1.5])
+def test_prepare_invalid_parallel(valid_search, parallel):
+    valid_search.mode = "scan"
+    valid_search.parallel = parallel
+    with pytest.raises(InvalidSearch):
+        valid_search.prepare()
+
+
+@pytest.mark.parametrize("prefetch", [-1, None, 1.5, True])
+def test_prepare_invalid_prefetch(valid_search, prefetch):
+    valid_search.prefetch = prefetch
+    with pytest.raises(InvalidSearch):
+        valid_search.prepare()
 
 
 @pytest.mark.parametrize("mode, cls", [("query", QueryIterator), ("scan", ScanIterator)])
@@ -593,6 +648,20 @@ def test_prepare_request_consistent(valid_search, index, consistent):
     assert ("ConsistentRead" in prepared._request) is consistent
 
 
+@pytest.mark.parametrize("mode", ["query", "scan"])
+def test_prepare_request_consumed_capacity(valid_search, session, mode):
+    """every search asks for its consumed capacity, which each page returns"""
+    valid_search.mode = mode
+    prepared = valid_search.prepare()
+    assert prepared._request["ReturnConsumedCapacity"] == "INDEXES"
+
+    capacity = {"TableName": "CustomTableName", "CapacityUnits": 0.5, "Table": {"CapacityUnits": 0.5}}
+    session.search_items.return_value = {"Count": 0, "ScannedCount": 0, "Items": [], "ConsumedCapacity": capacity}
+    pages = list(iter(prepared).iter_pages())
+    assert [page.consumed_capacity for page in pages] == [capacity]
+    assert session.search_items.call_args[0][1]["ReturnConsumedCapacity"] == "INDEXES"
+
+
 def test_prepare_request_count(valid_search):
     """count has Select=COUNT and no entry for ProjectionExpression"""
     valid_search.projection = "count"
@@ -620,13 +689,137 @@ def test_prepare_request_parallel(valid_search, mode, parallel):
     valid_search.parallel = parallel
     prepared = valid_search.prepare()
     if parallel and (mode == "scan"):
-        actual = prepared._request["Segments"], prepared._request["TotalSegments"]
+        actual = prepared._request["Segment"], prepared._request["TotalSegments"]
         assert actual == parallel
     else:
-        assert "Segments" not in prepared._request
+        assert "Segment" not in prepared._request
         assert "TotalSegments" not in prepared._request
 
 
+def test_prepare_fetch(valid_search):
+    """fetch projects any of the model's columns, and only requests the keys"""
+    valid_search.index = ComplexModel.by_joined
+    valid_search.projection = [ComplexModel.not_projected]
+    with pytest.raises(InvalidSearch):
+        valid_search.prepare()
+
+    valid_search.fetch = True
+    prepared = valid_search.prepare()
+    assert prepared._projected_columns == [ComplexModel.not_projected]
+    request = prepared._request
+    assert {request["ExpressionAttributeNames"][ref] for ref in request["ProjectionExpression"].split(", ")} == {
+        "name", "date"}
+    assert isinstance(iter(prepared), FetchIterator)
+
+    valid_search.projection = "count"
+    with pytest.raises(InvalidSearch):
+        valid_search.prepare()
+
+
+def long_filter(size=400):
+    return OrCondition(*(ComplexModel.email.begins_with("prefix-{}".format(i)) for i in range(size)))
+
+
+@pytest.mark.parametrize("projection", ["all", "count"])
+def test_prepare_request_split_filter(valid_search, projection):
+    """a filter that's too long is split into requests that each include the model's keys"""
+    valid_search.filter = long_filter()
+    valid_search.projection = projection
+    prepared = valid_search.prepare()
+
+    assert len(prepared._request["FilterExpression"]) > MAX_EXPRESSION_LENGTH
+    assert len(prepared._requests) > 1
+    for request in prepared._requests:
+        assert len(request["FilterExpression"]) <= MAX_EXPRESSION_LENGTH
+        assert request["Select"] == "SPECIFIC_ATTRIBUTES"
+        projected = {request["ExpressionAttributeNames"][ref] for ref in request["ProjectionExpression"].split(", ")}
+        assert {"name", "date"} <= projected
+    assert isinstance(iter(prepared), MultiSearchIterator)
+
+
+def test_prepare_request_short_filter(valid_search):
+    valid_search.filter = long_filter(size=10)
+    prepared = valid_search.prepare()
+    assert prepared._requests is None
+    assert isinstance(iter(prepared), QueryIterator)
+
+
+def test_prepare_request_split_parallel(valid_search):
+    """each filter is sent to every segment"""
+    valid_search.mode = "scan"
+    valid_search.parallel = 2
+    valid_search.filter = long_filter()
+    prepared = valid_search.prepare()
+    requests = iter(prepared).requests
+    assert len(requests) == 2 * len(prepared._requests)
+    assert {request["Segment"] for request in requests} == {0, 1}
+
+
+def test_halve():
+    a, b, c = ComplexModel.email == "a", ComplexModel.email == "b", ComplexModel.joined == "c"
+    assert halve(OrCondition(a, b, c)) == [OrCondition(a), OrCondition(b, c)]
+    assert halve(AndCondition(c, OrCondition(a, b))) == [
+        AndCondition(c, OrCondition(a)), AndCondition(c, OrCondition(b))]
+    assert halve(NotCondition(OrCondition(a, b))) is None
+    assert halve(AndCondition(a, c)) is None
+
+
+def test_split_filter_unsplittable():
+    condition = NotCondition(long_filter())
+
+    def render_filter(filter):
+        return {"FilterExpression": "x" * (MAX_EXPRESSION_LENGTH + 1)}
+    with pytest.raises(InvalidSearch):
+        split_filter(condition, render_filter)
+
+
+def test_plan_search_prefers_range_key(engine):
+    """An index that matches the range key beats the table, even when it has to fetch the full items"""
+    name = ComplexModel.name == "00000000-0000-0000-0000-000000000000"
+    plan = plan_search(engine, ComplexModel, name & (ComplexModel.joined > "x") & (ComplexModel.email == "foo"))
+    assert plan.index is ComplexModel.by_joined
+    assert plan.fetch
+    assert plan.filter == (ComplexModel.email == "foo")
+    assert plan.local is None
+    assert plan.explain() == "\n".join([
+        "Query ComplexModel.by_joined",
+        "  key: ((ComplexModel.name == '00000000-0000-0000-0000-000000000000') & (ComplexModel.joined > 'x'))",
+        "  filter: (ComplexModel.email == 'foo')",
+        "  fetch: full items from ComplexModel with BatchGetItem",
+    ])
+
+    # Without a range key term the table is queried, without fetching
+    plan = plan_search(engine, ComplexModel, name & (ComplexModel.joined.contains("x")))
+    assert plan.index is None
+    assert plan.key == name
+    assert not plan.fetch
+
+
+def test_plan_search_projection(engine):
+    """Only the projected columns need to be on the index"""
+    condition = ComplexModel.name == "00000000-0000-0000-0000-000000000000"
+    condition &= ComplexModel.joined > "x"
+    assert plan_search(engine, ComplexModel, condition, projection=["email", "joined"]).fetch is False
+    assert plan_search(engine, ComplexModel, condition, projection="all").fetch is True
+    with pytest.raises(InvalidSearch):
+        plan_search(engine, ComplexModel, condition, projection="count")
+
+
+@pytest.mark.parametrize("condition", [
+    # Not against a constant
+    ComplexModel.email == ComplexModel.joined,
+    ComplexModel.email == None,  # noqa: E711
+    # Not an AND term
+    (ComplexModel.email == "foo") | (ComplexModel.joined == "bar"),
+    ~(ComplexModel.email != "foo"),
+])
+def test_plan_search_scan(engine, condition):
+    plan = plan_search(engine, ComplexModel, condition)
+    assert plan.mode == "scan"
+    assert plan.filter == normalize(condition, engine)
+    assert plan.explain().startswith("Scan ComplexModel\n  filter: ")
+
+
 # END PREPARE TESTS ================================================================================= END PREPARE TESTS
 
 
@@ -848,4 +1041,376 @@ def test_all_resets(simple_iter, session, chain):
     assert session.search_items.call_count == len(chain)
 
 
+def paged_search(pages):
+    """side_effect for search_items that serves ``pages`` by ExclusiveStartKey, so fetches can run in any thread.
+
+    Each page's LastEvaluatedKey is the index of the next page, or None for the last page.
+    """
+    def search_items(mode, request):
+        index = request.get("ExclusiveStartKey") or 0
+        items = pages[index]
+        return {
+            "Count": len(items),
+            "ScannedCount": len(items) * 3,
+            "Items": list(items),
+            "LastEvaluatedKey": index + 1 if index + 1 < len(pages) else None
+        }
+    return search_items
+
+
+@pytest.mark.parametrize("prefetch", [1, 2, 5])
+@pytest.mark.parametrize("pages", [[[]], [["a"]], [["a"], [], ["b", "c"]], [[], [], ["a"], []]])
+def test_prefetch_results(simple_iter, session, prefetch, pages):
+    """prefetching returns the same results in the same order, following each page's LastEvaluatedKey"""
+    iterator = simple_iter()
+    iterator.prefetch = prefetch
+    session.search_items.side_effect = paged_search(pages)
+
+    assert list(iterator) == [item for page in pages for item in page]
+    assert iterator.exhausted
+    assert iterator.count == sum(len(page) for page in pages)
+    assert iterator.scanned == 3 * iterator.count
+
+    start_keys = [c[0][1].get("ExclusiveStartKey") for c in session.search_items.call_args_list]
+    assert start_keys == [None] + list(range(1, len(pages)))
+
+
+def test_prefetch_requests_next_page(simple_iter, session):
+    """the next page is requested while the current page is consumed, but not counted until it's reached"""
+    iterator = simple_iter()
+    iterator.prefetch = 1
+    requested = threading.Event()
+    search_items = paged_search([["a", "b"], ["c"]])
+
+    def side_effect(mode, request):
+        if request.get("ExclusiveStartKey") == 1:
+            requested.set()
+        return search_items(mode, request)
+    session.search_items.side_effect = side_effect
+
+    assert next(iterator) == "a"
+    assert requested.wait(timeout=1)
+    assert iterator.count == 2
+    assert iterator.scanned == 6
+    assert not iterator.exhausted
+    assert list(iterator) == ["b", "c"]
+    assert iterator.count == 3
+    assert iterator.exhausted
+
+
+def test_prefetch_reset(simple_iter, session):
+    """reset discards prefetched pages and starts over from the first page"""
+    iterator = simple_iter()
+    iterator.prefetch = 2
+    session.search_items.side_effect = paged_search([["a"], ["b"], ["c"]])
+
+    assert next(iterator) == "a"
+    iterator.reset()
+    assert iterator.count == 0
+    assert iterator.all() == ["a", "b", "c"]
+    assert iterator.first() == "a"
+
+
+def test_prefetch_error(simple_iter, session):
+    """an error fetching a page is raised when that page is reached"""
+    iterator = simple_iter()
+    iterator.prefetch = 1
+    search_items = paged_search([["a"], ["b"]])
+
+    def side_effect(mode, request):
+        if request.get("ExclusiveStartKey") == 1:
+            raise RuntimeError("page failed")
+        return search_items(mode, request)
+    session.search_items.side_effect = side_effect
+
+    assert next(iterator) == "a"
+    with pytest.raises(RuntimeError):
+        next(iterator)
+    assert iterator.count == 1
+
+    # the next step retries the failed page
+    session.search_items.side_effect = search_items
+    assert list(iterator) == ["b"]
+
+
+@pytest.fixture
+def parallel_iter(engine):
+    def _parallel_iter(segments, prefetch=0):
+        return ParallelScanIterator(
+            engine=engine, model=User, index=None, request={"Select": "SPECIFIC_ATTRIBUTES"},
+            projected={User.id}, prefetch=prefetch, segments=segments)
+    return _parallel_iter
+
+
+def segmented_search(segments):
+    """side_effect for search_items that serves each segment's pages by Segment and ExclusiveStartKey"""
+    def search_items(mode, request):
+        pages = segments[request["Segment"]]
+        index = request.get("ExclusiveStartKey") or 0
+        items = [{"id": {"S": item}} for item in pages[index]]
+        return {
+            "Count": len(items),
+            "ScannedCount": len(items) * 3,
+            "Items": items,
+            "LastEvaluatedKey": index + 1 if index + 1 < len(pages) else None
+        }
+    return search_items
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_parallel_scan_results(parallel_iter, session, prefetch):
+    """every segment is scanned to the end, and count and scanned are totals across segments"""
+    segments = [[["a", "b"], ["c"]], [[]], [[], ["d"], []]]
+    session.search_items.side_effect = segmented_search(segments)
+    iterator = parallel_iter(len(segments), prefetch=prefetch)
+
+    assert sorted(user.id for user in iterator) == ["a", "b", "c", "d"]
+    assert iterator.exhausted
+    assert iterator.count == 4
+    assert iterator.scanned == 12
+
+    calls = {(c[0][1]["Segment"], c[0][1].get("ExclusiveStartKey")) for c in session.search_items.call_args_list}
+    assert calls == {(0, None), (0, 1), (1, None), (2, None), (2, 1), (2, 2)}
+    for c in session.search_items.call_args_list:
+        assert c[0][0] == "scan"
+        assert c[0][1]["TotalSegments"] == 3
+
+
+def test_parallel_scan_workers(engine, session):
+    """at most auto_segments() segments are scanned at once unless workers is given"""
+    def parallel_iter(segments, workers=None):
+        return ParallelScanIterator(
+            engine=engine, model=User, index=None, request={"Select": "SPECIFIC_ATTRIBUTES"},
+            projected={User.id}, segments=segments, workers=workers)
+    assert parallel_iter(2).workers == 2
+    assert parallel_iter(MAX_SEGMENTS).workers == auto_segments()
+    assert parallel_iter(MAX_SEGMENTS, workers=3).workers == 3
+
+    # segments that don't have a worker yet are scanned when a worker finishes its segment
+    segments = [[["a"], ["b"]], [["c"]], [[], ["d"]]]
+    session.search_items.side_effect = segmented_search(segments)
+    iterator = parallel_iter(len(segments), workers=1)
+    assert sorted(user.id for user in iterator) == ["a", "b", "c", "d"]
+    assert iterator.exhausted
+
+
+def test_parallel_scan_bounded_buffer(parallel_iter, session):
+    """a segment doesn't load another page until its previous page has been taken from the queue"""
+    search_items = segmented_search([[["a"], ["b"], ["c"]]])
+    loaded = []
+
+    def side_effect(mode, request):
+        loaded.append(request.get("ExclusiveStartKey"))
+        return search_items(mode, request)
+    session.search_items.side_effect = side_effect
+    iterator = parallel_iter(1)
+
+    assert next(iterator).id == "a"
+    deadline = time.monotonic() + 1
+    while len(loaded) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # page 1 is waiting in the queue, so page 2 can't be loaded yet
+    time.sleep(0.05)
+    assert loaded == [None, 1]
+    assert iterator.count == 1
+
+    assert [user.id for user in iterator] == ["b", "c"]
+    assert loaded == [None, 1, 2]
+
+
+def endless_segments(mode, request):
+    """side_effect for search_items where every segment always has another page"""
+    return {
+        "Count": 1, "ScannedCount": 1, "Items": [{"id": {"S": str(request["Segment"])}}],
+        "LastEvaluatedKey": {"id": {"S": "next"}}}
+
+
+def assert_stopped(threads):
+    """every thread exits within a second"""
+    for thread in threads:
+        thread.join(timeout=1)
+    assert not any(thread.is_alive() for thread in threads)
+
+
+@pytest.mark.parametrize("stop", ["first", "one", "close", "abandon"])
+def test_parallel_scan_stopped_early(parallel_iter, session, stop):
+    """every worker thread exits when a scan is stopped before its last page, or is no longer referenced"""
+    session.search_items.side_effect = endless_segments
+    before = set(threading.enumerate())
+    iterator = parallel_iter(4)
+    if stop == "first":
+        iterator.first()
+    elif stop == "one":
+        with pytest.raises(ConstraintViolation):
+            iterator.one()
+    else:
+        next(iterator)
+        if stop == "close":
+            iterator.close()
+            assert list(iterator) == []
+        else:
+            del iterator
+            gc.collect()
+    assert_stopped(set(threading.enumerate()) - before)
+
+
+def test_parallel_scan_reset(parallel_iter, session):
+    """reset stops the running segments and the next step scans from the start"""
+    session.search_items.side_effect = segmented_search([[["a"], ["b"]], [["c"]]])
+    iterator = parallel_iter(2)
+
+    next(iterator)
+    iterator.reset()
+    assert iterator.count == 0
+    assert sorted(user.id for user in iterator.all()) == ["a", "b", "c"]
+    assert iterator.count == 3
+
+
+@pytest.mark.parametrize("select, expected", [("SPECIFIC_ATTRIBUTES", ["a", "b", "c"]), ("COUNT", [])])
+def test_multi_search_unique(engine, session, select, expected):
+    """items matched by more than one filter are returned and counted once"""
+    pages = {"first": [{"id": {"S": "a"}}, {"id": {"S": "b"}}], "second": [{"id": {"S": "b"}}, {"id": {"S": "c"}}]}
+
+    def search_items(mode, request):
+        items = pages[request["FilterExpression"]]
+        return {"Count": len(items), "ScannedCount": 5, "Items": items}
+    session.search_items.side_effect = search_items
+    iterator = MultiSearchIterator(
+        engine=engine, mode="query", model=User, index=None, request={"Select": select},
+        requests=[{"FilterExpression": "first"}, {"FilterExpression": "second"}], projected={User.id})
+
+    assert sorted(user.id for user in iterator) == expected
+    assert iterator.count == 3
+    assert iterator.scanned == 10
+    assert {c[0][0] for c in session.search_items.call_args_list} == {"query"}
+
+
+@pytest.mark.parametrize("stop", ["first", "break"])
+def test_multi_search_stopped_early(engine, session, stop):
+    """a split search that's stopped before its last page doesn't leave worker threads running"""
+    def search_items(mode, request):
+        return {
+            "Count": 1, "ScannedCount": 1, "Items": [{"id": {"S": request["FilterExpression"]}}],
+            "LastEvaluatedKey": {"id": {"S": "next"}}}
+    session.search_items.side_effect = search_items
+    before = set(threading.enumerate())
+    iterator = MultiSearchIterator(
+        engine=engine, mode="scan", model=User, index=None, request={"Select": "SPECIFIC_ATTRIBUTES"},
+        requests=[{"FilterExpression": str(i)} for i in range(10)], projected={User.id})
+
+    if stop == "first":
+        assert iterator.first().id in {str(i) for i in range(10)}
+    else:
+        for _ in iterator:
+            break
+        del iterator
+        gc.collect()
+    assert_stopped(set(threading.enumerate()) - before)
+
+
+def test_parallel_scan_error(parallel_iter, session):
+    """an error in any segment is raised from the iterator and stops the scan"""
+    def side_effect(mode, request):
+        raise RuntimeError("segment failed")
+    session.search_items.side_effect = side_effect
+    iterator = parallel_iter(2)
+
+    with pytest.raises(RuntimeError):
+        next(iterator)
+    assert iterator.exhausted
+
+
+def test_iter_pages(simple_iter, session):
+    """each page is returned with its key and consumed capacity, including empty pages"""
+    iterator = simple_iter()
+    responses = build_responses([2, 0, 1], items=["a", "b", "c"])
+    responses[0]["ConsumedCapacity"] = {"TableName": "User", "CapacityUnits": 0.5}
+    session.search_items.side_effect = responses
+
+    pages = iterator.iter_pages()
+    assert next(pages) == Page(["a", "b"], proceed, {"TableName": "User", "CapacityUnits": 0.5})
+    assert iterator.count == 2
+    assert list(pages) == [Page([], proceed, None), Page(["c"], None, None)]
+    assert iterator.count == 3
+    assert iterator.scanned == 9
+    assert iterator.exhausted
+
+
+def test_iter_pages_buffered(simple_iter, session):
+    """results already in the buffer are returned as the first page"""
+    iterator = simple_iter()
+    session.search_items.side_effect = build_responses([2, 1], items=["a", "b", "c"])
+
+    assert next(iterator) == "a"
+    assert list(iterator.iter_pages()) == [Page(["b"], proceed, None), Page(["c"], None, None)]
+    assert session.search_items.call_count == 2
+
+
+@pytest.mark.parametrize("raw", [False, True])
+def test_model_iter_pages(simple_iter, session, raw):
+    """model iterators unpack each page and send object_loaded unless raw is True"""
+    iterator = simple_iter(cls=ScanIterator)
+    iterator.projected = {User.name}
+    attrs = {"name": {"S": "numberoverzero"}}
+    session.search_items.return_value = response(terminate=True, count=2, item=attrs)
+
+    loaded = []
+    with object_loaded.connected_to(lambda *_, obj, **__: loaded.append(obj)):
+        pages = list(iterator.iter_pages(raw=raw))
+
+    assert len(pages) == 1
+    if raw:
+        assert pages[0].items == [attrs, attrs]
+        assert not loaded
+    else:
+        assert [obj.name for obj in pages[0].items] == ["numberoverzero"] * 2
+        assert loaded == pages[0].items
+
+
+@pytest.mark.parametrize("cls", [ScanIterator, QueryIterator])
+def test_model_iterator_as_dict(simple_iter, session, cls):
+    """as_dict returns loaded values by column name without creating objects or sending object_loaded"""
+    iterator = simple_iter(cls=cls)
+    iterator.projected = {User.name, User.joined}
+    iterator.as_dict = True
+    attrs = {"name": {"S": "numberoverzero"}}
+    session.search_items.return_value = response(terminate=True, count=2, item=attrs)
+
+    with object_loaded.connected_to(lambda *_, **__: pytest.fail("object_loaded should not be sent")):
+        assert iterator.all() == [{"name": "numberoverzero"}] * 2
+        assert list(iterator.iter_pages(raw=True)) == []
+        iterator.reset()
+        assert list(iterator.iter_pages()) == [Page([{"name": "numberoverzero"}] * 2, None, None)]
+
+
+def test_model_iterator_lazy(simple_iter, session):
+    iterator = simple_iter(cls=ScanIterator)
+    iterator.projected = {User.name}
+    iterator.lazy = True
+    session.search_items.return_value = response(terminate=True, count=1, item={"name": {"S": "numberoverzero"}})
+
+    obj = iterator.first()
+    assert obj.__dict__["name"].value == {"S": "numberoverzero"}
+    assert obj.name == "numberoverzero"
+
+
+def test_prepare_as_dict(valid_search):
+    valid_search.as_dict = True
+    assert iter(valid_search.prepare()).as_dict is True
+    valid_search.mode = "scan"
+    valid_search.parallel = 2
+    assert iter(valid_search.prepare()).as_dict is True
+
+
+def test_parallel_iter_pages(parallel_iter, session):
+    """pages from every segment are returned as they arrive"""
+    session.search_items.side_effect = segmented_search([[["a"], ["b"]], [["c"]]])
+    iterator = parallel_iter(2)
+
+    pages = list(iterator.iter_pages())
+    assert sorted(user.id for page in pages for user in page.items) == ["a", "b", "c"]
+    assert len(pages) == 3
+    assert iterator.exhausted
+
+
 # END ITERATOR TESTS =============================================================================== END ITERATOR TESTS
@@ -22,7 +22,14 @@ from bloop.models import (
 )
 from bloop.session import (
     BATCH_GET_ITEM_CHUNK_SIZE,
+    BATCH_WRITE_ITEM_CHUNK_SIZE,
+    RETRYABLE_ERROR_CODES,
+    SERVER_ERROR_CODES,
+    ExponentialBackoff,
+    RateLimiter,
+    RetryPolicy,
     SessionWrapper,
+    TokenBucket,
     compare_tables,
     create_table_request,
     ready,
@@ -232,6 +239,74 @@ def test_delete_item_condition_failed(session, dynamodb):
 # END DELETE ITEM ==================================================================================== END DELETE ITEM
 
 
+# WRITE ITEMS ============================================================================================ WRITE ITEMS
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr("bloop.session.time.sleep", calls.append)
+    return calls
+
+
+def test_batch_write_raises(session, dynamodb):
+    cause = dynamodb.batch_write_item.side_effect = client_error("FooError")
+    request = {"User": [{"DeleteRequest": {"Key": {"id": {"S": "user_id"}}}}]}
+    with pytest.raises(BloopException) as excinfo:
+        session.write_items(request)
+    assert excinfo.value.__cause__ is cause
+
+
+def test_batch_write_paginated(session, dynamodb, sleeps):
+    """Paginate requests across tables to fit within the max batch size"""
+    puts = [{"PutRequest": {"Item": {"id": {"S": str(i)}}}} for i in range(BATCH_WRITE_ITEM_CHUNK_SIZE)]
+    deletes = [{"DeleteRequest": {"Key": {"id": {"S": str(i)}}}} for i in range(3)]
+    dynamodb.batch_write_item.return_value = {"UnprocessedItems": {}}
+
+    session.write_items({"User": puts, "Simple": deletes})
+
+    assert dynamodb.batch_write_item.call_count == 2
+    first, second = [c[1]["RequestItems"] for c in dynamodb.batch_write_item.call_args_list]
+    assert first == {"User": puts}
+    assert second == {"Simple": deletes}
+    assert not sleeps
+
+
+def test_batch_write_unprocessed(dynamodb, dynamodbstreams, sleeps):
+    """Re-send unprocessed items with increasing delays"""
+    policy = RetryPolicy(backoff=ExponentialBackoff(jitter=False))
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    request = {"User": [{"DeleteRequest": {"Key": {"id": {"S": "user_id"}}}}]}
+    dynamodb.batch_write_item.side_effect = [
+        {"UnprocessedItems": request},
+        {"UnprocessedItems": request},
+        {"UnprocessedItems": {}}
+    ]
+
+    session.write_items(request)
+
+    assert dynamodb.batch_write_item.call_count == 3
+    for call in dynamodb.batch_write_item.call_args_list:
+        assert call[1]["RequestItems"] == request
+    assert sleeps == [0.05, 0.1]
+    assert policy.retries == {"batch_write_item": 2}
+
+
+def test_batch_write_unprocessed_exhausted(dynamodb, dynamodbstreams, sleeps):
+    policy = RetryPolicy(max_attempts=2)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    request = {"User": [{"DeleteRequest": {"Key": {"id": {"S": "user_id"}}}}]}
+    dynamodb.batch_write_item.return_value = {"UnprocessedItems": request}
+
+    with pytest.raises(BloopException):
+        session.write_items(request)
+    assert dynamodb.batch_write_item.call_count == 2
+    assert policy.exhausted == {"batch_write_item": 1}
+
+
+# END WRITE ITEMS ==================================================================================== END WRITE ITEMS
+
+
 # LOAD ITEMS ============================================================================================== LOAD ITEMS
 
 
@@ -406,9 +481,289 @@ def test_batch_get_unprocessed(session, dynamodb):
     assert response == expected_response
 
 
+def test_batch_get_concurrent(dynamodb, dynamodbstreams):
+    """Chunks are sent from a worker pool and merged into a single response"""
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, max_workers=4)
+    users = [User(id=str(i)) for i in range(2 * BATCH_GET_ITEM_CHUNK_SIZE + 1)]
+    client_request = {"User": {"Keys": [{"id": {"S": user.id}} for user in users], "ConsistentRead": False}}
+    unprocessed = set()
+
+    def handle(RequestItems):
+        keys = RequestItems["User"]["Keys"]
+        # The first time each chunk is seen, leave its last key unprocessed
+        last = keys[-1]["id"]["S"]
+        if len(keys) > 1 and last not in unprocessed:
+            unprocessed.add(last)
+            return {
+                "Responses": {"User": keys[:-1]},
+                "UnprocessedKeys": {"User": {"Keys": keys[-1:], "ConsistentRead": False}}}
+        return {"Responses": {"User": keys}, "UnprocessedKeys": {}}
+    dynamodb.batch_get_item.side_effect = handle
+
+    response = session.load_items(client_request)
+
+    # 3 chunks, and the two full chunks are retried once
+    assert dynamodb.batch_get_item.call_count == 5
+    assert ordered(response) == ordered({"User": [{"id": {"S": user.id}} for user in users]})
+
+
+def test_invalid_max_workers(dynamodb, dynamodbstreams):
+    with pytest.raises(ValueError):
+        SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, max_workers=0)
+
+
 # END LOAD ITEMS ====================================================================================== END LOAD ITEMS
 
 
+# RETRY POLICY ========================================================================================== RETRY POLICY
+
+
+@pytest.mark.parametrize("attempt, expected", [(0, 0.05), (1, 0.1), (3, 0.4), (10, 5.0)])
+def test_exponential_backoff(attempt, expected):
+    backoff = ExponentialBackoff(jitter=False)
+    assert backoff(attempt) == expected
+    jittered = ExponentialBackoff()
+    assert 0 <= jittered(attempt) <= expected
+
+
+def test_invalid_max_attempts():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_retry_throttled_call(dynamodb, dynamodbstreams, sleeps):
+    """Throttling errors are retried on every wrapped call"""
+    policy = RetryPolicy(backoff=lambda attempt: attempt, retry_on=RETRYABLE_ERROR_CODES)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    dynamodb.update_item.side_effect = [
+        client_error("ProvisionedThroughputExceededException"),
+        client_error("ThrottlingException"),
+        None
+    ]
+    dynamodbstreams.get_records.side_effect = [client_error("LimitExceededException"), {"Records": []}]
+
+    session.save_item({"foo": "bar"})
+    assert session.get_stream_records("iterator-id") == {"Records": []}
+
+    assert dynamodb.update_item.call_count == 3
+    assert sleeps == [0, 1, 0]
+    assert policy.retries == {"update_item": 2, "get_records": 1}
+
+
+def test_retry_errors_off_by_default(dynamodb, dynamodbstreams, sleeps):
+    """botocore retries errors within each call, so the default policy doesn't retry them again"""
+    policy = RetryPolicy()
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    dynamodb.query.side_effect = client_error("ProvisionedThroughputExceededException")
+
+    with pytest.raises(BloopException):
+        session.query_items({})
+    assert dynamodb.query.call_count == 1
+    assert not sleeps
+
+
+@pytest.mark.parametrize("code", sorted(SERVER_ERROR_CODES))
+def test_retry_server_error_not_idempotent(dynamodb, dynamodbstreams, sleeps, code):
+    """An update that may have been applied isn't sent again; other calls are"""
+    policy = RetryPolicy(retry_on=RETRYABLE_ERROR_CODES)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    dynamodb.update_item.side_effect = client_error(code)
+    dynamodb.delete_item.side_effect = [client_error(code), None]
+
+    with pytest.raises(BloopException):
+        session.save_item({"foo": "bar"})
+    session.delete_item({"foo": "bar"})
+
+    assert dynamodb.update_item.call_count == 1
+    assert dynamodb.delete_item.call_count == 2
+    assert policy.retries == {"delete_item": 1}
+    assert not policy.exhausted
+
+
+def test_retry_unknown_error_not_retried(dynamodb, dynamodbstreams, sleeps):
+    policy = RetryPolicy()
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    dynamodb.query.side_effect = client_error("ProvisionedThroughputExceededException")
+    policy.retry_on.clear()
+
+    with pytest.raises(BloopException):
+        session.query_items({})
+    dynamodb.query.assert_called_once_with()
+    assert not sleeps
+    assert not policy.exhausted
+
+
+def test_retry_max_attempts(dynamodb, dynamodbstreams, sleeps):
+    policy = RetryPolicy(max_attempts=3, retry_on=RETRYABLE_ERROR_CODES)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    cause = dynamodb.delete_item.side_effect = client_error("ProvisionedThroughputExceededException")
+
+    with pytest.raises(BloopException) as excinfo:
+        session.delete_item({"foo": "bar"})
+    assert excinfo.value.__cause__ is cause
+    assert dynamodb.delete_item.call_count == 3
+    assert policy.retries == {"delete_item": 2}
+    assert policy.exhausted == {"delete_item": 1}
+
+
+def test_retry_deadline(dynamodb, dynamodbstreams, sleeps):
+    """Don't retry when the delay would end after the deadline"""
+    policy = RetryPolicy(deadline=0.5, backoff=lambda attempt: 1.0, retry_on=RETRYABLE_ERROR_CODES)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, retry_policy=policy)
+    dynamodb.scan.side_effect = client_error("InternalServerError")
+
+    with pytest.raises(BloopException):
+        session.scan_items({})
+    assert dynamodb.scan.call_count == 1
+    assert policy.exhausted == {"scan": 1}
+
+
+# END RETRY POLICY ================================================================================== END RETRY POLICY
+
+
+# RATE LIMITER ========================================================================================== RATE LIMITER
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock that advances when the session sleeps"""
+    class Clock:
+        now = 100.0
+        sleeps = []
+
+        def sleep(self, seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+    clock = Clock()
+    monkeypatch.setattr("bloop.session.time.monotonic", lambda: clock.now)
+    monkeypatch.setattr("bloop.session.time.sleep", clock.sleep)
+    return clock
+
+
+def test_token_bucket_debt(clock):
+    bucket = TokenBucket(rate=10, capacity=10)
+    bucket.acquire()
+    assert not clock.sleeps
+
+    # 15 units puts the bucket 5 in debt, which takes 0.5 seconds to repay
+    bucket.consume(15)
+    assert bucket.delay() == 0.5
+    bucket.acquire()
+    assert clock.sleeps == [0.5]
+
+    # refills never exceed capacity
+    clock.now += 100
+    assert bucket.delay() == 0
+    bucket.consume(0)
+    assert bucket.tokens == 10
+
+
+@pytest.mark.parametrize("share", [0, -1, 1.5])
+def test_rate_limiter_invalid_share(share):
+    with pytest.raises(ValueError):
+        RateLimiter(share=share)
+
+
+def test_rate_limiter_configured_on_validate(model, dynamodb, dynamodbstreams):
+    model.Meta.stream = None
+    model.Meta.ttl = None
+    model.Meta.encryption = None
+    model.Meta.backups = None
+    limiter = RateLimiter(share=0.5)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, rate_limiter=limiter)
+    dynamodb.describe_table.return_value = {"Table": description_for(model, active=True)}
+    dynamodb.describe_time_to_live.return_value = {}
+    dynamodb.describe_continuous_backups.return_value = {}
+
+    session.validate_table("MyModel", model)
+
+    rates = {key: bucket.rate for key, bucket in limiter.buckets.items()}
+    assert rates == {
+        ("MyModel", None, "read"): 1.5,
+        ("MyModel", None, "write"): 3.5,
+        ("MyModel", "gsi_email_keys", "read"): 6.5,
+        ("MyModel", "gsi_email_keys", "write"): 8.5,
+        ("MyModel", "gsi_email_specific", "read"): 11.5,
+        ("MyModel", "gsi_email_specific", "write"): 13.5,
+        ("MyModel", "gsi_email_all", "read"): 11.5,
+        ("MyModel", "gsi_email_all", "write"): 13.5,
+    }
+
+
+def test_rate_limiter_unconfigured_table(model, dynamodb, dynamodbstreams):
+    """Calls to tables without buckets are sent unchanged"""
+    limiter = RateLimiter()
+    limiter.configure("MyModel", model)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, rate_limiter=limiter)
+    session.save_item({"TableName": "OtherTable"})
+    dynamodb.update_item.assert_called_once_with(TableName="OtherTable")
+
+
+def test_rate_limiter_blocks_writes(model, dynamodb, dynamodbstreams, clock):
+    limiter = RateLimiter(burst=1.0)
+    limiter.configure("MyModel", model)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, rate_limiter=limiter)
+    dynamodb.update_item.return_value = {"ConsumedCapacity": {
+        "TableName": "MyModel",
+        "CapacityUnits": 24.0,
+        "Table": {"CapacityUnits": 14.0},
+        "GlobalSecondaryIndexes": {"gsi_email_keys": {"CapacityUnits": 10.0}}}}
+
+    session.save_item({"TableName": "MyModel"})
+    dynamodb.update_item.assert_called_once_with(TableName="MyModel", ReturnConsumedCapacity="INDEXES")
+    assert not clock.sleeps
+
+    # table is 7 units in debt at 7 units/second; gsi_email_keys has 17 units
+    session.save_item({"TableName": "MyModel"})
+    assert clock.sleeps == [1.0]
+
+
+def test_rate_limiter_reads_use_index_bucket(model, dynamodb, dynamodbstreams, clock):
+    limiter = RateLimiter()
+    limiter.configure("MyModel", model)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, rate_limiter=limiter)
+    dynamodb.query.return_value = {"ConsumedCapacity": {
+        "TableName": "MyModel",
+        "CapacityUnits": 26.0,
+        "GlobalSecondaryIndexes": {"gsi_email_all": {"CapacityUnits": 26.0}}}}
+
+    request = {"TableName": "MyModel", "IndexName": "gsi_email_all"}
+    session.query_items(request)
+    # caller's request isn't modified
+    assert request == {"TableName": "MyModel", "IndexName": "gsi_email_all"}
+    # table bucket is untouched, index bucket is 3 units in debt at 23 units/second
+    assert limiter.buckets["MyModel", None, "read"].tokens == 3
+    # LSI reads wait on the table bucket
+    dynamodb.query.return_value = {"ConsumedCapacity": {
+        "TableName": "MyModel",
+        "CapacityUnits": 1.0,
+        "LocalSecondaryIndexes": {"lsi_email_all": {"CapacityUnits": 1.0}}}}
+    session.query_items({"TableName": "MyModel", "IndexName": "lsi_email_all"})
+    assert not clock.sleeps
+    assert limiter.buckets["MyModel", None, "read"].tokens == 2
+    session.query_items(request)
+    assert clock.sleeps == [3 / 23]
+
+
+def test_rate_limiter_batch_get(model, dynamodb, dynamodbstreams, clock):
+    limiter = RateLimiter()
+    limiter.configure("MyModel", model)
+    session = SessionWrapper(dynamodb=dynamodb, dynamodbstreams=dynamodbstreams, rate_limiter=limiter)
+    dynamodb.batch_get_item.return_value = {
+        "Responses": {"MyModel": []},
+        "UnprocessedKeys": {},
+        "ConsumedCapacity": [{
+            "TableName": "MyModel",
+            "CapacityUnits": 4.0,
+            "LocalSecondaryIndexes": {"lsi_email_all": {"CapacityUnits": 1.0}}}]}
+    session.load_items({"MyModel": {"Keys": [{"id": {"S": "foo"}}], "ConsistentRead": False}})
+    assert limiter.buckets["MyModel", None, "read"].tokens == -1
+
+
+# END RATE LIMITER ================================================================================== END RATE LIMITER
+
+
 # QUERY SCAN SEARCH ================================================================================ QUERY SCAN SEARCH
 
 